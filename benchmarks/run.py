@@ -0,0 +1,474 @@
+"""
+Benchmark suite of the linter hot paths, the git/IO paths and the CLI startup.
+
+Covers `lint_commit_message` on valid, invalid and pathological commit messages,
+in detailed and `skip_detail` modes, `lint_commit_messages` and `is_ignored` on a
+batch of commit messages, the linter regex patterns matched as strings and
+precompiled on the batch, `remove_comments` on verbose commit diffs,
+`get_commit_messages_of_hash_range` on a synthetic local repo, and the wall time
+of the CLI imports and of `commitlint --file` in a new interpreter.
+
+The results are written to a JSON file. With `--compare`, the results are
+compared with a previous results file and the exit status is 1 if a benchmark is
+slower than the threshold, so regressions of the hot paths are visible in CI.
+The per-message gain of the precompiled patterns is printed after the results.
+With `--importtime`, the `python -X importtime` breakdown of the CLI entry points
+is printed.
+
+Usage:
+    PYTHONPATH=src python benchmarks/run.py [--output results.json]
+        [--compare baseline.json] [--threshold 1.25] [--filter lint] [--commits N]
+        [--importtime]
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from commitlint.__version__ import __version__
+from commitlint.constants import IGNORE_COMMIT_PATTERNS
+from commitlint.git_helpers import get_commit_messages_of_hash_range
+from commitlint.linter import lint_commit_message, lint_commit_messages
+from commitlint.linter.utils import is_ignored, remove_comments
+from commitlint.linter.validators import PatternValidator, SimplePatternValidator
+
+# number of commits of the synthetic repo
+DEFAULT_COMMITS = 10_000
+# timing runs of each benchmark, the best and the median are reported
+REPEAT = 5
+# minimum duration of a timing run, the number of calls is calibrated to it
+MIN_RUN_TIME = 0.05
+# default slowdown ratio reported as a regression by `--compare`
+DEFAULT_THRESHOLD = 1.25
+
+VERBOSE_COMMIT_SEPARATOR = "# ------------------------ >8 ------------------------"
+
+COMMIT_MESSAGES = {
+    "valid": "feat(parser): add support for scopes",
+    "valid_body": (
+        "fix(api): handle empty responses\n\n"
+        "The API returns an empty body for 204 responses.\n\n"
+        "Refs: #123"
+    ),
+    "invalid": "Added some new feature.",
+    "invalid_multiple_errors": "feat(): Add new feature.",
+    "ignored": "Merge pull request #123 from owner/branch",
+    # pathological inputs
+    "long_header": "feat: " + "a" * 10_000,
+    "long_body": "feat: add new feature\n\n" + "body line\n" * 10_000,
+    "many_footers": "feat: add new feature\n\n"
+    + "".join(f"Refs: #{index}\n" for index in range(1000)),
+    "unclosed_scope": "feat(" + "scope " * 2000,
+    "whitespace": " " * 10_000,
+}
+
+IS_IGNORED_MESSAGES = {
+    "merge": "Merge branch 'main' into feature",
+    "bump": "Bump urllib3 from 1.26.5 to 1.26.17",
+    "not_ignored": "feat: add new feature",
+    "long": "Merge " + "a" * 10_000,
+}
+
+
+# commit messages of the batch benchmarks, a mix as found in a hash range
+BATCH_MESSAGES = [
+    "feat: add new feature",
+    "fix(parser): handle empty scope\n\nThis is the body of the commit.",
+    "invalid commit message",
+    "Merge pull request #123 from owner/branch",
+    "Bump urllib3 from 1.26.5 to 1.26.17",
+] * 200
+
+# patterns of the linter, matched as strings and precompiled on the batch
+REGEX_PATTERNS = {
+    "ignore": IGNORE_COMMIT_PATTERNS,
+    "simple_validator": SimplePatternValidator.COMMIT_PATTERN,
+    "detailed_validator": PatternValidator.COMMIT_PATTERN,
+}
+
+# other patterns used by the process in the cache pressure case, they fit in the
+# `re` module cache with the linter patterns, so the string lookups of the
+# pressure case still hit the cache instead of timing `re.compile`
+CACHE_PRESSURE_PATTERNS = [rf"^other pattern {index}$" for index in range(400)]
+
+# code run in a new interpreter by the startup benchmarks
+STARTUP_IMPORTS = {
+    "cli": "import commitlint.cli",
+    "cli_linter": "import commitlint.cli, commitlint.linter",
+    "cli_git_helpers": "import commitlint.cli, commitlint.git_helpers",
+}
+
+
+def _verbose_commit(diff_lines: int) -> str:
+    """Returns a commit message of `git commit --verbose`, with a diff."""
+    diff = "".join(f"+line {index} of the diff\n" for index in range(diff_lines))
+    return (
+        "feat: add new feature\n\n"
+        "Body of the commit message.\n"
+        "# Please enter the commit message for your changes.\n"
+        "# On branch main\n"
+        f"{VERBOSE_COMMIT_SEPARATOR}\n"
+        "# Do not modify or remove the line above.\n"
+        "diff --git a/file.py b/file.py\n"
+        f"{diff}"
+    )
+
+
+VERBOSE_COMMITS = {
+    "small_diff": _verbose_commit(10),
+    "large_diff": _verbose_commit(50_000),
+}
+
+
+class Benchmark(NamedTuple):
+    """
+    A benchmark case.
+
+    Attributes:
+        name (str): Unique name, e.g. "lint_commit_message/detailed/valid".
+        func (Callable[[], Any]): The benchmarked call.
+        number (Optional[int]): Calls per timing run, calibrated if None.
+        size (int): Items processed per call, the times are reported per item.
+    """
+
+    name: str
+    func: Callable[[], Any]
+    number: Optional[int] = None
+    size: int = 1
+
+
+def _git(repo_path: str, *args: str, stdin: Optional[bytes] = None) -> bytes:
+    return subprocess.run(
+        ["git", *args], cwd=repo_path, input=stdin, capture_output=True, check=True
+    ).stdout
+
+
+def create_synthetic_repo(repo_path: str, commits: int) -> str:
+    """
+    Creates a git repo with `commits` commits using `git fast-import`.
+
+    Returns:
+        str: The hash of the initial commit.
+    """
+    records = []
+    for index in range(commits):
+        if index % 10 == 9:
+            message = f"Invalid commit message {index}\n"
+        else:
+            message = f"feat(scope): add feature {index}\n\nBody of commit {index}.\n"
+        data = message.encode("utf-8")
+        records.append(
+            b"commit refs/heads/main\n"
+            b"committer Commitlint <commitlint@example.com> %d +0000\n"
+            b"data %d\n%s\n" % (1_700_000_000 + index, len(data), data)
+        )
+
+    _git(repo_path, "init", "--quiet")
+    _git(repo_path, "fast-import", "--quiet", stdin=b"".join(records))
+    return _git(repo_path, "rev-list", "--max-parents=0", "main").decode().strip()
+
+
+def _run_python(*args: str) -> None:
+    subprocess.run([sys.executable, *args], stdout=subprocess.DEVNULL, check=True)
+
+
+def _match_under_cache_pressure(match: Callable[[str], Any]) -> None:
+    """
+    Matches the batch, interleaved with the string lookups of other patterns, as in
+    a process using many patterns. The other lookups are the same in the string
+    and compiled cases, so the difference is the cost of the linter lookups.
+    """
+    for index, message in enumerate(BATCH_MESSAGES):
+        re.match(CACHE_PRESSURE_PATTERNS[index % len(CACHE_PRESSURE_PATTERNS)], message)
+        match(message)
+
+
+def iter_benchmarks(
+    repo_path: str, initial_hash: str, commit_message_file: str
+) -> Iterator[Benchmark]:
+    """Yields the benchmark cases."""
+    for mode, skip_detail in (("detailed", False), ("skip_detail", True)):
+        for label, message in COMMIT_MESSAGES.items():
+            yield Benchmark(
+                f"lint_commit_message/{mode}/{label}",
+                lambda message=message, skip_detail=skip_detail: lint_commit_message(
+                    message, skip_detail=skip_detail
+                ),
+            )
+
+    for mode, skip_detail in (("detailed", False), ("skip_detail", True)):
+        yield Benchmark(
+            f"lint_commit_messages/{mode}/batch",
+            lambda skip_detail=skip_detail: lint_commit_messages(
+                BATCH_MESSAGES, skip_detail=skip_detail
+            ),
+            size=len(BATCH_MESSAGES),
+        )
+
+    for label, message in IS_IGNORED_MESSAGES.items():
+        yield Benchmark(
+            f"is_ignored/{label}", lambda message=message: is_ignored(message)
+        )
+
+    yield Benchmark(
+        "is_ignored/batch",
+        lambda: [is_ignored(message) for message in BATCH_MESSAGES],
+        size=len(BATCH_MESSAGES),
+    )
+
+    # the string and compiled cases of a pattern are paired, see `print_regex_gains`
+    for label, pattern in REGEX_PATTERNS.items():
+        compiled = re.compile(pattern)
+        yield Benchmark(
+            f"regex/{label}/string",
+            lambda pattern=pattern: [
+                re.match(pattern, message) for message in BATCH_MESSAGES
+            ],
+            size=len(BATCH_MESSAGES),
+        )
+        yield Benchmark(
+            f"regex/{label}/compiled",
+            lambda compiled=compiled: [
+                compiled.match(message) for message in BATCH_MESSAGES
+            ],
+            size=len(BATCH_MESSAGES),
+        )
+        yield Benchmark(
+            f"regex/{label}/cache_pressure/string",
+            lambda pattern=pattern: _match_under_cache_pressure(
+                lambda message: re.match(pattern, message)
+            ),
+            size=len(BATCH_MESSAGES),
+        )
+        yield Benchmark(
+            f"regex/{label}/cache_pressure/compiled",
+            lambda compiled=compiled: _match_under_cache_pressure(compiled.match),
+            size=len(BATCH_MESSAGES),
+        )
+
+    for label, message in VERBOSE_COMMITS.items():
+        yield Benchmark(
+            f"remove_comments/{label}", lambda message=message: remove_comments(message)
+        )
+
+    def hash_range() -> List[str]:
+        cwd = os.getcwd()
+        os.chdir(repo_path)
+        try:
+            return get_commit_messages_of_hash_range(initial_hash, "main")
+        finally:
+            os.chdir(cwd)
+
+    yield Benchmark("get_commit_messages_of_hash_range", hash_range, number=1)
+
+    # a new interpreter per call, as the commit-msg hook runs the CLI
+    for label, code in STARTUP_IMPORTS.items():
+        yield Benchmark(
+            f"startup/import/{label}", lambda code=code: _run_python("-c", code)
+        )
+
+    yield Benchmark(
+        "startup/commitlint_file",
+        lambda: _run_python("-m", "commitlint.cli", "--file", commit_message_file),
+    )
+
+
+def importtime(code: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Runs `code` with `python -X importtime` in a new interpreter.
+
+    Returns:
+        List[Tuple[str, int, int, int]]: The module name, nesting level, self and
+            cumulative import times in microseconds, for each imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        # the name is indented by 2 spaces per nesting level, after 1 space
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), level, int(self_us), int(cumulative_us)))
+    return imports
+
+
+def print_import_times() -> None:
+    """Prints the import time of the CLI entry points and their heaviest imports."""
+    for label, code in STARTUP_IMPORTS.items():
+        # the first run writes the bytecode cache
+        importtime(code)
+        imports = importtime(code)
+        # the top level imports, with their dependencies
+        total_us = sum(
+            cumulative_us
+            for name, level, _, cumulative_us in imports
+            if level == 0 and name.startswith("commitlint")
+        )
+        heaviest = sorted(imports, key=lambda item: item[2], reverse=True)[:5]
+        print(f"{label:>16}: {total_us / 1000:6.1f} ms, {len(imports)} modules")
+        print(
+            " " * 18
+            + ", ".join(
+                f"{name} {self_us / 1000:.1f} ms" for name, _, self_us, _ in heaviest
+            )
+        )
+
+
+def run_benchmark(benchmark: Benchmark) -> Dict[str, Any]:
+    """
+    Times a benchmark case.
+
+    Returns:
+        Dict[str, Any]: The best, median and mean time per call, or per item of a
+            batch, in nanoseconds, the calls per run and the number of runs.
+    """
+    timer = timeit.Timer(benchmark.func)
+    number = benchmark.number
+    if number is None:
+        # grows the number of calls until a run takes at least MIN_RUN_TIME
+        number = 1
+        while True:
+            run_time = timer.timeit(number)
+            if run_time >= MIN_RUN_TIME:
+                break
+            number = max(number * 2, int(number * MIN_RUN_TIME / max(run_time, 1e-9)))
+
+    times = [
+        run_time / number / benchmark.size * 1e9
+        for run_time in timer.repeat(REPEAT, number)
+    ]
+    return {
+        "best_ns": min(times),
+        "median_ns": statistics.median(times),
+        "mean_ns": statistics.mean(times),
+        "number": number,
+        "repeat": REPEAT,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """
+    Prints the change of each benchmark compared to the baseline results.
+
+    Returns:
+        List[str]: The names of the benchmarks slower than the threshold ratio.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["best_ns"] / baseline[name]["best_ns"]
+        if ratio > threshold:
+            regressions.append(name)
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{name:<58} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def print_regex_gains(results: Dict[str, Dict[str, Any]]) -> None:
+    """Prints the per-message gain of each precompiled pattern over its string."""
+    for name, result in results.items():
+        if not (name.startswith("regex/") and name.endswith("/string")):
+            continue
+        compiled = results.get(name[: -len("string")] + "compiled")
+        if compiled is None:
+            continue
+        gain_ns = result["best_ns"] - compiled["best_ns"]
+        print(
+            f"{name[: -len('/string')]:<58} {gain_ns:9.0f} ns/message "
+            f"gain ({result['best_ns'] / compiled['best_ns']:.2f}x)"
+        )
+
+
+def _metadata(commits: int) -> Dict[str, Any]:
+    git_version = subprocess.run(
+        ["git", "--version"], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return {
+        "commitlint": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "git": git_version,
+        "commits": commits,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def main() -> None:
+    """Runs the benchmarks and writes the results to JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", help="Previous results file to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--filter", default="", help="Only run the matching names")
+    parser.add_argument("--commits", type=int, default=DEFAULT_COMMITS)
+    parser.add_argument(
+        "--importtime",
+        action="store_true",
+        help="Print the import time breakdown of the CLI entry points",
+    )
+    args = parser.parse_args()
+
+    if args.importtime:
+        print_import_times()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as repo_path:
+        initial_hash = create_synthetic_repo(repo_path, args.commits)
+        commit_message_file = os.path.join(repo_path, "COMMIT_EDITMSG")
+        with open(commit_message_file, "w", encoding="utf-8") as file:
+            file.write("feat: add new feature\n")
+
+        for benchmark in iter_benchmarks(repo_path, initial_hash, commit_message_file):
+            if args.filter not in benchmark.name:
+                continue
+            result = run_benchmark(benchmark)
+            results[benchmark.name] = result
+            print(
+                f"{benchmark.name:<58} {result['best_ns'] / 1000:12.2f} us "
+                f"(median {result['median_ns'] / 1000:.2f} us)"
+            )
+
+    print_regex_gains(results)
+
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(
+            {"metadata": _metadata(args.commits), "results": results},
+            output_file,
+            indent=2,
+        )
+        output_file.write("\n")
+    print(f"results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold}x")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
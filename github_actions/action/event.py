@@ -6,9 +6,15 @@ Note:
     set by GitHub Actions.
 """
 
+import functools
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional
+
+from .utils import iter_json_array
+
+# number of bytes read from the event payload file at once
+EVENT_READ_SIZE = 64 * 1024
 
 
 # pylint: disable=R0902; Too many instance attributes
@@ -32,7 +38,7 @@ class GitHubEvent:
         run_id (str): The unique identifier for the run.
 
         event_path (str): The path to the file containing the GitHub event payload.
-        payload (dict): The GitHub event payload.
+        payload (dict): The GitHub event payload, loaded on first access.
 
     Raises:
         EnvironmentError: If GitHub env are not set properly.
@@ -46,17 +52,51 @@ class GitHubEvent:
         ```
     """
 
+    # attributes of the event, in the order of `to_dict`
+    ATTRIBUTES = (
+        "event_name",
+        "sha",
+        "ref",
+        "workflow",
+        "action",
+        "actor",
+        "repository",
+        "job",
+        "run_attempt",
+        "run_number",
+        "run_id",
+        "event_path",
+        "payload",
+    )
+
+    __slots__ = (
+        "event_name",
+        "sha",
+        "ref",
+        "workflow",
+        "action",
+        "actor",
+        "repository",
+        "job",
+        "run_attempt",
+        "run_number",
+        "run_id",
+        "event_path",
+        "_payload",
+    )
+
     def __init__(self) -> None:
         """Initialize a new instance of the GitHubEvent class."""
+        self._payload: Optional[Dict[str, Any]] = None
         self.__load_details()
 
     def __load_details(self) -> None:
         """
-        Load GitHub event details from environment variables and event payload file.
+        Load GitHub event details from environment variables.
 
         This method initializes the instance attributes by reading values from
-        environment variables set by GitHub Actions and loading the event payload
-        from a file.
+        environment variables set by GitHub Actions. The event payload file is
+        only read when the payload is accessed.
         """
         try:
             self.event_name = os.environ["GITHUB_EVENT_NAME"]
@@ -72,11 +112,38 @@ class GitHubEvent:
             self.run_id = os.environ["GITHUB_RUN_ID"]
 
             self.event_path = os.environ["GITHUB_EVENT_PATH"]
-            with open(self.event_path, encoding="utf-8") as file:
-                self.payload: Dict[str, Any] = json.load(file)
         except KeyError as ex:
             raise EnvironmentError("GitHub env not found.") from ex
 
+    @property
+    def payload(self) -> Dict[str, Any]:
+        """Gets the GitHub event payload, parsed from the file on first access."""
+        if self._payload is None:
+            with open(self.event_path, encoding="utf-8") as file:
+                self._payload = json.load(file)
+        return self._payload
+
+    def iter_commit_messages(self) -> Iterator[str]:
+        """
+        Iterate over `payload["commits"][*]["message"]`, e.g. of a push event.
+
+        If the payload is not loaded yet, the payload file is read in chunks and the
+        commits are decoded one at a time, so neither the whole file nor the whole
+        payload is held in memory.
+
+        Yields:
+            str: The commit messages.
+        """
+        if self._payload is not None:
+            for commit_data in self._payload.get("commits") or []:
+                yield commit_data["message"]
+            return
+
+        with open(self.event_path, "rb") as file:
+            chunks = iter(functools.partial(file.read, EVENT_READ_SIZE), b"")
+            for commit_data in iter_json_array(chunks, key="commits"):
+                yield commit_data["message"]
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the GitHubEvent instance to a dictionary.
@@ -84,11 +151,7 @@ class GitHubEvent:
         Returns:
             dict: A dictionary containing the attributes of the GitHubEvent instance.
         """
-        return {
-            attr: getattr(self, attr)
-            for attr in dir(self)
-            if not callable(getattr(self, attr)) and not attr.startswith("__")
-        }
+        return {attr: getattr(self, attr) for attr in self.ATTRIBUTES}
 
     def __str__(self) -> str:
         """
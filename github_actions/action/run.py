@@ -3,16 +3,27 @@ This module runs the actions based on GitHub events, specifically for push,
 pull_request and pull_request_target events.
 """
 
+import math
 import os
-import subprocess
 import sys
-from typing import Iterable, List, Optional, Tuple, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+
+from commitlint.config import config
+from commitlint.exceptions import GitException
+from commitlint.git_helpers import iter_commits_between
+from commitlint.linter import lint_commit_message
+from commitlint.messages import VALIDATION_SUCCESSFUL
 
 from .event import GitHubEvent
 from .utils import (
+    GitHubAPIClient,
+    GitHubAPIResponse,
     get_boolean_input,
+    get_choice_input,
     get_input,
-    request_github_api,
+    get_last_page,
+    get_token_digest,
     write_line_to_file,
     write_output,
 )
@@ -26,13 +37,51 @@ EVENT_PULL_REQUEST_TARGET = "pull_request_target"
 INPUT_TOKEN = "token"
 INPUT_FAIL_ON_ERROR = "fail_on_error"
 INPUT_VERBOSE = "verbose"
+INPUT_SOURCE = "source"
+INPUT_CACHE_DIR = "cache_dir"
+
+# Sources of the PR commits
+SOURCE_AUTO = "auto"  # local git history, falls back to the GitHub API
+SOURCE_GIT = "git"
+SOURCE_API = "api"
+SOURCE_GRAPHQL = "graphql"
+SOURCES = (SOURCE_AUTO, SOURCE_GIT, SOURCE_API, SOURCE_GRAPHQL)
+
+# set by the action, "true" if the token input is the default `github.token`
+TOKEN_IS_DEFAULT_ENV = "COMMITLINT_TOKEN_IS_DEFAULT"
 
 # Status
 STATUS_SUCCESS = "success"
 STATUS_FAILURE = "failure"
 
 MAX_PR_COMMITS = 250
-PER_PAGE_COMMITS = 50
+# maximum page size allowed by the GitHub API
+PER_PAGE_COMMITS = 100
+# maximum number of pages of PR commits fetched concurrently
+MAX_CONCURRENT_REQUESTS = 5
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+# maximum page size allowed by the GitHub GraphQL API
+PER_QUERY_COMMITS = 100
+PR_COMMITS_QUERY = """
+query ($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      commits(first: $first, after: $after) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        nodes {
+          commit {
+            message
+          }
+        }
+      }
+    }
+  }
+}
+"""
 
 
 def get_push_commit_messages(event: GitHubEvent) -> Iterable[str]:
@@ -46,13 +95,48 @@ def get_push_commit_messages(event: GitHubEvent) -> Iterable[str]:
     Returns:
         List[str]: List of github commits.
     """
-    return (commit_data["message"] for commit_data in event.payload["commits"])
+    return event.iter_commit_messages()
+
+
+def get_pr_commit_messages_from_git(event: GitHubEvent) -> Optional[List[str]]:
+    """
+    Return PR commits from the local git history, i.e. `base.sha..head.sha`.
+
+    Args:
+        event (GitHubEvent): An instance of the GitHubEvent class representing
+            the GitHub event.
+
+    Returns:
+        Optional[List[str]]: List of github commits, None if the commits are not
+            available in the local git history (e.g. no or shallow checkout).
+    """
+    pull_request = event.payload["pull_request"]
+    base_sha: str = pull_request["base"]["sha"]
+    head_sha: str = pull_request["head"]["sha"]
+    total_commits: int = pull_request["commits"]
+
+    try:
+        commits = [
+            commit.message for commit in iter_commits_between(base_sha, head_sha)
+        ]
+    except (GitException, OSError):
+        return None
+
+    # a shallow history yields only part of the commits
+    if len(commits) != total_commits:
+        return None
+
+    return commits
 
 
 def get_pr_commit_messages(event: GitHubEvent) -> Iterable[str]:
     """
     Return PR commits.
 
+    The commits are read from the local git history or fetched using the GitHub
+    REST or GraphQL API, based on the `source` input. The APIs don't support PRs
+    with more than `MAX_PR_COMMITS` commits, so those need the local git history.
+
     Args:
         event (GitHubEvent): An instance of the GitHubEvent class representing
             the GitHub event.
@@ -60,38 +144,182 @@ def get_pr_commit_messages(event: GitHubEvent) -> Iterable[str]:
     Returns:
         List[str]: List of github commits.
     """
-    token = get_input(INPUT_TOKEN)
-    repo = event.repository
-    pr_number: int = event.payload["number"]
+    source = get_choice_input(INPUT_SOURCE, SOURCES)
     total_commits: int = event.payload["pull_request"]["commits"]
 
+    if source in (SOURCE_AUTO, SOURCE_GIT):
+        git_commits = get_pr_commit_messages_from_git(event)
+        if git_commits is not None:
+            return git_commits
+
+        if source == SOURCE_GIT:
+            sys.exit(
+                "::error:: The PR commits are not available in the local git "
+                "history.\n"
+                "Please checkout the repository with full history "
+                "(e.g. `fetch-depth: 0` in `actions/checkout`)."
+            )
+
     if total_commits > MAX_PR_COMMITS:
         sys.exit(
             "::error:: GitHub API doesn't support PRs with more than "
             f"{MAX_PR_COMMITS} commits.\n"
-            "Please refer to "
+            "Please checkout the repository with full history "
+            "(e.g. `fetch-depth: 0` in `actions/checkout`) to lint them from "
+            "git, or refer to "
             "https://docs.github.com/en/rest/pulls/pulls"
             "?apiVersion=2022-11-28#list-commits-on-a-pull-request"
         )
 
-    # pagination
-    total_page = 1 + total_commits // PER_PAGE_COMMITS
+    if source == SOURCE_GRAPHQL:
+        return get_pr_commit_messages_from_graphql(event)
+
+    return get_pr_commit_messages_from_api(event)
+
+
+def get_pr_commit_messages_from_graphql(event: GitHubEvent) -> List[str]:
+    """
+    Return PR commits using the GitHub GraphQL API.
+
+    A single query returns up to `PER_QUERY_COMMITS` commits, the next commits are
+    fetched using the cursor of the previous query.
+
+    Args:
+        event (GitHubEvent): An instance of the GitHubEvent class representing
+            the GitHub event.
+
+    Returns:
+        List[str]: List of github commits.
+    """
+    token = get_input(INPUT_TOKEN)
+    owner, name = event.repository.split("/", 1)
+    pr_number: int = event.payload["number"]
+
+    # e.g. https://api.github.com/graphql or https://HOST/api/graphql
+    graphql_url = os.environ.get("GITHUB_GRAPHQL_URL") or GITHUB_GRAPHQL_URL
+    base_url, endpoint = graphql_url.rsplit("/", 1)
 
     commits: List[str] = []
-    for page in range(1, total_page + 1):
-        status, data = request_github_api(
+    variables = {
+        "owner": owner,
+        "name": name,
+        "number": pr_number,
+        "first": PER_QUERY_COMMITS,
+        "after": None,
+    }
+    with GitHubAPIClient(token, base_url=base_url) as client:
+        while True:
+            status, data, _ = client.request(
+                method="POST",
+                url=f"/{endpoint}",
+                body={"query": PR_COMMITS_QUERY, "variables": variables},
+            )
+
+            # GraphQL errors are returned with the status 200
+            if status != 200 or not data or data.get("errors"):
+                sys.exit(
+                    f"::error::Github GraphQL API failed with status code {status}. "
+                    f"Response: {data}"
+                )
+
+            connection = data["data"]["repository"]["pullRequest"]["commits"]
+            commits.extend(node["commit"]["message"] for node in connection["nodes"])
+
+            page_info = connection["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return commits
+
+            variables["after"] = page_info["endCursor"]
+
+
+def _select_commit_message(commit_data: Dict[str, Any]) -> str:
+    """Select the commit message of a commit of the GitHub API."""
+    return commit_data["commit"]["message"]
+
+
+def get_cache_scope(event: GitHubEvent, token: str) -> str:
+    """
+    Return the scope of the token, used as the key of the GitHub API cache.
+
+    The default `github.token` is issued for every job, but its access is the
+    same for all the jobs of the repository, so it is keyed by the repository and
+    the cache is shared between the runs. A custom token is keyed by its digest.
+
+    Args:
+        event (GitHubEvent): An instance of the GitHubEvent class representing
+            the GitHub event.
+        token (str): The GitHub API token.
+
+    Returns:
+        str: The scope of the token.
+    """
+    if os.environ.get(TOKEN_IS_DEFAULT_ENV, "").lower() == "true":
+        token_scope = "default token"
+    else:
+        token_scope = get_token_digest(token)
+
+    return f"{event.repository}\n{token_scope}"
+
+
+def get_pr_commit_messages_from_api(event: GitHubEvent) -> List[str]:
+    """
+    Return PR commits using the GitHub API.
+
+    Args:
+        event (GitHubEvent): An instance of the GitHubEvent class representing
+            the GitHub event.
+
+    Returns:
+        List[str]: List of github commits.
+    """
+    token = get_input(INPUT_TOKEN)
+    cache_dir = get_input(INPUT_CACHE_DIR) or None
+    repo = event.repository
+    pr_number: int = event.payload["number"]
+    total_commits: int = event.payload["pull_request"]["commits"]
+
+    url = f"/repos/{repo}/pulls/{pr_number}/commits"
+
+    def fetch_page(page: int) -> GitHubAPIResponse:
+        response = client.request(
             method="GET",
-            url=f"/repos/{repo}/pulls/{pr_number}/commits",
-            token=token,
+            url=url,
             params={"per_page": PER_PAGE_COMMITS, "page": page},
+            select=_select_commit_message,
         )
-
-        if status != 200:
+        if response.status != 200:
             sys.exit(
-                f"::error::Github API failed with status code {status}. Response: {data}"
+                f"::error::Github API failed with status code {response.status}. "
+                f"Response: {response.data}"
             )
+        return response
+
+    commits: List[str] = []
+    with GitHubAPIClient(
+        token, cache_dir=cache_dir, cache_scope=get_cache_scope(event, token)
+    ) as client:
+        # the first page tells whether there are more pages
+        first_page = fetch_page(1)
+        commits.extend(first_page.data)
+
+        # a short page is the last page
+        if len(first_page.data) < PER_PAGE_COMMITS:
+            return commits
+
+        # the `Link` header has the last page, the commit count of the payload is
+        # used if the header is missing
+        total_page = get_last_page(first_page.headers.get("link")) or math.ceil(
+            total_commits / PER_PAGE_COMMITS
+        )
+        if total_page <= 1:
+            return commits
 
-        commits.extend(commit_data["commit"]["message"] for commit_data in data)
+        # the remaining pages are fetched concurrently using the pooled
+        # connections, `map` returns the pages in order
+        max_workers = min(MAX_CONCURRENT_REQUESTS, total_page - 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for response in executor.map(fetch_page, range(2, total_page + 1)):
+                commits.extend(response.data)
 
     return commits
 
@@ -100,6 +328,9 @@ def run_commitlint(commit_message: str) -> Tuple[bool, Optional[str]]:
     """
     Run the commitlint for the given commit message.
 
+    The commit message is linted in-process, the output matches the output of
+    `commitlint <commit_message> --hide-input`.
+
     Args:
         commit_message (str): A commit message to check with commitlint.
 
@@ -107,24 +338,16 @@ def run_commitlint(commit_message: str) -> Tuple[bool, Optional[str]]:
         Tuple[bool, Optional[str]]: A tuple with the success status as the first
             element and error message as the second element.
     """
+    config.verbose = get_boolean_input(INPUT_VERBOSE)
 
-    try:
-        commands = ["commitlint", commit_message, "--hide-input"]
-
-        verbose = get_boolean_input(INPUT_VERBOSE)
-        if verbose:
-            commands.append("--verbose")
-
-        output = subprocess.check_output(commands, text=True, stderr=subprocess.PIPE)
-        if output:
-            sys.stdout.write(f"{output}")
-
+    success, errors = lint_commit_message(commit_message.strip())
+    if success:
+        sys.stdout.write(f"{VALIDATION_SUCCESSFUL}\n")
         return True, None
-    except subprocess.CalledProcessError as error:
-        if error.stdout:
-            sys.stdout.write(f"{error.stdout}")
 
-        return False, str(error.stderr)
+    error = f"✖ Found {len(errors)} error(s).\n"
+    error += "".join(f"- {error_message}\n" for error_message in errors)
+    return False, error
 
 
 def check_commit_messages(commit_messages: Iterable[str]) -> None:
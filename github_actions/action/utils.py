@@ -1,10 +1,53 @@
 """Utility functions for GitHub Actions"""
 
+import codecs
+import hashlib
 import http.client
 import json
 import os
+import random
+import re
+import tempfile
+import threading
+import time
 import urllib.parse
-from typing import Any, Dict, Optional, Tuple, Union
+import zlib
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_TIMEOUT = 30.0
+# number of bytes read from a GitHub API response at once
+GITHUB_API_READ_SIZE = 64 * 1024
+
+# response headers that describe the raw body, not kept in the response cache
+UNCACHED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+CACHE_ENTRY_KEYS = {"etag", "data", "headers"}
+
+# retries of the idempotent requests on rate limit and server errors
+GITHUB_API_MAX_RETRIES = 3
+GITHUB_API_BACKOFF = 1.0  # base delay in seconds, doubled on every retry
+GITHUB_API_MAX_BACKOFF = 30.0
+# longest wait for a rate limit reset, the request fails instead of waiting longer
+GITHUB_API_MAX_RATE_LIMIT_WAIT = 60.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# a link of the `Link` header, e.g. `<https://api.github.com/...?page=2>; rel="next"`
+LINK_RE = re.compile(r'<(?P<url>[^>]*)>\s*;\s*rel="(?P<rel>[^"]*)"')
 
 
 def get_input(key: str) -> str:
@@ -56,6 +99,30 @@ def get_boolean_input(key: str) -> bool:
     )
 
 
+def get_choice_input(key: str, choices: Sequence[str]) -> str:
+    """
+    Read the GitHub action input that must be one of the given choices.
+
+    Args:
+        key (str): Input key.
+        choices (Sequence[str]): The allowed values of the input.
+
+    Returns:
+        str: The value of the input, in lowercase.
+
+    Raises:
+        ValueError: If the value of the input is not one of the choices.
+    """
+    val = get_input(key).strip().lower()
+    if val not in choices:
+        raise ValueError(
+            f"Invalid value `{val}` for input `{key}`. "
+            f"Support input list: `{' | '.join(choices)}`."
+        )
+
+    return val
+
+
 def write_line_to_file(filepath: str, line: str) -> None:
     """
     Write line to a specified filepath.
@@ -80,15 +147,622 @@ def write_output(name: str, value: Union[str, int]) -> None:
     write_line_to_file(output_filepath, f"{name}={value}")
 
 
+def get_last_page(link_header: Optional[str]) -> Optional[int]:
+    """
+    Get the last page number from the `Link` header of a paginated response.
+
+    Args:
+        link_header (Optional[str]): The value of the `Link` header.
+
+    Returns:
+        Optional[int]: The `page` of the `rel="last"` link, None if there is no
+            such link (e.g. on the last page).
+    """
+    if not link_header:
+        return None
+
+    for link in LINK_RE.finditer(link_header):
+        if "last" not in link["rel"].split():
+            continue
+
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(link["url"]).query)
+        page = query.get("page")
+        if page and page[0].isdigit():
+            return int(page[0])
+
+    return None
+
+
+def get_token_digest(token: str) -> str:
+    """
+    Get a digest identifying a token, used in place of the secret in cache keys.
+
+    Args:
+        token (str): The GitHub API token.
+
+    Returns:
+        str: The hex SHA-256 digest of the token, prefixed by "token".
+    """
+    return "token " + hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _get_rate_limit_wait(headers: Dict[str, str], now: float) -> Optional[float]:
+    """
+    Get the time to wait for a rate limit from the response headers.
+
+    Args:
+        headers (Dict[str, str]): The response headers, with lowercase names.
+        now (float): The current epoch time.
+
+    Returns:
+        Optional[float]: The `Retry-After` seconds, or the seconds until the
+            `X-RateLimit-Reset` time if there are no remaining requests, None if
+            the response isn't rate limited.
+    """
+    retry_after = headers.get("retry-after", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+
+    reset = headers.get("x-ratelimit-reset", "")
+    if headers.get("x-ratelimit-remaining") == "0" and reset.isdigit():
+        return max(0.0, int(reset) - now)
+
+    return None
+
+
+def _get_backoff_delay(attempt: int) -> float:
+    """Gets the retry delay of an attempt, exponential backoff with full jitter."""
+    backoff = min(GITHUB_API_MAX_BACKOFF, GITHUB_API_BACKOFF * 2**attempt)
+    return random.uniform(0, backoff)
+
+
+def _iter_body(
+    res: http.client.HTTPResponse, content_encoding: Optional[str]
+) -> Iterator[bytes]:
+    """Reads the response body in chunks, decompressing gzip bodies on the fly."""
+    decompressor = None
+    if content_encoding == "gzip":
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    while True:
+        chunk = res.read(GITHUB_API_READ_SIZE)
+        if not chunk:
+            break
+        yield decompressor.decompress(chunk) if decompressor else chunk
+
+    if decompressor:
+        yield decompressor.flush()
+
+
+def iter_json_array(
+    chunks: Iterable[bytes], key: Optional[str] = None
+) -> Iterator[Any]:
+    """
+    Incrementally parse the items of a UTF-8 JSON array from chunks of bytes.
+
+    Each item is yielded as soon as it is complete, so only one item and the
+    unparsed part of the last chunk are held in memory.
+
+    If `key` is given, the data is a JSON object and the items of its `key` array
+    are yielded. The values of the other keys are decoded one at a time and
+    discarded, and the rest of the object after the array is not parsed.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the JSON array, or object.
+        key (Optional[str]): The key of the array in the JSON object.
+
+    Yields:
+        Any: The decoded items of the array, nothing if the key is missing or its
+            value is not an array.
+
+    Raises:
+        ValueError: If the data is not a valid JSON array, or object.
+    """
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    # "start", then "items" for the array, or "name", "colon" and "value" for the
+    # members of the object
+    state = "start"
+    name = None
+    # an incomplete value is parsed again only once the buffer has doubled, so
+    # large values split across many chunks are not parsed quadratically
+    retry_size = 0
+
+    chunk_iter = iter(chunks)
+    finished = False
+    while not finished:
+        chunk = next(chunk_iter, None)
+        if chunk is None:
+            finished = True
+            buffer = buffer[pos:] + utf8_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[pos:] + utf8_decoder.decode(chunk)
+        pos = 0
+
+        if len(buffer) < retry_size and not finished:
+            continue
+        retry_size = 0
+
+        while True:
+            # skipping the whitespaces
+            while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                pos += 1
+            if pos == len(buffer):
+                break
+
+            char = buffer[pos]
+            if state == "start":
+                if key is None and char == "[":
+                    state = "items"
+                elif key is not None and char == "{":
+                    state = "name"
+                else:
+                    raise ValueError(
+                        f"Expected a JSON {'array' if key is None else 'object'}"
+                    )
+                pos += 1
+                continue
+
+            if state in ("items", "name") and char == ",":
+                pos += 1
+                continue
+
+            if (state, char) in (("items", "]"), ("name", "}")):
+                return
+
+            if state == "colon":
+                if char != ":":
+                    raise ValueError(f"Expected ':' after the key {name!r}")
+                state = "value"
+                pos += 1
+                continue
+
+            if state == "value" and name == key and char == "[":
+                state = "items"
+                pos += 1
+                continue
+
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if finished:
+                    raise
+                retry_size = 2 * (len(buffer) - pos)
+                break
+
+            if not finished and (
+                end == len(buffer) or buffer[end] not in ",:]} \t\n\r"
+            ):
+                # the value may continue in the next chunk, e.g. "-4" of "-4.5"
+                retry_size = len(buffer) - pos + 1
+                break
+
+            pos = end
+            if state == "items":
+                yield value
+            elif state == "name":
+                if not isinstance(value, str):
+                    raise ValueError("Expected a JSON object key")
+                name, state = value, "colon"
+            else:
+                # the value of another key, discarded
+                state = "name"
+
+    raise ValueError(f"Unterminated JSON {'array' if key is None else 'object'}")
+
+
+class GitHubAPIResponse(NamedTuple):
+    """
+    Response of a GitHub API request.
+
+    Attributes:
+        status (int): The HTTP status code.
+        data (Any): The decoded JSON data, None if the response has no body.
+        headers (Dict[str, str]): The response headers, with lowercase names.
+    """
+
+    status: int
+    data: Any
+    headers: Dict[str, str]
+
+
+class GitHubAPIClient:
+    """
+    Client for the GitHub API with a pool of keep-alive connections.
+
+    Connections are reused between requests, so paginated calls pay the TLS
+    handshake only once per connection. The client is thread-safe, each request
+    takes an idle connection from the pool or opens a new one.
+
+    If `cache_dir` is given, the GET responses having an `ETag` are stored on disk
+    and revalidated with `If-None-Match`. A `304 Not Modified` response, which
+    doesn't count against the rate limit, is served from the cache. The cache
+    entries are keyed by the `cache_scope` and the URL, one JSON file per entry,
+    so the directory can be persisted between runs with `actions/cache`.
+
+    Idempotent requests are retried on server errors and rate limits (429, and
+    403 with `Retry-After` or `X-RateLimit-Remaining: 0`), waiting for the
+    `Retry-After` or the `X-RateLimit-Reset` time, or else an exponential backoff
+    with full jitter. A rate limit blocks all the requests of the client until
+    it is lifted, so concurrent requests don't keep hitting it.
+
+    Example:
+        ```python
+        with GitHubAPIClient(token) as client:
+            response = client.request("GET", "/repos/owner/repo")
+        ```
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: Optional[str] = None,
+        timeout: float = GITHUB_API_TIMEOUT,
+        cache_dir: Optional[str] = None,
+        max_retries: int = GITHUB_API_MAX_RETRIES,
+        sleep: Optional[Callable[[float], None]] = None,
+        clock: Optional[Callable[[], float]] = None,
+        cache_scope: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a new GitHub API client.
+
+        Args:
+            token (str): The GitHub API token for authentication.
+            base_url (Optional[str]): The GitHub API URL, defaults to the
+                `GITHUB_API_URL` env set by GitHub Actions, or the public API.
+            timeout (float): Timeout in seconds of the connections.
+            cache_dir (Optional[str]): Directory of the response cache, the cache
+                is disabled if not given.
+            max_retries (int): Maximum number of retries of an idempotent request.
+            sleep (Optional[Callable[[float], None]]): Function used to wait before
+                the retries, defaults to `time.sleep`.
+            clock (Optional[Callable[[], float]]): Function returning the current
+                epoch time, defaults to `time.time`.
+            cache_scope (Optional[str]): Scope of the token access, part of the
+                cache key, so the responses are only shared between tokens having
+                the same access. Defaults to a digest of the token, which only
+                shares the cache between the runs using the same token.
+        """
+        base_url = base_url or os.environ.get("GITHUB_API_URL") or GITHUB_API_URL
+        parsed_url = urllib.parse.urlsplit(base_url)
+
+        self.token = token
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.cache_scope = cache_scope or get_token_digest(token)
+        self.max_retries = max_retries
+        self.sleep = sleep or time.sleep
+        self.clock = clock or time.time
+        self._https = parsed_url.scheme == "https"
+        self._host = parsed_url.netloc
+        self._path_prefix = parsed_url.path.rstrip("/")
+
+        self._idle_connections: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        # time (epoch) until which the requests are rate limited
+        self._rate_limited_until = 0.0
+
+    def __enter__(self) -> "GitHubAPIClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all the idle connections of the pool."""
+        with self._lock:
+            connections, self._idle_connections = self._idle_connections, []
+
+        for connection in connections:
+            connection.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        select: Optional[Callable[[Any], Any]] = None,
+    ) -> GitHubAPIResponse:
+        """
+        Sends a request to the GitHub API.
+
+        Args:
+            method (str): The HTTP request method, e.g., "GET" or "POST".
+            url (str): The endpoint URL for the GitHub API.
+            body (Optional[Dict[str, Any]]): The request body as a dictionary.
+            params (Optional[Dict[str, str]]): The query parameters as a dictionary.
+            select (Optional[Callable[[Any], Any]]): Function selecting the needed
+                fields of each item of a JSON array response. If given, the items
+                of a successful response are parsed from the response stream one
+                at a time and only the selected values are kept in the data. It
+                should be a module level function, its name is part of the cache
+                key.
+
+        Returns:
+            GitHubAPIResponse: The status, decoded data and headers of the response.
+        """
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+
+        request_body = json.dumps(body) if body else None
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "User-Agent": "commitlint",
+            "Accept-Encoding": "gzip",
+        }
+
+        cache_path = self._cache_path(url, select) if method == "GET" else None
+        cached = self._read_cache(cache_path) if cache_path else None
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+
+        retries = self.max_retries if method.upper() in IDEMPOTENT_METHODS else 0
+        for attempt in range(retries + 1):
+            self._wait_for_rate_limit()
+            try:
+                status, data, response_headers = self._exchange(
+                    method, url, request_body, headers, select
+                )
+            except (ConnectionError, TimeoutError):
+                # e.g. a refused connection or a dropped one, retried like a 5xx
+                if attempt == retries:
+                    raise
+                self.sleep(_get_backoff_delay(attempt))
+                continue
+
+            delay = self._retry_delay(status, response_headers, attempt)
+            if delay is None or attempt == retries:
+                break
+            if delay > 0:
+                self.sleep(delay)
+
+        if status == 304 and cached:
+            # not modified, the cached response is still valid
+            return GitHubAPIResponse(
+                200, cached["data"], {**cached["headers"], **response_headers}
+            )
+
+        response = GitHubAPIResponse(status, data, response_headers)
+
+        if cache_path and status == 200 and "etag" in response_headers:
+            self._write_cache(cache_path, response)
+
+        return response
+
+    def _exchange(
+        self,
+        method: str,
+        url: str,
+        body: Optional[str],
+        headers: Dict[str, str],
+        select: Optional[Callable[[Any], Any]],
+    ) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Sends a request on a pooled connection, retrying once on a new connection
+        if the reused one was closed by the server.
+
+        Returns:
+            Tuple[int, Any, Dict[str, str]]: The status, decoded data and headers
+                with lowercase names.
+        """
+        connection, reused = self._acquire_connection()
+        try:
+            try:
+                response = self._send(connection, method, url, body, headers, select)
+            except ConnectionError:
+                if not reused:
+                    raise
+
+                # the server may have closed the idle keep-alive connection
+                connection.close()
+                connection = self._new_connection()
+                response = self._send(connection, method, url, body, headers, select)
+        except Exception:
+            connection.close()
+            raise
+
+        status, data, response_headers, will_close = response
+        self._release_connection(connection, reusable=not will_close)
+        return status, data, response_headers
+
+    def _retry_delay(
+        self, status: int, headers: Dict[str, str], attempt: int
+    ) -> Optional[float]:
+        """
+        Gets the delay before retrying a response, None if it isn't retryable.
+
+        Rate limits block all the requests of the client until they are lifted,
+        so the wait happens in `_wait_for_rate_limit` and the delay is 0.
+
+        Args:
+            status (int): The HTTP status code.
+            headers (Dict[str, str]): The response headers, with lowercase names.
+            attempt (int): The number of the attempt, starting from 0.
+
+        Returns:
+            Optional[float]: The delay in seconds.
+        """
+        now = self.clock()
+        rate_limit_wait = _get_rate_limit_wait(headers, now)
+        if rate_limit_wait is not None and status in (403, 429):
+            if rate_limit_wait > GITHUB_API_MAX_RATE_LIMIT_WAIT:
+                return None
+
+            with self._lock:
+                self._rate_limited_until = max(
+                    self._rate_limited_until, now + rate_limit_wait
+                )
+            return 0.0
+
+        if status not in RETRY_STATUSES:
+            return None
+
+        return _get_backoff_delay(attempt)
+
+    def _wait_for_rate_limit(self) -> None:
+        """Waits until the rate limit hit by any request of the client is lifted."""
+        with self._lock:
+            wait = self._rate_limited_until - self.clock()
+
+        if wait > 0:
+            self.sleep(wait)
+
+    def _send(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        url: str,
+        body: Optional[str],
+        headers: Dict[str, str],
+        select: Optional[Callable[[Any], Any]] = None,
+    ) -> Tuple[int, Any, Dict[str, str], bool]:
+        """
+        Sends a request on the connection and reads the whole response.
+
+        Returns:
+            Tuple[int, Any, Dict[str, str], bool]: The status, decoded data, headers
+                with lowercase names and whether the server closes the connection.
+                The data of an error response that isn't JSON is its raw text.
+        """
+        connection.request(
+            method=method, url=self._path_prefix + url, body=body, headers=headers
+        )
+        res = connection.getresponse()
+        headers = {name.lower(): value for name, value in res.getheaders()}
+        chunks = _iter_body(res, headers.get("content-encoding"))
+
+        data: Any
+        if select is not None and res.status == 200:
+            data = [select(item) for item in iter_json_array(chunks)]
+            # reading the rest of the body, e.g. the gzip trailer, which also
+            # checks its CRC and leaves the connection ready for the next request
+            for _ in chunks:
+                pass
+        else:
+            text = b"".join(chunks).decode("utf-8", "replace")
+            try:
+                data = json.loads(text) if text else None
+            except ValueError:
+                if 200 <= res.status < 300:
+                    raise
+                # e.g. the HTML error page of a gateway, the status is still
+                # handled by the caller, which may retry the request
+                data = text
+
+        return res.status, data, headers, res.will_close
+
+    def _cache_path(
+        self, url: str, select: Optional[Callable[[Any], Any]] = None
+    ) -> Optional[str]:
+        """
+        Gets the path of the cache entry of the URL, None if the cache is disabled.
+
+        The scope of the token is part of the key, so the responses are never
+        shared between tokens having different access. The `select` function is
+        part of the key, as the cached data only has the selected values.
+        """
+        if not self.cache_dir:
+            return None
+
+        key = f"{self.cache_scope}\n{self._host}{self._path_prefix}{url}"
+        if select is not None:
+            key += f"\n{select.__module__}.{select.__qualname__}"
+        filename = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{filename}.json")
+
+    @staticmethod
+    def _read_cache(cache_path: str) -> Optional[Dict[str, Any]]:
+        """Reads a cache entry, None if it is missing or invalid."""
+        try:
+            with open(cache_path, encoding="utf-8") as cache_file:
+                cached: Dict[str, Any] = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.keys() != CACHE_ENTRY_KEYS:
+            return None
+
+        return cached
+
+    @staticmethod
+    def _write_cache(cache_path: str, response: GitHubAPIResponse) -> None:
+        """
+        Writes a cache entry, the file is replaced atomically so concurrent
+        requests and runs never read a partial entry.
+        """
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in UNCACHED_HEADERS
+        }
+        cached = {"etag": headers["etag"], "data": response.data, "headers": headers}
+
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False
+            ) as cache_file:
+                json.dump(cached, cache_file)
+            os.replace(cache_file.name, cache_path)
+        except OSError:
+            # the cache is only an optimization
+            pass
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """Opens a new connection to the GitHub API host."""
+        if self._https:
+            return http.client.HTTPSConnection(self._host, timeout=self.timeout)
+        return http.client.HTTPConnection(self._host, timeout=self.timeout)
+
+    def _acquire_connection(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Takes an idle connection from the pool or opens a new one.
+
+        Returns:
+            Tuple[http.client.HTTPConnection, bool]: The connection and whether it
+                was reused from the pool.
+        """
+        with self._lock:
+            if self._idle_connections:
+                return self._idle_connections.pop(), True
+
+        return self._new_connection(), False
+
+    def _release_connection(
+        self, connection: http.client.HTTPConnection, reusable: bool
+    ) -> None:
+        """Returns the connection to the pool, or closes it if not reusable."""
+        if not reusable:
+            connection.close()
+            return
+
+        with self._lock:
+            self._idle_connections.append(connection)
+
+
 def request_github_api(
     method: str,
     url: str,
     token: str,
     body: Optional[Dict[str, Any]] = None,
     params: Optional[Dict[str, Any]] = None,
+    cache_dir: Optional[str] = None,
 ) -> Tuple[int, Any]:
     """
-    Sends a request to the GitHub API.
+    Sends a single request to the GitHub API.
+
+    For multiple requests, use `GitHubAPIClient` to reuse the connections.
 
     Args:
         method (str): The HTTP request method, e.g., "GET" or "POST".
@@ -96,28 +770,15 @@ def request_github_api(
         token (str): The GitHub API token for authentication.
         body (Optional[Dict[str, Any]]): The request body as a dictionary.
         params (Optional[Dict[str, str]]): The query parameters as a dictionary.
+        cache_dir (Optional[str]): Directory of the response cache, see
+            `GitHubAPIClient`.
 
     Returns:
         Tuple[int, Any]: A tuple with the status as the first element and the response
             data as the second element.
 
     """
-    if params:
-        url += "?" + urllib.parse.urlencode(params)
-
-    conn = http.client.HTTPSConnection(host="api.github.com")
-    conn.request(
-        method=method,
-        url=url,
-        body=json.dumps(body) if body else None,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "User-Agent": "commitlint",
-        },
-    )
-    res = conn.getresponse()
-    json_data = res.read().decode("utf-8")
-    data = json.loads(json_data)
+    with GitHubAPIClient(token, cache_dir=cache_dir) as client:
+        response = client.request(method=method, url=url, body=body, params=params)
 
-    return res.status, data
+    return response.status, response.data
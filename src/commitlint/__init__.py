@@ -1,5 +1,31 @@
 """Main module for commitlint."""
 
-from .linter import lint_commit_message
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["lint_commit_message"]
+if TYPE_CHECKING:
+    from .linter import (
+        LintResult,
+        iter_lint_commit_messages,
+        lint_commit_message,
+        lint_commit_messages,
+    )
+
+__all__ = [
+    "LintResult",
+    "iter_lint_commit_messages",
+    "lint_commit_message",
+    "lint_commit_messages",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily imports the linter exports, so that `commitlint.cli` doesn't load the
+    linter for the code paths that don't need it (PEP 562).
+    """
+    if name in __all__:
+        from . import linter  # pylint: disable=import-outside-toplevel
+
+        return getattr(linter, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
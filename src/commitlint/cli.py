@@ -13,20 +13,50 @@ Usage:
 
 """
 
+# The CLI runs on every commit through the commit-msg hook, so the modules that
+# are only needed by some code paths (the linter, the git helpers and their
+# `subprocess` and `concurrent.futures` imports) are imported where they are used.
+# pylint: disable=import-outside-toplevel
+
 import argparse
 import os
 import sys
-from typing import List
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from . import console
 from .__version__ import __version__
 from .config import config
 from .exceptions import CommitlintException
-from .git_helpers import get_commit_message_of_hash, get_commit_messages_of_hash_range
-from .linter import lint_commit_message
-from .linter.utils import remove_diff_from_commit_message
 from .messages import VALIDATION_FAILED, VALIDATION_SUCCESSFUL
 
+if TYPE_CHECKING:
+    from .git_helpers import GitCommit
+    from .lint_cache import LintCache
+
+
+def _positive_int(value: str) -> int:
+    """
+    Parse a positive integer CLI argument.
+
+    Args:
+        value (str): The argument value.
+
+    Returns:
+        int: The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid positive integer: '{value}'")
+
+    return number
+
 
 def get_args() -> argparse.Namespace:
     """
@@ -57,8 +87,44 @@ def get_args() -> argparse.Namespace:
     )
     group.add_argument("--hash", type=str, help="Commit hash")
     group.add_argument("--from-hash", type=str, help="From commit hash")
+    group.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run the lint daemon, listening on the --socket-path",
+    )
     # --to-hash is optional
     parser.add_argument("--to-hash", type=str, help="To commit hash", default="HEAD")
+    # --jobs is only used for hash ranges
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        help="Number of processes for linting a hash range",
+        default=1,
+    )
+
+    # --cache is only used for hash ranges
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Skip the commits of a hash range already known to be valid",
+        default=False,
+    )
+
+    # --socket is optional, lints using the daemon if it is running
+    parser.add_argument(
+        "--socket",
+        action="store_true",
+        help="Lint using the lint daemon if it is running",
+        default=False,
+    )
+    parser.add_argument(
+        "--socket-path",
+        type=str,
+        help="Socket path of the lint daemon "
+        "(default: $COMMITLINT_SOCKET, or a per-user socket in $XDG_RUNTIME_DIR or "
+        "the temp dir)",
+    )
 
     # feature options
     parser.add_argument(
@@ -105,6 +171,7 @@ def _show_errors(
     errors: List[str],
     skip_detail: bool = False,
     hide_input: bool = False,
+    commit_hash: Optional[str] = None,
 ) -> None:
     """
     Display a formatted error message for a list of errors.
@@ -114,11 +181,17 @@ def _show_errors(
         errors (List[str]): A list of error messages to be displayed.
         skip_detail (bool): Whether to skip the detailed error message.
         hide_input (bool): Hide input from stdout/stderr.
+        commit_hash (Optional[str]): The hash of the commit, if known.
     """
+    from .linter.utils import remove_diff_from_commit_message
+
     error_count = len(errors)
 
     commit_message = remove_diff_from_commit_message(commit_message)
 
+    if commit_hash:
+        console.error(f"⧗ Commit: {commit_hash}")
+
     if not hide_input:
         console.error(f"⧗ Input:\n{commit_message}\n")
 
@@ -157,6 +230,7 @@ def _handle_commit_message(
     skip_detail: bool,
     hide_input: bool,
     strip_comments: bool = False,
+    socket_path: Optional[str] = None,
 ) -> None:
     """
     Handles a single commit message, checks its validity, and prints the result.
@@ -167,11 +241,27 @@ def _handle_commit_message(
         hide_input (bool): Hide input from stdout/stderr.
         strip_comments (bool, optional): Whether to remove comments from the
             commit message (default is False).
+        socket_path (Optional[str], optional): Socket path of the lint daemon. If
+            given, the commit message is linted by the daemon, or in-process if
+            the daemon is not available (default is None).
 
     Raises:
         SystemExit: If the commit message is invalid.
     """
-    success, errors = lint_commit_message(commit_message, skip_detail, strip_comments)
+    result = None
+    if socket_path is not None:
+        from .daemon_client import lint_commit_message_via_daemon
+
+        result = lint_commit_message_via_daemon(
+            commit_message, skip_detail, strip_comments, socket_path
+        )
+
+    if result is None:
+        from .linter import lint_commit_message
+
+        result = lint_commit_message(commit_message, skip_detail, strip_comments)
+
+    success, errors = result
 
     if success:
         console.success(VALIDATION_SUCCESSFUL)
@@ -181,31 +271,78 @@ def _handle_commit_message(
     sys.exit(1)
 
 
-def _handle_multiple_commit_messages(
-    commit_messages: List[str], skip_detail: bool, hide_input: bool
+def _handle_multiple_commits(
+    commits: Iterable["GitCommit"],
+    skip_detail: bool,
+    hide_input: bool,
+    jobs: int = 1,
+    cache: Optional["LintCache"] = None,
 ) -> None:
     """
-    Handles multiple commit messages, checks their validity, and prints the result.
+    Handles multiple commits, checks their validity, and prints the result.
 
     Args:
-        commit_messages (List[str]): List of commit messages to be handled.
+        commits (Iterable[GitCommit]): Commits to be handled.
         skip_detail (bool): Whether to skip the detailed error linting.
         hide_input (bool): Hide input from stdout/stderr.
+        jobs (int, optional): Number of processes for linting (default is 1).
+        cache (Optional[LintCache], optional): Cache of the commits known to be
+            valid, those commits are skipped and the valid ones are added
+            (default is None).
 
     Raises:
         SystemExit: If any of the commit messages is invalid.
     """
+    import itertools
+
+    from .linter import (
+        disable_lint_memo,
+        enable_lint_memo,
+        get_lint_memo_info,
+        iter_lint_commit_messages,
+    )
+
     has_error = False
 
-    for commit_message in commit_messages:
-        success, errors = lint_commit_message(commit_message, skip_detail)
-        if success:
-            console.verbose("lint success")
-            continue
+    if cache is not None:
+        commits = cache.iter_unknown(commits)
 
-        has_error = True
-        _show_errors(commit_message, errors, skip_detail, hide_input)
-        console.error("")
+    # both iterators are consumed in lockstep, so the tee buffer only holds the
+    # commits that are still being linted
+    commits, commits_to_lint = itertools.tee(commits)
+    results = iter_lint_commit_messages(
+        (commit.message for commit in commits_to_lint), skip_detail, jobs=jobs
+    )
+
+    # the commit messages of a range are often duplicated (cherry-picks, reverts),
+    # the memo is per process, so it is only used when linting in-process
+    use_memo = jobs == 1
+    if use_memo:
+        enable_lint_memo()
+    try:
+        for commit, result in zip(commits, results):
+            if result.success:
+                console.verbose("lint success")
+                if cache is not None:
+                    cache.add_valid(commit.commit_hash)
+                continue
+
+            has_error = True
+            _show_errors(
+                result.commit_message,
+                result.errors,
+                skip_detail,
+                hide_input,
+                commit_hash=commit.commit_hash,
+            )
+            console.error("")
+    finally:
+        if use_memo:
+            memo_info = get_lint_memo_info()
+            console.verbose(
+                f"lint memo: {memo_info.hits} hit(s), {memo_info.misses} miss(es)"
+            )
+            disable_lint_memo()
 
     if has_error:
         sys.exit(1)
@@ -225,7 +362,18 @@ def main() -> None:
 
     console.verbose("starting commitlint")
     try:
-        if args.file:
+        # socket path of the lint daemon, served or used for linting
+        socket_path = None
+        if args.serve or args.socket:
+            from .daemon_client import get_default_socket_path
+
+            socket_path = args.socket_path or get_default_socket_path()
+
+        if args.serve:
+            from .daemon import serve
+
+            serve(socket_path)
+        elif args.file:
             console.verbose("commit message source: file")
             commit_message = _get_commit_message_from_file(args.file)
             _handle_commit_message(
@@ -233,28 +381,49 @@ def main() -> None:
                 skip_detail=args.skip_detail,
                 hide_input=args.hide_input,
                 strip_comments=True,
+                socket_path=socket_path,
             )
         elif args.hash:
             console.verbose("commit message source: hash")
+            from .git_helpers import get_commit_message_of_hash
+
             commit_message = get_commit_message_of_hash(args.hash)
             _handle_commit_message(
-                commit_message, skip_detail=args.skip_detail, hide_input=args.hide_input
-            )
-        elif args.from_hash:
-            console.verbose("commit message source: hash range")
-            commit_messages = get_commit_messages_of_hash_range(
-                args.from_hash, args.to_hash
-            )
-            _handle_multiple_commit_messages(
-                commit_messages,
+                commit_message,
                 skip_detail=args.skip_detail,
                 hide_input=args.hide_input,
+                socket_path=socket_path,
             )
+        elif args.from_hash:
+            console.verbose("commit message source: hash range")
+            from .git_helpers import iter_commits_of_hash_range
+
+            cache = None
+            if args.cache:
+                from .lint_cache import open_lint_cache
+
+                cache = open_lint_cache(args.skip_detail)
+
+            commits = iter_commits_of_hash_range(args.from_hash, args.to_hash)
+            try:
+                _handle_multiple_commits(
+                    commits,
+                    skip_detail=args.skip_detail,
+                    hide_input=args.hide_input,
+                    jobs=args.jobs,
+                    cache=cache,
+                )
+            finally:
+                if cache is not None:
+                    cache.close()
         else:
             console.verbose("commit message source: direct message")
             commit_message = args.commit_message.strip()
             _handle_commit_message(
-                commit_message, skip_detail=args.skip_detail, hide_input=args.hide_input
+                commit_message,
+                skip_detail=args.skip_detail,
+                hide_input=args.hide_input,
+                socket_path=socket_path,
             )
     except CommitlintException as ex:
         console.error(f"{ex}")
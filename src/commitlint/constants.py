@@ -27,3 +27,20 @@ IGNORE_COMMIT_PATTERNS = (
     r"^Auto-merged (.*?) into (.*)$|"
     r"[Bb]ump [^\s]+ from [^\s]+ to [^\s]+"
 )
+
+# IGNORE_COMMIT_PATTERNS split by the leading token (the text before the first
+# space) of the commit message, only the patterns of that token need to be run.
+IGNORE_COMMIT_PATTERNS_BY_TOKEN = {
+    "Merge": (
+        r"^((Merge pull request)|(Merge (.*?) into (.*?)|(Merge branch (.*?)))(?:\r?\n)*$)|"
+        r"^(Merge tag (.*?))(?:\r?\n)*$|"
+        r"^Merge remote-tracking branch(\s*)(.*)$"
+    ),
+    "Merged": r"^(Merged (.*?)(in|into) (.*)|Merged PR (.*): (.*))$",
+    "Revert": r"^(R|r)evert (.*)",
+    "revert": r"^(R|r)evert (.*)",
+    "Automatic": r"^Automatic merge(.*)$",
+    "Auto-merged": r"^Auto-merged (.*?) into (.*)$",
+    "Bump": r"[Bb]ump [^\s]+ from [^\s]+ to [^\s]+",
+    "bump": r"[Bb]ump [^\s]+ from [^\s]+ to [^\s]+",
+}
@@ -0,0 +1,128 @@
+"""
+This module provides a long-lived lint daemon listening on a Unix domain socket.
+
+The daemon keeps the linter imported and its patterns compiled, so the hooks
+linting through the client (`commitlint.daemon_client`) don't pay the linter
+startup on every commit. The protocol is described in the client module.
+"""
+
+import json
+import os
+import signal
+import socketserver
+from types import FrameType
+from typing import Optional
+
+from . import console
+from .daemon_client import is_daemon_listening
+from .exceptions import CommitlintException
+
+# maximum size in bytes of a request line
+MAX_REQUEST_SIZE = 1024 * 1024
+
+
+class _LintRequestHandler(socketserver.StreamRequestHandler):
+    """Handles the lint requests of a client connection, one per line."""
+
+    def handle(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from .linter import lint_commit_message
+
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_SIZE)
+            if not line:
+                return
+
+            try:
+                request = json.loads(line)
+                success, errors = lint_commit_message(
+                    request["commit_message"],
+                    skip_detail=bool(request.get("skip_detail")),
+                    strip_comments=bool(request.get("strip_comments")),
+                )
+                response = {"success": success, "errors": errors}
+            except (ValueError, KeyError, TypeError) as ex:
+                response = {"error": f"{ex.__class__.__name__}: {ex}"}
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class LintServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Lint daemon listening on a Unix domain socket.
+
+    The socket file is removed when the server is closed.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str) -> None:
+        """
+        Initialize the server and bind it to the socket path.
+
+        A stale socket file, left by a daemon that didn't exit cleanly, is
+        replaced.
+
+        Args:
+            socket_path (str): Path of the Unix domain socket.
+
+        Raises:
+            OSError: If another daemon is listening on the socket path, or the
+                socket can't be created.
+        """
+        if os.path.exists(socket_path):
+            if is_daemon_listening(socket_path):
+                raise OSError(f"a daemon is already listening on {socket_path}")
+            os.unlink(socket_path)
+
+        super().__init__(socket_path, _LintRequestHandler)
+        self.socket_path = socket_path
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def serve(socket_path: str) -> None:
+    """
+    Run the lint daemon until it is interrupted.
+
+    Args:
+        socket_path (str): Path of the Unix domain socket.
+
+    Raises:
+        CommitlintException: If the daemon can't listen on the socket path.
+    """
+    # the linter is loaded once, before the first request
+    # pylint: disable=import-outside-toplevel
+    from .linter import disable_lint_memo, enable_lint_memo
+
+    try:
+        server = LintServer(socket_path)
+    except OSError as ex:
+        raise CommitlintException(
+            f"Failed to start the daemon on {socket_path}: {ex}"
+        ) from None
+
+    # the results are memoized for the commit messages linted again (e.g. the
+    # commit-msg hook of an amended commit)
+    enable_lint_memo()
+    # a `kill` stops the daemon like Ctrl+C, so the socket file is removed
+    previous_handler = signal.signal(signal.SIGTERM, _interrupt)
+    with server:
+        console.success(f"commitlint daemon listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            disable_lint_memo()
+
+
+def _interrupt(_signum: int, _frame: Optional[FrameType]) -> None:
+    """Signal handler raising `KeyboardInterrupt`, as for SIGINT."""
+    raise KeyboardInterrupt
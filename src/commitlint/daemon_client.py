@@ -0,0 +1,114 @@
+"""
+This module provides the client of the lint daemon, see `commitlint.daemon`.
+
+The client runs on every commit of the hooks using the daemon, so it only imports
+the modules needed to send a request, not the linter or the server.
+
+The protocol is one JSON line per request and per response:
+
+    request:  {"commit_message": str, "skip_detail": bool, "strip_comments": bool}
+    response: {"success": bool, "errors": [str, ...]}
+"""
+
+import json
+import os
+import socket
+from typing import List, Optional, Tuple
+
+from . import console
+
+# seconds the client waits for the daemon before linting in-process
+CLIENT_TIMEOUT = 5.0
+
+
+def get_default_socket_path() -> str:
+    """
+    Get the default socket path of the daemon.
+
+    Returns:
+        str: The `COMMITLINT_SOCKET` env, a socket in the per-user runtime dir
+            (`XDG_RUNTIME_DIR`), or a per-user socket in the temp dir.
+    """
+    socket_path = os.environ.get("COMMITLINT_SOCKET")
+    if socket_path:
+        return socket_path
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "commitlint.sock")
+
+    # `tempfile.gettempdir` is slow to import, Unix sockets are only used on Unix
+    temp_dir = os.environ.get("TMPDIR") or "/tmp"
+    filename = f"commitlint-{os.getuid()}.sock" if hasattr(os, "getuid") else None
+    return os.path.join(temp_dir, filename or "commitlint.sock")
+
+
+def lint_commit_message_via_daemon(
+    commit_message: str,
+    skip_detail: bool = False,
+    strip_comments: bool = False,
+    socket_path: Optional[str] = None,
+) -> Optional[Tuple[bool, List[str]]]:
+    """
+    Lint a commit message using the lint daemon.
+
+    Args:
+        commit_message (str): The commit message to be linted.
+        skip_detail (bool, optional): Whether to skip the detailed error linting
+            (default is False).
+        strip_comments (bool, optional): Whether to remove comments from the
+            commit message (default is False).
+        socket_path (Optional[str]): Path of the Unix domain socket, defaults to
+            `get_default_socket_path()`.
+
+    Returns:
+        Optional[Tuple[bool, List[str]]]: The success status and the errors, as
+            returned by `lint_commit_message`. None if the daemon is not
+            available, so that the commit message can be linted in-process.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    socket_path = socket_path or get_default_socket_path()
+    request = {
+        "commit_message": commit_message,
+        "skip_detail": skip_detail,
+        "strip_comments": strip_comments,
+    }
+
+    try:
+        # the socket may be in a shared dir (e.g. the temp dir), only a daemon of
+        # the current user is trusted with the commit messages and the results
+        if hasattr(os, "getuid") and os.stat(socket_path).st_uid != os.getuid():
+            console.verbose(f"lint daemon ignored: {socket_path} is not owned by you")
+            return None
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CLIENT_TIMEOUT)
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as response_file:
+                response = json.loads(response_file.readline())
+
+        return bool(response["success"]), list(response["errors"])
+    except (OSError, ValueError, KeyError, TypeError) as ex:
+        console.verbose(f"lint daemon not available: {ex.__class__.__name__}: {ex}")
+        return None
+
+
+def is_daemon_listening(socket_path: str) -> bool:
+    """
+    Check if a daemon is accepting connections on the socket path.
+
+    Args:
+        socket_path (str): Path of the Unix domain socket.
+
+    Returns:
+        bool: True if the connection succeeds.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return False
+    return True
@@ -2,11 +2,36 @@
 This module contains the git related helper functions.
 """
 
+import io
+import os
 import subprocess
-from typing import List
+from typing import IO, Iterator, List, NamedTuple, Sequence, cast
 
 from . import console
-from .exceptions import GitCommitNotFoundException, GitInvalidCommitRangeException
+from .exceptions import (
+    GitCommitNotFoundException,
+    GitException,
+    GitInvalidCommitRangeException,
+)
+
+# number of bytes read from the `git log` output at once
+GIT_LOG_READ_SIZE = 64 * 1024
+
+# `git log` format of a commit record: "<hash>\0<message>\0"
+GIT_LOG_FORMAT = "%H%x00%B%x00"
+
+
+class GitCommit(NamedTuple):
+    """
+    A Git commit retrieved from `git log`.
+
+    Attributes:
+        commit_hash (str): The full commit hash.
+        message (str): The commit message.
+    """
+
+    commit_hash: str
+    message: str
 
 
 def get_commit_message_of_hash(commit_hash: str) -> str:
@@ -44,17 +69,47 @@ def get_commit_message_of_hash(commit_hash: str) -> str:
         ) from None
 
 
+def get_git_dir() -> str:
+    """
+    Retrieve the absolute path of the `.git` directory of the current repository.
+
+    The common directory is used, so all the worktrees of a repository share it.
+
+    Returns:
+        str: The absolute path of the `.git` directory.
+
+    Raises:
+        GitException: If the current directory is not in a Git repository.
+    """
+    try:
+        # `--path-format=absolute` needs git 2.31, the relative path is resolved
+        console.verbose("executing: git rev-parse --git-common-dir")
+        output = subprocess.check_output(
+            ["git", "rev-parse", "--git-common-dir"],
+            text=True,
+            stderr=subprocess.PIPE,
+        )
+    except (subprocess.CalledProcessError, OSError) as ex:
+        console.verbose(f"{ex.__class__.__name__}: {ex}")
+        raise GitException("Failed to find the git directory") from None
+
+    # git versions without `--git-common-dir` echo the unknown option
+    lines = output.splitlines()
+    if len(lines) != 1 or not os.path.isdir(lines[0]):
+        console.verbose(f"unexpected output of git rev-parse: {output!r}")
+        raise GitException("Failed to find the git directory")
+
+    return os.path.abspath(lines[0])
+
+
 def get_commit_messages_of_hash_range(
     from_hash: str, to_hash: str = "HEAD"
 ) -> List[str]:
     """
     Retrieve an array of commit messages for a range of Git commit hashes.
 
-    Note:
-        This function will not support initial commit as from_hash.
-
     Args:
-        from_hash (str): The starting Git commit hash.
+        from_hash (str): The starting Git commit hash, included in the range.
         to_hash (str, optional): The ending Git commit hash or branch
             (default is "HEAD").
 
@@ -62,46 +117,169 @@ def get_commit_messages_of_hash_range(
         List[str]: A list of commit messages for the specified commit range.
 
     Raises:
-        GitCommitNotFoundException: If the commit hash of `from_hash` is not found
-            or if there is an error retrieving the commit message.
+        GitInvalidCommitRangeException: If the commit range of from_hash..to_hash is not
+            found or if there is an error retrieving the commit message.
+    """
+    return list(iter_commit_messages_of_hash_range(from_hash, to_hash))
+
+
+def iter_commit_messages_of_hash_range(
+    from_hash: str, to_hash: str = "HEAD"
+) -> Iterator[str]:
+    """
+    Lazily retrieve the commit messages for a range of Git commit hashes.
+
+    Args:
+        from_hash (str): The starting Git commit hash, included in the range.
+        to_hash (str, optional): The ending Git commit hash or branch
+            (default is "HEAD").
+
+    Yields:
+        str: The commit messages of the specified commit range, oldest first.
 
+    Raises:
+        GitInvalidCommitRangeException: If the commit range of from_hash..to_hash is not
+            found or if there is an error retrieving the commit message.
+    """
+    for commit in iter_commits_of_hash_range(from_hash, to_hash):
+        yield commit.message
+
+
+def iter_commits_of_hash_range(
+    from_hash: str, to_hash: str = "HEAD"
+) -> Iterator[GitCommit]:
+    """
+    Lazily retrieve the commits (hash and message) for a range of Git commit hashes.
+
+    The `git log` output is read incrementally, so the commits are yielded while
+    git is still writing and the whole range is never held in memory.
+
+    Args:
+        from_hash (str): The starting Git commit hash, included in the range. It can
+            be the initial commit.
+        to_hash (str, optional): The ending Git commit hash or branch
+            (default is "HEAD").
+
+    Yields:
+        GitCommit: The commit of from_hash first, then the commits of
+            from_hash..to_hash in topological order, parents before children.
+
+    Raises:
         GitInvalidCommitRangeException: If the commit range of from_hash..to_hash is not
             found or if there is an error retrieving the commit message.
     """
-    # as the commit range doesn't support initial commit hash,
-    # commit message of `from_hash` is taken separately
     console.verbose(
         f"fetching commit messages from hash range, from: {from_hash}, to: {to_hash}"
     )
-    from_commit_message = get_commit_message_of_hash(from_hash)
-
     try:
-        # Runs the below git command:
-        # git log --format=%B --reverse FROM_HASH..TO_HASH
-        # This outputs the commit messages excluding of FROM_HASH
-        delimiter = "========commit-delimiter========"
-        hash_range = f"{from_hash}..{to_hash}"
-
-        console.verbose(
-            f"executing: git log --format=%B{delimiter} --reverse {hash_range}"
-        )
-        commit_messages_output = subprocess.check_output(
-            ["git", "log", f"--format=%B{delimiter}", "--reverse", hash_range],
-            text=True,
-            stderr=subprocess.PIPE,
+        # Runs the below git commands:
+        # git log FROM_HASH^!
+        # git log --reverse --topo-order FROM_HASH..TO_HASH
+        # `FROM_HASH^!` is only FROM_HASH, even for the initial commit. It is
+        # walked separately so it is always first, a single walk of
+        # `TO_HASH FROM_HASH^!` would order it after the commits of the range that
+        # are unrelated to it (e.g. of a merged side branch). The topological
+        # order keeps the parents before their children, even with the same
+        # commit dates.
+        yield from _iter_git_log([f"{from_hash}^!"])
+        yield from _iter_git_log(
+            ["--reverse", "--topo-order", f"{from_hash}..{to_hash}"]
         )
-        console.verbose(commit_messages_output)
-
-        commit_messages = commit_messages_output.split(f"{delimiter}\n")
-        return [from_commit_message] + [
-            commit_message.strip()
-            for commit_message in commit_messages
-            if commit_message.strip()
-        ]
     except subprocess.CalledProcessError as ex:
         console.verbose("unable to fetch commit messages using git command")
         console.verbose(f"{ex.__class__.__name__}: {ex}")
-
         raise GitInvalidCommitRangeException(
             f"Failed to retrieve commit messages for the range {from_hash} to {to_hash}"
         ) from None
+
+
+def iter_commits_between(base_hash: str, head_hash: str) -> Iterator[GitCommit]:
+    """
+    Lazily retrieve the commits reachable from `head_hash` but not from `base_hash`,
+    i.e. the commits of `base_hash..head_hash`, e.g. the commits of a pull request.
+
+    Args:
+        base_hash (str): The base Git commit hash, excluded from the range.
+        head_hash (str): The head Git commit hash, included in the range.
+
+    Yields:
+        GitCommit: The commits of the specified commit range, oldest first.
+
+    Raises:
+        GitInvalidCommitRangeException: If the commit range of base_hash..head_hash
+            is not found or if there is an error retrieving the commit message.
+    """
+    console.verbose(
+        f"fetching commit messages between hashes, base: {base_hash}, head: {head_hash}"
+    )
+    try:
+        yield from _iter_git_log(
+            ["--reverse", "--topo-order", f"{base_hash}..{head_hash}"]
+        )
+    except subprocess.CalledProcessError as ex:
+        console.verbose("unable to fetch commit messages using git command")
+        console.verbose(f"{ex.__class__.__name__}: {ex}")
+        raise GitInvalidCommitRangeException(
+            f"Failed to retrieve commit messages for the range {base_hash}..{head_hash}"
+        ) from None
+
+
+def _iter_git_log(revision_args: Sequence[str]) -> Iterator[GitCommit]:
+    """
+    Run `git log` and lazily parse its NUL delimited commit records.
+
+    The records are parsed directly from the bytes buffer, only the hash and the
+    message of each commit are decoded.
+
+    Args:
+        revision_args (Sequence[str]): The revision arguments passed to `git log`.
+
+    Yields:
+        GitCommit: The commits in the order of the `git log` output.
+
+    Raises:
+        subprocess.CalledProcessError: If the git command fails.
+    """
+    command = ["git", "log", f"--format={GIT_LOG_FORMAT}", *revision_args]
+    console.verbose(f"executing: {' '.join(command)}")
+
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as process:
+        stdout = cast(io.BufferedReader, process.stdout)
+        stderr = cast(IO[bytes], process.stderr)
+
+        buffer = bytearray()
+        while True:
+            chunk = stdout.read1(GIT_LOG_READ_SIZE)
+            if not chunk:
+                break
+
+            buffer += chunk
+            view = memoryview(buffer)
+            record_start = 0
+            while True:
+                # each record is "<hash>\0<message>\0", git adds a newline
+                # between the records
+                hash_end = buffer.find(b"\0", record_start)
+                if hash_end == -1:
+                    break
+
+                message_end = buffer.find(b"\0", hash_end + 1)
+                if message_end == -1:
+                    break
+
+                commit_hash = str(view[record_start:hash_end], "ascii").strip()
+                message = str(view[hash_end + 1 : message_end], "utf-8", "replace")
+                yield GitCommit(commit_hash, message.strip())
+
+                record_start = message_end + 1
+
+            # keeping only the incomplete record in the buffer
+            view.release()
+            del buffer[:record_start]
+
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, command, stderr=stderr.read()
+            )
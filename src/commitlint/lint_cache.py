@@ -0,0 +1,270 @@
+"""
+This module provides an on-disk cache of the commits known to be valid, so that
+the repeated hash range checks (e.g. `--from-hash origin/main` on every push) only
+lint the new commits.
+
+A commit hash identifies its commit message, so the cache maps the commit hash
+and a fingerprint of the lint rules to the commit being valid. The fingerprint
+changes with the rules, which invalidates the cached results. Only the valid
+commits are cached, the errors of the invalid commits are always reported again.
+
+The cache is a SQLite database in the `.git` directory of the repository, the
+least recently used entries are evicted once it grows above `max_entries`.
+"""
+
+import hashlib
+import itertools
+import os
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+from . import console
+from .__version__ import __version__
+from .exceptions import CommitlintException
+
+if TYPE_CHECKING:
+    from .git_helpers import GitCommit
+
+# cache file, relative to the `.git` directory
+LINT_CACHE_FILENAME = os.path.join("commitlint", "lint-cache.sqlite3")
+# maximum number of cached commits, the least recently used are evicted
+LINT_CACHE_MAX_ENTRIES = 100_000
+# number of commits looked up at once, below the SQLite limit of query parameters
+LINT_CACHE_BATCH_SIZE = 500
+# seconds before the last use time of a cached commit is refreshed
+LINT_CACHE_REFRESH_INTERVAL = 24 * 60 * 60
+# seconds to wait for another commitlint process writing the cache
+LINT_CACHE_TIMEOUT = 5.0
+
+# files defining the lint rules, relative to the package directory
+LINT_RULES_FILES = (
+    "constants.py",
+    "messages.py",
+    os.path.join("linter", "_linter.py"),
+    os.path.join("linter", "parser.py"),
+    os.path.join("linter", "utils.py"),
+    os.path.join("linter", "validators.py"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS valid_commits (
+    commit_hash TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (commit_hash, fingerprint)
+) WITHOUT ROWID
+"""
+
+
+def get_lint_fingerprint(skip_detail: bool = False) -> str:
+    """
+    Get the fingerprint of the lint rules.
+
+    The fingerprint covers the commitlint version, the lint options and the
+    source of the modules defining the rules, so it changes with any rule.
+
+    Args:
+        skip_detail (bool, optional): Whether the detailed error linting is
+            skipped (default is False).
+
+    Returns:
+        str: The hex digest of the lint rules.
+    """
+    digest = hashlib.sha256(f"{__version__}\0{skip_detail}\0".encode("utf-8"))
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for filename in LINT_RULES_FILES:
+        with open(os.path.join(package_dir, filename), "rb") as rules_file:
+            digest.update(rules_file.read())
+    return digest.hexdigest()
+
+
+class LintCache:
+    """
+    Cache of the commits known to be valid, for a fingerprint of the lint rules.
+
+    The lookups read the database, the updates are buffered and written in a
+    single transaction when the cache is closed.
+
+    ```python
+    with LintCache(path, get_lint_fingerprint()) as cache:
+        for commit in cache.iter_unknown(commits):
+            ...  # lint and call `cache.add_valid(commit.commit_hash)` if valid
+    ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fingerprint: str,
+        max_entries: int = LINT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Open the cache, creating the database if it doesn't exist.
+
+        Args:
+            path (str): Path of the SQLite database.
+            fingerprint (str): Fingerprint of the lint rules.
+            max_entries (int, optional): Maximum number of cached commits
+                (default is `LINT_CACHE_MAX_ENTRIES`).
+
+        Raises:
+            CommitlintException: If the database can't be opened.
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # the used entries are only refreshed once per interval, so the checks of
+        # a range already cached don't rewrite it
+        self._stale_before = int(time.time()) - LINT_CACHE_REFRESH_INTERVAL
+        self._used: List[str] = []
+        self._added: List[str] = []
+
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(path, timeout=LINT_CACHE_TIMEOUT)
+            self._connection.execute(_SCHEMA)
+        except (sqlite3.Error, OSError) as ex:
+            raise CommitlintException(
+                f"Failed to open the lint cache {path}: {ex}"
+            ) from None
+
+    def iter_unknown(self, commits: Iterable["GitCommit"]) -> Iterator["GitCommit"]:
+        """
+        Lazily skip the commits known to be valid.
+
+        The commits are looked up in batches of `LINT_CACHE_BATCH_SIZE`, a single
+        query per batch.
+
+        Args:
+            commits (Iterable[GitCommit]): The commits to be linted.
+
+        Yields:
+            GitCommit: The commits not known to be valid, in the input order.
+        """
+        commits_iter = iter(commits)
+        while True:
+            batch = list(itertools.islice(commits_iter, LINT_CACHE_BATCH_SIZE))
+            if not batch:
+                return
+
+            valid_hashes = self._get_valid_hashes(
+                [commit.commit_hash for commit in batch]
+            )
+            self.hits += len(valid_hashes)
+            self.misses += len(batch) - len(valid_hashes)
+            self._used.extend(
+                commit_hash
+                for commit_hash, last_used in valid_hashes.items()
+                if last_used < self._stale_before
+            )
+
+            for commit in batch:
+                if commit.commit_hash not in valid_hashes:
+                    yield commit
+
+    def _get_valid_hashes(self, commit_hashes: List[str]) -> Dict[str, int]:
+        """Gets the commit hashes cached as valid and their last use time."""
+        placeholders = ", ".join("?" * len(commit_hashes))
+        try:
+            rows = self._connection.execute(
+                "SELECT commit_hash, last_used FROM valid_commits "
+                f"WHERE fingerprint = ? AND commit_hash IN ({placeholders})",
+                (self.fingerprint, *commit_hashes),
+            ).fetchall()
+        except sqlite3.Error as ex:
+            console.verbose(f"failed to read the lint cache: {ex}")
+            return {}
+
+        return dict(rows)
+
+    def add_valid(self, commit_hash: str) -> None:
+        """
+        Cache a commit as valid, written when the cache is closed.
+
+        Args:
+            commit_hash (str): The full commit hash.
+        """
+        self._added.append(commit_hash)
+
+    def close(self) -> None:
+        """
+        Write the buffered updates, evict the least recently used entries and close
+        the database.
+
+        A failed write only loses the updates, the lint results are not affected.
+        """
+        now = int(time.time())
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "UPDATE valid_commits SET last_used = ? "
+                    "WHERE commit_hash = ? AND fingerprint = ?",
+                    (
+                        (now, commit_hash, self.fingerprint)
+                        for commit_hash in self._used
+                    ),
+                )
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO valid_commits VALUES (?, ?, ?)",
+                    (
+                        (commit_hash, self.fingerprint, now)
+                        for commit_hash in self._added
+                    ),
+                )
+                self._evict()
+        except sqlite3.Error as ex:
+            console.verbose(f"failed to write the lint cache: {ex}")
+        finally:
+            self._used.clear()
+            self._added.clear()
+            self._connection.close()
+
+        console.verbose(f"lint cache: {self.hits} hit(s), {self.misses} miss(es)")
+
+    def _evict(self) -> None:
+        """Deletes the least recently used entries above `max_entries`."""
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM valid_commits"
+        ).fetchone()
+        if count <= self.max_entries:
+            return
+
+        console.verbose(f"evicting {count - self.max_entries} lint cache entries")
+        self._connection.execute(
+            "DELETE FROM valid_commits WHERE (commit_hash, fingerprint) IN ("
+            "SELECT commit_hash, fingerprint FROM valid_commits "
+            "ORDER BY last_used LIMIT ?)",
+            (count - self.max_entries,),
+        )
+
+    def __enter__(self) -> "LintCache":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def open_lint_cache(skip_detail: bool = False) -> Optional[LintCache]:
+    """
+    Open the lint cache of the current repository.
+
+    Args:
+        skip_detail (bool, optional): Whether the detailed error linting is
+            skipped (default is False).
+
+    Returns:
+        Optional[LintCache]: The lint cache, None if it is not available (e.g.
+            outside a Git repository), in which case every commit is linted.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .git_helpers import get_git_dir
+
+    try:
+        path = os.path.join(get_git_dir(), LINT_CACHE_FILENAME)
+        return LintCache(path, get_lint_fingerprint(skip_detail))
+    except (CommitlintException, OSError) as ex:
+        console.verbose(f"lint cache disabled: {ex}")
+        return None
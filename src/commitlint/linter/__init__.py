@@ -1,7 +1,23 @@
 """Main module for commit linters and validators"""
 
-from ._linter import lint_commit_message
+from ._linter import (
+    LintMemoInfo,
+    LintResult,
+    disable_lint_memo,
+    enable_lint_memo,
+    get_lint_memo_info,
+    iter_lint_commit_messages,
+    lint_commit_message,
+    lint_commit_messages,
+)
 
 __all__ = [
+    "LintMemoInfo",
+    "LintResult",
+    "disable_lint_memo",
+    "enable_lint_memo",
+    "get_lint_memo_info",
+    "iter_lint_commit_messages",
     "lint_commit_message",
+    "lint_commit_messages",
 ]
@@ -3,17 +3,189 @@ This module provides detailed functionality for linting commit messages accordin
 to conventional commit standards.
 """
 
-from typing import List, Tuple
+import itertools
+from collections import OrderedDict, deque
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 from .. import console
+from ..config import config
 from .utils import is_ignored, remove_comments
 from .validators import (
+    CommitValidator,
     HeaderLengthValidator,
     PatternValidator,
     SimplePatternValidator,
     run_validators,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# number of commit messages sent to a worker process at once, for parallel linting
+LINT_JOBS_CHUNK_SIZE = 500
+
+# default maximum number of lint results memoized by `enable_lint_memo`
+LINT_MEMO_SIZE = 4096
+
+# validator pipelines, built once and shared by every lint call
+SIMPLE_VALIDATOR_CLASSES: Tuple[Type[CommitValidator], ...] = (
+    HeaderLengthValidator,
+    SimplePatternValidator,
+)
+DETAILED_VALIDATOR_CLASSES: Tuple[Type[CommitValidator], ...] = (
+    HeaderLengthValidator,
+    PatternValidator,
+)
+
+
+class LintResult(NamedTuple):
+    """
+    Lint result of a single commit message of a batch.
+
+    Attributes:
+        index (int): Position of the commit message in the batch.
+        commit_message (str): The linted commit message.
+        success (bool): Whether the commit message is valid.
+        errors (List[str]): List of errors, empty if success is true.
+    """
+
+    index: int
+    commit_message: str
+    success: bool
+    errors: List[str]
+
+
+class LintMemoInfo(NamedTuple):
+    """
+    Statistics of the lint results memo.
+
+    Attributes:
+        hits (int): Number of lint results returned from the memo.
+        misses (int): Number of commit messages linted.
+        maxsize (int): Maximum number of memoized lint results, 0 if disabled.
+        size (int): Current number of memoized lint results.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    size: int
+
+
+class _LintMemo:
+    """
+    Bounded LRU memo of the lint results.
+
+    The entries are keyed by a digest of the commit message and the lint options,
+    so the memo doesn't keep the commit messages alive. It is shared by the
+    threads of the lint daemon, the updates are locked.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        # imported with the memo, the startup of the single commit checks (e.g.
+        # the commit-msg hook) doesn't pay for them
+        # pylint: disable=import-outside-toplevel
+        import hashlib
+        import threading
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # (message digest, skip_detail, strip_comments) -> (success, errors)
+        self._results: OrderedDict[
+            Tuple[bytes, bool, bool], Tuple[bool, Tuple[str, ...]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._blake2b = hashlib.blake2b
+
+    def lint(
+        self, commit_message: str, skip_detail: bool, strip_comments: bool
+    ) -> Tuple[bool, Tuple[str, ...]]:
+        """Lints a commit message, or returns its memoized result."""
+        key = (
+            self._blake2b(
+                commit_message.encode("utf-8", "surrogatepass"), digest_size=16
+            ).digest(),
+            skip_detail,
+            strip_comments,
+        )
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        # linted outside the lock, the daemon threads lint concurrently
+        result = _lint_commit_message_by_options(
+            commit_message, skip_detail, strip_comments
+        )
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def info(self) -> LintMemoInfo:
+        """Gets the statistics of the memo."""
+        with self._lock:
+            return LintMemoInfo(
+                self.hits, self.misses, self.maxsize, len(self._results)
+            )
+
+
+# lint results memoized by `enable_lint_memo`, None if disabled
+_lint_memo: Optional[_LintMemo] = None
+
+
+def enable_lint_memo(maxsize: int = LINT_MEMO_SIZE) -> None:
+    """
+    Enables the memo of the lint results, the counters are reset.
+
+    The results of `lint_commit_message` are kept in a bounded LRU memo keyed by a
+    digest of the commit message and the lint options, so linting a duplicate
+    commit message (e.g. cherry-picks or reverts in a range) costs a hash and a
+    dict lookup.
+
+    Args:
+        maxsize (int, optional): Maximum number of memoized lint results, the
+            least recently used are evicted (default is `LINT_MEMO_SIZE`).
+    """
+    global _lint_memo  # pylint: disable=global-statement
+    _lint_memo = _LintMemo(maxsize)
+
+
+def disable_lint_memo() -> None:
+    """Disables the memo of the lint results and clears it."""
+    global _lint_memo  # pylint: disable=global-statement
+    _lint_memo = None
+
+
+def get_lint_memo_info() -> LintMemoInfo:
+    """
+    Gets the statistics of the lint results memo.
+
+    Returns:
+        LintMemoInfo: The hit and miss counters and the size of the memo, all zero
+            if the memo is disabled.
+    """
+    if _lint_memo is None:
+        return LintMemoInfo(0, 0, 0, 0)
+
+    return _lint_memo.info()
+
 
 def lint_commit_message(
     commit_message: str, skip_detail: bool = False, strip_comments: bool = False
@@ -21,6 +193,9 @@ def lint_commit_message(
     """
     Lints a commit message.
 
+    If the memo is enabled by `enable_lint_memo`, the result is returned from the
+    memo for a commit message already linted with the same options.
+
     Args:
         commit_message (str): The commit message to be linted.
         skip_detail (bool, optional): Whether to skip the detailed error linting
@@ -28,6 +203,242 @@ def lint_commit_message(
         strip_comments (bool, optional): Whether to remove comments from the
             commit message (default is False).
 
+    Returns:
+        Tuple[bool, List[str]]: Returns success as a first element and list of errors
+            on the second elements. If success is true, errors will be empty.
+    """
+    if _lint_memo is not None:
+        success, errors = _lint_memo.lint(commit_message, skip_detail, strip_comments)
+        # a new list, the memoized errors are shared
+        return success, list(errors)
+
+    if skip_detail:
+        return _lint_commit_message(
+            commit_message,
+            validator_classes=SIMPLE_VALIDATOR_CLASSES,
+            fail_fast=True,
+            strip_comments=strip_comments,
+        )
+
+    return _lint_commit_message(
+        commit_message,
+        validator_classes=DETAILED_VALIDATOR_CLASSES,
+        fail_fast=False,
+        strip_comments=strip_comments,
+    )
+
+
+def iter_lint_commit_messages(
+    commit_messages: Iterable[str],
+    skip_detail: bool = False,
+    strip_comments: bool = False,
+    jobs: int = 1,
+) -> Iterator[LintResult]:
+    """
+    Lints commit messages one by one, yielding the result of each commit message.
+
+    The commit messages are consumed lazily, so the whole batch is never
+    materialised in memory.
+
+    Args:
+        commit_messages (Iterable[str]): The commit messages to be linted.
+        skip_detail (bool, optional): Whether to skip the detailed error linting
+            (default is False).
+        strip_comments (bool, optional): Whether to remove comments from the
+            commit messages (default is False).
+        jobs (int, optional): Number of worker processes. If more than 1, the
+            commit messages are linted in chunks by a process pool (default is 1).
+
+    Yields:
+        LintResult: The lint result of each commit message, in the input order.
+    """
+    if jobs > 1:
+        yield from _iter_lint_commit_messages_in_parallel(
+            commit_messages, skip_detail, strip_comments, jobs
+        )
+        return
+
+    # selecting the validator pipeline once for the whole batch
+    if skip_detail:
+        validator_classes, fail_fast = SIMPLE_VALIDATOR_CLASSES, True
+    else:
+        validator_classes, fail_fast = DETAILED_VALIDATOR_CLASSES, False
+
+    for index, commit_message in enumerate(commit_messages):
+        if _lint_memo is not None:
+            success, errors = lint_commit_message(
+                commit_message, skip_detail, strip_comments
+            )
+        else:
+            success, errors = _lint_commit_message(
+                commit_message,
+                validator_classes=validator_classes,
+                fail_fast=fail_fast,
+                strip_comments=strip_comments,
+            )
+        yield LintResult(index, commit_message, success, errors)
+
+
+def lint_commit_messages(
+    commit_messages: Iterable[str],
+    skip_detail: bool = False,
+    strip_comments: bool = False,
+    jobs: int = 1,
+) -> List[LintResult]:
+    """
+    Lints multiple commit messages.
+
+    Args:
+        commit_messages (Iterable[str]): The commit messages to be linted.
+        skip_detail (bool, optional): Whether to skip the detailed error linting
+            (default is False).
+        strip_comments (bool, optional): Whether to remove comments from the
+            commit messages (default is False).
+        jobs (int, optional): Number of worker processes (default is 1).
+
+    Returns:
+        List[LintResult]: The lint result of each commit message, in the input order.
+    """
+    return list(
+        iter_lint_commit_messages(
+            commit_messages,
+            skip_detail=skip_detail,
+            strip_comments=strip_comments,
+            jobs=jobs,
+        )
+    )
+
+
+def _iter_lint_commit_messages_in_parallel(
+    commit_messages: Iterable[str],
+    skip_detail: bool,
+    strip_comments: bool,
+    jobs: int,
+) -> Iterator[LintResult]:
+    """
+    Lints commit messages in chunks using a process pool.
+
+    Only a few chunks per worker are in flight at once, so the commit messages are
+    still consumed lazily. The results are yielded in the input order.
+
+    Args:
+        commit_messages (Iterable[str]): The commit messages to be linted.
+        skip_detail (bool): Whether to skip the detailed error linting.
+        strip_comments (bool): Whether to remove comments from the commit messages.
+        jobs (int): Number of worker processes.
+
+    Yields:
+        LintResult: The lint result of each commit message, in the input order.
+    """
+    # imported here as it is slow to import and only needed for parallel linting
+    from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+        ProcessPoolExecutor,
+    )
+
+    console.verbose(f"linting commit messages using {jobs} jobs")
+    commit_messages_iter = iter(commit_messages)
+    pending: Deque[Tuple[List[str], "Future[List[Tuple[bool, List[str]]]]"]] = deque()
+    index = 0
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_lint_worker
+    ) as executor:
+        while True:
+            while len(pending) < jobs * 2:
+                chunk = list(
+                    itertools.islice(commit_messages_iter, LINT_JOBS_CHUNK_SIZE)
+                )
+                if not chunk:
+                    break
+
+                future = executor.submit(
+                    _lint_commit_messages_chunk, chunk, skip_detail, strip_comments
+                )
+                pending.append((chunk, future))
+
+            if not pending:
+                break
+
+            chunk, future = pending.popleft()
+            for commit_message, (success, errors) in zip(chunk, future.result()):
+                yield LintResult(index, commit_message, success, errors)
+                index += 1
+
+
+def _init_lint_worker() -> None:
+    """
+    Initializes a worker process of the parallel linting.
+
+    The workers inherit the config of the CLI, their verbose lines are disabled as
+    they would be interleaved with the output of the main process.
+    """
+    config.verbose = False
+
+
+def _lint_commit_messages_chunk(
+    commit_messages: List[str], skip_detail: bool, strip_comments: bool
+) -> List[Tuple[bool, List[str]]]:
+    """
+    Lints a chunk of commit messages, runs in the worker processes.
+
+    Args:
+        commit_messages (List[str]): The commit messages to be linted.
+        skip_detail (bool): Whether to skip the detailed error linting.
+        strip_comments (bool): Whether to remove comments from the commit messages.
+
+    Returns:
+        List[Tuple[bool, List[str]]]: Success and errors of each commit message.
+    """
+    return [
+        lint_commit_message(commit_message, skip_detail, strip_comments)
+        for commit_message in commit_messages
+    ]
+
+
+def _lint_commit_message_by_options(
+    commit_message: str, skip_detail: bool, strip_comments: bool
+) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Lints a commit message for the memo, the errors are immutable as they are
+    shared by the callers.
+
+    Args:
+        commit_message (str): The commit message to be linted.
+        skip_detail (bool): Whether to skip the detailed error linting.
+        strip_comments (bool): Whether to remove comments from the commit message.
+
+    Returns:
+        Tuple[bool, Tuple[str, ...]]: Success and errors of the commit message.
+    """
+    if skip_detail:
+        validator_classes, fail_fast = SIMPLE_VALIDATOR_CLASSES, True
+    else:
+        validator_classes, fail_fast = DETAILED_VALIDATOR_CLASSES, False
+
+    success, errors = _lint_commit_message(
+        commit_message,
+        validator_classes=validator_classes,
+        fail_fast=fail_fast,
+        strip_comments=strip_comments,
+    )
+    return success, tuple(errors)
+
+
+def _lint_commit_message(
+    commit_message: str,
+    validator_classes: Sequence[Type[CommitValidator]],
+    fail_fast: bool,
+    strip_comments: bool,
+) -> Tuple[bool, List[str]]:
+    """
+    Lints a commit message using the given validator pipeline.
+
+    Args:
+        commit_message (str): The commit message to be linted.
+        validator_classes (Sequence[Type[CommitValidator]]): Validator classes to run.
+        fail_fast (bool): Return early if one validator fails.
+        strip_comments (bool): Whether to remove comments from the commit message.
+
     Returns:
         Tuple[bool, List[str]]: Returns success as a first element and list of errors
             on the second elements. If success is true, errors will be empty.
@@ -47,16 +458,11 @@ def lint_commit_message(
         console.verbose("commit message ignored, skipping lint")
         return True, []
 
-    # for skip_detail check
-    if skip_detail:
+    if fail_fast:
         console.verbose("running simple validators for linting")
-        return run_validators(
-            commit_message,
-            validator_classes=[HeaderLengthValidator, SimplePatternValidator],
-            fail_fast=True,
-        )
+    else:
+        console.verbose("running detailed validators for linting")
 
-    console.verbose("running detailed validators for linting")
     return run_validators(
-        commit_message, validator_classes=[HeaderLengthValidator, PatternValidator]
+        commit_message, validator_classes=validator_classes, fail_fast=fail_fast
     )
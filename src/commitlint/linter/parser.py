@@ -0,0 +1,145 @@
+"""
+This module provides the parsed representation of a commit message, shared by
+all the validators.
+"""
+
+import re
+from typing import List, Match, Optional, Tuple, cast
+
+# Lenient conventional commit pattern, it matches every commit message so that
+# the validators can report detailed errors from the groups. The pattern stops
+# after the body separation, the body is whatever follows the match.
+COMMIT_PATTERN = (
+    r"(?P<type>\w+\s*)?"
+    r"(?:\((?P<scope>[^\)]*)\)(?P<space_after_scope>\s*))?"
+    r"(?P<breaking>!)?(?P<colon>:\s?)?"
+    r"(?:(?P<description>[^\n\r]+))?"
+    r"(?P<body_separation>\n?\n?)"
+)
+COMMIT_RE = re.compile(COMMIT_PATTERN)
+
+BREAKING_CHANGE_TOKENS = ("BREAKING CHANGE", "BREAKING-CHANGE")
+
+# footer line, e.g. "Refs: #123", "Closes #123" or "BREAKING CHANGE: ..."
+FOOTER_RE = re.compile(r"(?P<token>BREAKING[ -]CHANGE|[\w-]+)(?::[ ]|[ ]#)")
+
+
+class ParsedCommit:
+    """
+    Parsed representation of a commit message.
+
+    The commit message is parsed once and shared by all the validators. The header
+    is located once using `str.find`. The conventional commit parts (type, scope,
+    breaking flag and description) are parsed from the header on first access,
+    and the body and the footers are only split from the commit message when they
+    are accessed, so validators that only need the header never scan the body.
+
+    Attributes:
+        message (str): The commit message.
+        header_end (int): Index of the end of the header (the first newline or
+            the length of the commit message).
+    """
+
+    __slots__ = ("message", "header_end", "_match", "_body", "_footers")
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+        header_end = message.find("\n")
+        self.header_end = len(message) if header_end == -1 else header_end
+
+        self._match: Optional[Match[str]] = None
+        self._body: Optional[str] = None
+        self._footers: Optional[List[Tuple[str, str]]] = None
+
+    @property
+    def match(self) -> Match[str]:
+        """Gets the match of the commit message with `COMMIT_RE`."""
+        if self._match is None:
+            # every group is optional, so the pattern always matches
+            self._match = cast(Match[str], COMMIT_RE.match(self.message))
+        return self._match
+
+    @property
+    def commit_type(self) -> Optional[str]:
+        """Gets the commit type, None if it is missing."""
+        commit_type = self.match.group("type")
+        return None if commit_type is None else commit_type.strip()
+
+    @property
+    def scope(self) -> Optional[str]:
+        """Gets the commit scope, None if there is no scope."""
+        return self.match.group("scope")
+
+    @property
+    def description(self) -> Optional[str]:
+        """Gets the commit description, None if it is missing."""
+        return self.match.group("description")
+
+    @property
+    def breaking(self) -> bool:
+        """Checks if the commit has a `!` or a BREAKING CHANGE footer."""
+        if self.match.group("breaking") is not None:
+            return True
+
+        return any(token in BREAKING_CHANGE_TOKENS for token, _ in self.footers)
+
+    @property
+    def has_body(self) -> bool:
+        """Checks if there is any text after the header and the body separation."""
+        return self.match.end() < len(self.message)
+
+    def span(self, part: str) -> Tuple[int, int]:
+        """
+        Gets the offsets of a part of the commit message.
+
+        Args:
+            part (str): One of "type", "scope", "breaking", "description" or
+                "body_separation".
+
+        Returns:
+            Tuple[int, int]: The start and end offsets, (-1, -1) if the part is
+                missing.
+        """
+        return self.match.span(part)
+
+    @property
+    def header(self) -> str:
+        """Gets the header (the first line) of the commit message."""
+        return self.message[: self.header_end]
+
+    @property
+    def body(self) -> str:
+        """Gets the body of the commit message, excluding the footers."""
+        if self._body is None:
+            self._body, self._footers = self._split_body()
+        return self._body
+
+    @property
+    def footers(self) -> List[Tuple[str, str]]:
+        """Gets the footers of the commit message as (token, value) pairs."""
+        if self._footers is None:
+            self._body, self._footers = self._split_body()
+        return self._footers
+
+    def _split_body(self) -> Tuple[str, List[Tuple[str, str]]]:
+        """Splits the text after the header into the body and the footers."""
+        body = self.message[self.header_end :].strip("\r\n")
+        footers: List[Tuple[str, str]] = []
+
+        # footers are the last paragraph, if it starts with a footer token
+        paragraph_start = body.rfind("\n\n") + 1
+        paragraph = body[paragraph_start:].lstrip("\n")
+        if FOOTER_RE.match(paragraph):
+            for line in paragraph.splitlines():
+                footer_match = FOOTER_RE.match(line)
+                if footer_match:
+                    footers.append((footer_match["token"], line[footer_match.end() :]))
+                elif footers:
+                    # continuation of the previous footer value
+                    token, value = footers[-1]
+                    footers[-1] = (token, f"{value}\n{line}")
+
+            body = body[:paragraph_start].rstrip("\r\n")
+
+        return body, footers
@@ -5,7 +5,14 @@ Contains the utility methods for linters.
 import re
 from typing import List
 
-from ..constants import IGNORE_COMMIT_PATTERNS
+from ..constants import IGNORE_COMMIT_PATTERNS_BY_TOKEN
+
+# compiled once at import, avoids the `re` module cache lookup on every call
+IGNORE_COMMIT_RES_BY_TOKEN = {
+    token: re.compile(pattern)
+    for token, pattern in IGNORE_COMMIT_PATTERNS_BY_TOKEN.items()
+}
+_IGNORE_TOKEN_MAX_LENGTH = max(len(token) for token in IGNORE_COMMIT_RES_BY_TOKEN)
 
 
 def is_ignored(commit_message: str) -> bool:
@@ -15,13 +22,21 @@ def is_ignored(commit_message: str) -> bool:
     Some commit messages like merge, revert, auto merge, etc is ignored
     from linting.
 
+    The leading token of the commit message selects the ignore pattern, so most
+    commit messages are rejected without running any regex.
+
     Args:
         commit_message (str): The commit message to check.
 
     Returns:
         bool: True if the commit message should be ignored, False otherwise.
     """
-    return bool(re.match(IGNORE_COMMIT_PATTERNS, commit_message))
+    token_end = commit_message.find(" ", 0, _IGNORE_TOKEN_MAX_LENGTH + 1)
+    if token_end == -1:
+        return False
+
+    pattern = IGNORE_COMMIT_RES_BY_TOKEN.get(commit_message[:token_end])
+    return pattern is not None and bool(pattern.match(commit_message))
 
 
 def remove_comments(commit_message: str) -> str:
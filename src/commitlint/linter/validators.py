@@ -6,7 +6,7 @@ conventional commit standards.
 
 import re
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Type, Union
+from typing import List, Sequence, Tuple, Type, Union
 
 from .. import console
 from ..constants import COMMIT_HEADER_MAX_LENGTH, COMMIT_TYPES
@@ -25,13 +25,22 @@ from ..messages import (
     SPACE_AFTER_COMMIT_TYPE_ERROR,
     SPACE_AFTER_SCOPE_ERROR,
 )
+from .parser import COMMIT_PATTERN, COMMIT_RE, ParsedCommit
 
 
 class CommitValidator(ABC):
-    """Abstract Base validator for commit message."""
+    """
+    Abstract Base validator for commit message.
+
+    The validator accepts either the commit message or its `ParsedCommit`, which is
+    parsed once and shared by all the validators.
+    """
 
-    def __init__(self, commit_message: str) -> None:
-        self._commit_message = commit_message
+    def __init__(self, commit: Union[str, ParsedCommit]) -> None:
+        if not isinstance(commit, ParsedCommit):
+            commit = ParsedCommit(commit)
+
+        self._commit = commit
         self._errors: List[str] = []
 
         # start validation
@@ -54,10 +63,15 @@ class CommitValidator(ABC):
         """Get the list of errors."""
         return self._errors
 
+    @property
+    def commit(self) -> ParsedCommit:
+        """Gets the parsed commit."""
+        return self._commit
+
     @property
     def commit_message(self) -> str:
         """Gets the commit message."""
-        return self._commit_message
+        return self._commit.message
 
 
 class HeaderLengthValidator(CommitValidator):
@@ -70,8 +84,7 @@ class HeaderLengthValidator(CommitValidator):
         Returns:
             None
         """
-        header = self.commit_message.split("\n")[0]
-        if len(header) > COMMIT_HEADER_MAX_LENGTH:
+        if self.commit.header_end > COMMIT_HEADER_MAX_LENGTH:
             self.add_error(HEADER_LENGTH_ERROR)
 
 
@@ -79,16 +92,19 @@ class SimplePatternValidator(CommitValidator):
     """
     A simple validator for commit messages using the conventional commit regex
     pattern. This validator doesn't check for the detailed error message.
+
+    The pattern stops after the header: a body only needs to be separated by a
+    blank line, so it is never scanned.
     """
 
     _RE_TYPES = "|".join(COMMIT_TYPES)
     COMMIT_PATTERN = (
-        r"(?s)"  # To explicitly make . match new line
         rf"(?P<type>{_RE_TYPES})"
         r"(?P<scope>\(\S+\))?!?:"
         r"(?: (?P<description>[^\s][^\n\r]+[^\.]))"
-        r"((\n\n(?P<body>.*))|(\s*))?$"
+        r"(?:\n\n|\s*$)"
     )
+    COMMIT_RE = re.compile(COMMIT_PATTERN)
 
     def validate(self) -> None:
         """
@@ -97,7 +113,7 @@ class SimplePatternValidator(CommitValidator):
         Returns:
             None
         """
-        pattern_match = re.match(self.COMMIT_PATTERN, self.commit_message)
+        pattern_match = self.COMMIT_RE.match(self.commit_message)
         if pattern_match is None:
             self.add_error(INCORRECT_FORMAT_ERROR)
 
@@ -106,17 +122,14 @@ class PatternValidator(CommitValidator):
     """
     A Detailed validator for commit message using the conventional commit regex
     pattern. This validator checks for the detailed error message.
+
+    The commit message is matched once by `ParsedCommit`, this validator only
+    checks the matched groups.
     """
 
-    COMMIT_PATTERN = (
-        r"(?s)"  # To explicitly make . match new line
-        r"(?P<type>\w+\s*)?"
-        r"(?:\((?P<scope>[^\)]*)\)(?P<space_after_scope>\s*))?"
-        r"!?(?P<colon>:\s?)?"
-        r"(?:(?P<description>[^\n\r]+))?"
-        r"(?P<body_separation>\n?\n?)"
-        r"(((?P<body>.*))|(\s*))?$"
-    )
+    # the pattern is defined in the parser, kept here for backward compatibility
+    COMMIT_PATTERN = COMMIT_PATTERN
+    COMMIT_RE = COMMIT_RE
 
     def validate(self) -> None:
         """
@@ -127,8 +140,8 @@ class PatternValidator(CommitValidator):
         """
 
         # Matching commit message with the commit pattern
-        pattern_match = re.match(self.COMMIT_PATTERN, self.commit_message)
-        if pattern_match is None or pattern_match.group("colon") is None:
+        pattern_match = self.commit.match
+        if pattern_match.group("colon") is None:
             self.add_error(INCORRECT_FORMAT_ERROR)
             return
 
@@ -260,9 +273,7 @@ class PatternValidator(CommitValidator):
             Union[None, str]: If there is no line break at the end of the
                 description, returns None; otherwise, returns an error message.
         """
-        if self.re_match.group("body_separation") == "\n" and self.re_match.group(
-            "body"
-        ):
+        if self.re_match.group("body_separation") == "\n" and self.commit.has_body:
             return DESCRIPTION_LINE_BREAK_ERROR
 
         return None
@@ -287,14 +298,14 @@ class PatternValidator(CommitValidator):
 
 def run_validators(
     commit_message: str,
-    validator_classes: List[Type[CommitValidator]],
+    validator_classes: Sequence[Type[CommitValidator]],
     fail_fast: bool = False,
 ) -> Tuple[bool, List[str]]:
     """Runs the provided validators for the commit message.
 
     Args:
         commit_message (str): The commit message to validate.
-        validator_classes (List[Type[CommitValidator]]): List of validator classes to
+        validator_classes (Sequence[Type[CommitValidator]]): Validator classes to
             run.
         fail_fast (bool, optional): Return early if one validator fails. Defaults to
             False.
@@ -307,9 +318,12 @@ def run_validators(
     success = True
     errors: List[str] = []
 
+    # parsing once, shared by all the validators
+    commit = ParsedCommit(commit_message)
+
     for validator_class in validator_classes:
         console.verbose(f"running validator {validator_class.__name__}")
-        validator = validator_class(commit_message)
+        validator = validator_class(commit)
         if not validator.is_valid():
             console.verbose(f"{validator_class.__name__}: validation failed")
             if fail_fast:
@@ -24,3 +24,5 @@ def set_github_env_vars():
     os.environ["INPUT_TOKEN"] = "token"
     os.environ["INPUT_VERBOSE"] = "false"
     os.environ["INPUT_FAIL_ON_ERROR"] = "true"
+    os.environ["INPUT_SOURCE"] = "auto"
+    os.environ["INPUT_CACHE_DIR"] = ""
@@ -0,0 +1,38 @@
+# type: ignore
+# pylint: disable=all
+import os
+import subprocess
+from typing import List
+
+
+def git(repo_path, *args) -> str:
+    return subprocess.check_output(
+        ["git", *args], cwd=repo_path, text=True, stderr=subprocess.PIPE
+    ).strip()
+
+
+def create_git_repo(repo_path, commit_messages: List[str]) -> List[str]:
+    """
+    Creates a git repository with an empty commit for each commit message and
+    returns the commit hashes, oldest first.
+    """
+    os.makedirs(repo_path, exist_ok=True)
+    git(repo_path, "init", "--quiet")
+    git(repo_path, "config", "user.name", "commitlint")
+    git(repo_path, "config", "user.email", "commitlint@example.com")
+    git(repo_path, "config", "commit.gpgsign", "false")
+
+    commit_hashes = []
+    for commit_message in commit_messages:
+        git(
+            repo_path,
+            "commit",
+            "--quiet",
+            "--allow-empty",
+            "--cleanup=verbatim",
+            "-m",
+            commit_message,
+        )
+        commit_hashes.append(git(repo_path, "rev-parse", "HEAD"))
+
+    return commit_hashes
@@ -0,0 +1,156 @@
+# type: ignore
+# pylint: disable=all
+"""
+Local stand-in for the GitHub API, used for testing the GitHub API client.
+
+```python
+with FakeGitHubAPIServer() as server:
+    server.add_response("GET", "/repos/owner/repo", data={"id": 1})
+    client = GitHubAPIClient("token", base_url=server.url)
+```
+"""
+
+import gzip
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeResponse:
+    def __init__(self, status=200, data=None, headers=None, compress=False, body=None):
+        self.status = status
+        self.data = data
+        self.headers = headers or {}
+        self.compress = compress
+        # raw body, sent instead of the JSON data if given
+        self.body = body
+
+
+class RecordedRequest:
+    def __init__(self, method, path, headers, body, client_port):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+        self.client_port = client_port
+
+    @property
+    def route(self):
+        return urllib.parse.urlsplit(self.path).path
+
+    @property
+    def query(self):
+        return dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(self.path).query))
+
+    @property
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        request = RecordedRequest(
+            self.command,
+            self.path,
+            {name.lower(): value for name, value in self.headers.items()},
+            body,
+            self.client_address[1],
+        )
+        response = self.server.fake_api.record(request)
+
+        if response.body is not None:
+            payload = response.body
+        elif response.data is None:
+            payload = b""
+        else:
+            payload = json.dumps(response.data).encode()
+        headers = dict(response.headers)
+        if response.compress and payload:
+            payload = gzip.compress(payload)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(response.status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+def _freeze(query):
+    if query is None:
+        return None
+    return frozenset((name, str(value)) for name, value in query.items())
+
+
+class FakeGitHubAPIServer:
+    def __init__(self):
+        self.requests = []
+        self._responses = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake_api = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        )
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def add_response(self, method, route, status=200, data=None, query=None, **kwargs):
+        """
+        Queues a response for the route (path without query), responses are
+        returned in order and the last one is repeated.
+
+        If `query` is given, the response is only returned for the requests
+        having those query params (e.g. a specific page).
+        """
+        response = FakeResponse(status, data, **kwargs)
+        with self._lock:
+            self._responses.setdefault((method, route, _freeze(query)), []).append(
+                response
+            )
+
+    def record(self, request):
+        with self._lock:
+            self.requests.append(request)
+            responses = None
+            for (method, route, query), queued in self._responses.items():
+                if (method, route) != (request.method, request.route):
+                    continue
+                if query is None:
+                    responses = responses or queued
+                elif query <= set(request.query.items()):
+                    responses = queued
+                    break
+            if not responses:
+                return FakeResponse(404, {"message": "Not Found"})
+            response = responses.pop(0) if len(responses) > 1 else responses[0]
+
+        # conditional request of an unchanged response
+        etag = response.headers.get("ETag")
+        if etag and request.headers.get("if-none-match") == etag:
+            return FakeResponse(304, headers={"ETag": etag})
+        return response
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self._server.shutdown()
+        self._server.server_close()
@@ -8,6 +8,8 @@ import pytest
 from commitlint.cli import get_args, main
 from commitlint.config import config
 from commitlint.exceptions import CommitlintException
+from commitlint.git_helpers import GitCommit
+from commitlint.linter import LintResult, get_lint_memo_info
 from commitlint.messages import (
     INCORRECT_FORMAT_ERROR,
     VALIDATION_FAILED,
@@ -78,6 +80,58 @@ class TestCLIGetArgs:
         assert args.from_hash == "from_commit_hash"
         assert args.to_hash == "to_commit_hash"
 
+    @patch("sys.argv", ["prog", "--from-hash", "from_commit_hash"])
+    def test__get_args__jobs_defaults_to_one(self, *_):
+        args = get_args()
+        assert args.jobs == 1
+
+    @patch("sys.argv", ["prog", "--from-hash", "from_commit_hash", "--jobs", "4"])
+    def test__get_args__with_jobs(self, *_):
+        args = get_args()
+        assert args.jobs == 4
+
+    @pytest.mark.parametrize("jobs", ["0", "-1", "invalid"])
+    def test__get_args__with_invalid_jobs(self, jobs):
+        with patch("sys.argv", ["prog", "--from-hash", "from_commit_hash", "-j", jobs]):
+            with pytest.raises(SystemExit) as ex:
+                get_args()
+        assert ex.value.code == 2
+
+    @patch("sys.argv", ["prog", "--from-hash", "start_commit_hash", "--cache"])
+    def test__get_args__with_cache(self, *_):
+        args = get_args()
+        assert args.cache is True
+
+    @patch("sys.argv", ["prog", "--serve"])
+    def test__get_args__with_serve(self, *_):
+        args = get_args()
+        assert args.serve is True
+        assert args.socket is False
+        assert args.socket_path is None
+
+    @patch("sys.argv", ["prog", "--serve", "commit_msg"])
+    def test__get_args__fails_with_serve_and_commit_message(self, *_):
+        with pytest.raises(SystemExit) as ex:
+            get_args()
+        assert ex.value.code == 2
+
+    @patch("sys.argv", ["prog", "--socket", "commit_msg"])
+    def test__get_args__with_socket_and_commit_message(self, *_):
+        args = get_args()
+        assert args.socket is True
+        assert args.socket_path is None
+        assert args.commit_message == "commit_msg"
+
+    @patch(
+        "sys.argv",
+        ["prog", "--socket", "--socket-path", "/tmp/cl.sock", "commit_msg"],
+    )
+    def test__get_args__with_socket_path(self, *_):
+        args = get_args()
+        assert args.socket is True
+        assert args.socket_path == "/tmp/cl.sock"
+        assert args.commit_message == "commit_msg"
+
     @patch("sys.argv", ["prog", "--skip-detail", "commit_msg"])
     def test__get_args__with_skip_detail(self, *_):
         args = get_args()
@@ -236,7 +290,7 @@ class TestCLIMain:
         "commitlint.cli.get_args",
         return_value=ArgsMock(hash="commit_hash"),
     )
-    @patch("commitlint.cli.get_commit_message_of_hash")
+    @patch("commitlint.git_helpers.get_commit_message_of_hash")
     def test__main__valid_commit_message_with_hash(
         self,
         mock_get_commit_message_of_hash,
@@ -252,7 +306,7 @@ class TestCLIMain:
         "commitlint.cli.get_args",
         return_value=ArgsMock(hash="commit_hash"),
     )
-    @patch("commitlint.cli.get_commit_message_of_hash")
+    @patch("commitlint.git_helpers.get_commit_message_of_hash")
     def test__main__invalid_commit_message_with_hash(
         self,
         mock_get_commit_message_of_hash,
@@ -277,19 +331,21 @@ class TestCLIMain:
 
     @patch(
         "commitlint.cli.get_args",
-        return_value=ArgsMock(from_hash="start_commit_hash", to_hash="end_commit_hash"),
+        return_value=ArgsMock(
+            from_hash="start_commit_hash", to_hash="end_commit_hash", jobs=1
+        ),
     )
-    @patch("commitlint.cli.get_commit_messages_of_hash_range")
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
     def test__main__valid_commit_message_with_hash_range(
         self,
-        mock_get_commit_messages,
+        mock_get_commits,
         _mock_get_args,
         _mock_output_error,
         mock_output_success,
     ):
-        mock_get_commit_messages.return_value = [
-            "feat: commit message 1",
-            "fix: commit message 2",
+        mock_get_commits.return_value = [
+            GitCommit("commit_hash_1", "feat: commit message 1"),
+            GitCommit("commit_hash_2", "fix: commit message 2"),
         ]
         main()
         mock_output_success.assert_called_with(f"{VALIDATION_SUCCESSFUL}")
@@ -297,25 +353,201 @@ class TestCLIMain:
     @patch(
         "commitlint.cli.get_args",
         return_value=ArgsMock(
-            from_hash="invalid_start_hash", to_hash="end_commit_hash"
+            from_hash="invalid_start_hash", to_hash="end_commit_hash", jobs=1
         ),
     )
-    @patch("commitlint.cli.get_commit_messages_of_hash_range")
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
     def test__main__invalid_commit_message_with_hash_range(
         self,
-        mock_get_commit_messages,
+        mock_get_commits,
         _mock_get_args,
         _mock_output_error,
         _mock_output_success,
     ):
-        mock_get_commit_messages.return_value = [
-            "Invalid commit message 1",
-            "Invalid commit message 2",
+        mock_get_commits.return_value = [
+            GitCommit("commit_hash_1", "Invalid commit message 1"),
+            GitCommit("commit_hash_2", "Invalid commit message 2"),
+        ]
+
+        with pytest.raises(SystemExit):
+            main()
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            from_hash="start_commit_hash", to_hash="end_commit_hash", jobs=1
+        ),
+    )
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
+    def test__main__invalid_commit_message_with_hash_range_shows_commit_hash(
+        self,
+        mock_get_commits,
+        _mock_get_args,
+        mock_output_error,
+        _mock_output_success,
+    ):
+        mock_get_commits.return_value = [
+            GitCommit("commit_hash_1", "feat: commit message 1"),
+            GitCommit("commit_hash_2", "Invalid commit message 2"),
         ]
 
         with pytest.raises(SystemExit):
             main()
 
+        mock_output_error.assert_has_calls(
+            [
+                call("⧗ Commit: commit_hash_2"),
+                call("⧗ Input:\nInvalid commit message 2\n"),
+                call("✖ Found 1 error(s)."),
+                call(f"- {INCORRECT_FORMAT_ERROR}"),
+            ]
+        )
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            from_hash="start_commit_hash", to_hash="end_commit_hash", jobs=2
+        ),
+    )
+    @patch("commitlint.linter.iter_lint_commit_messages")
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
+    def test__main__hash_range_with_jobs(
+        self,
+        mock_get_commits,
+        mock_iter_lint_commit_messages,
+        _mock_get_args,
+        _mock_output_error,
+        mock_output_success,
+    ):
+        mock_get_commits.return_value = [
+            GitCommit("commit_hash_1", "feat: commit message 1"),
+        ]
+        mock_iter_lint_commit_messages.return_value = [
+            LintResult(0, "feat: commit message 1", True, [])
+        ]
+
+        main()
+
+        _, kwargs = mock_iter_lint_commit_messages.call_args
+        assert kwargs["jobs"] == 2
+        mock_output_success.assert_called_with(f"{VALIDATION_SUCCESSFUL}")
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            from_hash="start_commit_hash", to_hash="end_commit_hash", jobs=1, cache=True
+        ),
+    )
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
+    @patch("commitlint.lint_cache.open_lint_cache")
+    def test__main__hash_range_with_cache(
+        self,
+        mock_open_lint_cache,
+        mock_get_commits,
+        _mock_get_args,
+        mock_output_error,
+        _mock_output_success,
+    ):
+        cache = mock_open_lint_cache.return_value
+        cache.iter_unknown.side_effect = lambda commits: (
+            commit for commit in commits if commit.commit_hash != "commit_hash_1"
+        )
+        mock_get_commits.return_value = [
+            GitCommit("commit_hash_1", "Invalid but cached commit message"),
+            GitCommit("commit_hash_2", "feat: commit message 2"),
+            GitCommit("commit_hash_3", "Invalid commit message 3"),
+        ]
+
+        with pytest.raises(SystemExit):
+            main()
+
+        mock_open_lint_cache.assert_called_once_with(None)
+        cache.add_valid.assert_called_once_with("commit_hash_2")
+        cache.close.assert_called_once_with()
+        mock_output_error.assert_any_call("⧗ Commit: commit_hash_3")
+        assert call("⧗ Commit: commit_hash_1") not in mock_output_error.mock_calls
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            from_hash="start_commit_hash", to_hash="end_commit_hash", jobs=1, cache=True
+        ),
+    )
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
+    @patch("commitlint.lint_cache.open_lint_cache", return_value=None)
+    def test__main__hash_range_with_unavailable_cache(
+        self,
+        _mock_open_lint_cache,
+        mock_get_commits,
+        _mock_get_args,
+        _mock_output_error,
+        mock_output_success,
+    ):
+        mock_get_commits.return_value = [
+            GitCommit("commit_hash_1", "feat: commit message 1"),
+        ]
+
+        main()
+
+        mock_output_success.assert_called_with(f"{VALIDATION_SUCCESSFUL}")
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            from_hash="start_commit_hash", to_hash="end_commit_hash", jobs=1
+        ),
+    )
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
+    def test__main__hash_range_memoizes_duplicate_commit_messages(
+        self,
+        mock_get_commits,
+        _mock_get_args,
+        mock_output_error,
+        _mock_output_success,
+    ):
+        mock_get_commits.return_value = [
+            GitCommit(f"commit_hash_{index}", "Invalid commit message")
+            for index in range(3)
+        ]
+
+        with patch("commitlint.console.verbose") as mock_verbose:
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_verbose.assert_any_call("lint memo: 2 hit(s), 1 miss(es)")
+        mock_output_error.assert_any_call("⧗ Commit: commit_hash_2")
+        # the memo is disabled after the range
+        assert get_lint_memo_info().maxsize == 0
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            from_hash="start_commit_hash", to_hash="end_commit_hash", jobs=2
+        ),
+    )
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
+    def test__main__hash_range_with_jobs_skips_memo(
+        self,
+        mock_get_commits,
+        _mock_get_args,
+        _mock_output_error,
+        mock_output_success,
+    ):
+        mock_get_commits.return_value = [
+            GitCommit(f"commit_hash_{index}", "feat: commit message")
+            for index in range(3)
+        ]
+
+        with patch("commitlint.console.verbose") as mock_verbose:
+            main()
+
+        # the memo of the main process is not used by the worker processes
+        assert not any(
+            call_args.args[0].startswith("lint memo")
+            for call_args in mock_verbose.call_args_list
+        )
+        mock_output_success.assert_called_with(f"{VALIDATION_SUCCESSFUL}")
+
     # main : exception handling
 
     @patch(
@@ -323,7 +555,7 @@ class TestCLIMain:
         return_value=ArgsMock(commit_message="feat: commit message"),
     )
     @patch(
-        "commitlint.cli.lint_commit_message",
+        "commitlint.linter.lint_commit_message",
     )
     def test__main__handle_exceptions(
         self,
@@ -383,6 +615,99 @@ class TestCLIMain:
         with pytest.raises(SystemExit):
             main()
 
+    # main : daemon
+
+    @patch("commitlint.cli.get_args", return_value=ArgsMock(serve=True))
+    @patch("commitlint.daemon.serve")
+    def test__main__serve(
+        self, mock_serve, _mock_get_args, _mock_output_error, _mock_output_success
+    ):
+        with patch(
+            "commitlint.daemon_client.get_default_socket_path",
+            return_value="/tmp/cl.sock",
+        ):
+            main()
+
+        mock_serve.assert_called_once_with("/tmp/cl.sock")
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(serve=True, socket_path="/tmp/custom.sock"),
+    )
+    @patch("commitlint.daemon.serve")
+    def test__main__serve_with_socket(
+        self, mock_serve, _mock_get_args, _mock_output_error, _mock_output_success
+    ):
+        main()
+        mock_serve.assert_called_once_with("/tmp/custom.sock")
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(
+            commit_message="feat: valid", socket=True, socket_path="/tmp/cl.sock"
+        ),
+    )
+    @patch(
+        "commitlint.daemon_client.lint_commit_message_via_daemon",
+        return_value=(False, [INCORRECT_FORMAT_ERROR]),
+    )
+    def test__main__lints_using_daemon(
+        self,
+        mock_lint_via_daemon,
+        _mock_get_args,
+        mock_output_error,
+        _mock_output_success,
+    ):
+        with patch("commitlint.linter.lint_commit_message") as mock_lint:
+            with pytest.raises(SystemExit):
+                main()
+
+        mock_lint_via_daemon.assert_called_once_with(
+            "feat: valid", None, False, "/tmp/cl.sock"
+        )
+        mock_lint.assert_not_called()
+        mock_output_error.assert_has_calls([call(f"- {INCORRECT_FORMAT_ERROR}")])
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(commit_message="feat: valid", socket=True),
+    )
+    @patch("commitlint.daemon_client.lint_commit_message_via_daemon", return_value=None)
+    def test__main__falls_back_without_daemon(
+        self,
+        mock_lint_via_daemon,
+        _mock_get_args,
+        _mock_output_error,
+        mock_output_success,
+    ):
+        with patch(
+            "commitlint.daemon_client.get_default_socket_path",
+            return_value="/tmp/cl.sock",
+        ):
+            main()
+
+        mock_lint_via_daemon.assert_called_once_with(
+            "feat: valid", None, False, "/tmp/cl.sock"
+        )
+        mock_output_success.assert_called_with(VALIDATION_SUCCESSFUL)
+
+    @patch(
+        "commitlint.cli.get_args",
+        return_value=ArgsMock(commit_message="feat: valid", socket_path="/tmp/cl.sock"),
+    )
+    @patch("commitlint.daemon_client.lint_commit_message_via_daemon")
+    def test__main__socket_path_without_socket(
+        self,
+        mock_lint_via_daemon,
+        _mock_get_args,
+        _mock_output_error,
+        mock_output_success,
+    ):
+        main()
+
+        mock_lint_via_daemon.assert_not_called()
+        mock_output_success.assert_called_with(VALIDATION_SUCCESSFUL)
+
 
 class TestCLIMainQuiet:
     # main : quiet (directly checking stdout and stderr)
@@ -418,17 +743,20 @@ class TestCLIMainQuiet:
     @patch(
         "commitlint.cli.get_args",
         return_value=ArgsMock(
-            from_hash="start_commit_hash", to_hash="end_commit_hash", quiet=True
+            from_hash="start_commit_hash",
+            to_hash="end_commit_hash",
+            jobs=1,
+            quiet=True,
         ),
     )
-    @patch("commitlint.cli.get_commit_messages_of_hash_range")
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
     @patch("sys.stdout.write")
     def test__valid_commit_message_with_hash_range_in_quiet(
-        self, mock_stdout_write, mock_get_commit_messages, *_
+        self, mock_stdout_write, mock_get_commits, *_
     ):
-        mock_get_commit_messages.return_value = [
-            "feat: commit message 1",
-            "fix: commit message 2",
+        mock_get_commits.return_value = [
+            GitCommit("commit_hash_1", "feat: commit message 1"),
+            GitCommit("commit_hash_2", "fix: commit message 2"),
         ]
         main()
         mock_stdout_write.assert_not_called()
@@ -436,22 +764,25 @@ class TestCLIMainQuiet:
     @patch(
         "commitlint.cli.get_args",
         return_value=ArgsMock(
-            from_hash="start_commit_hash", to_hash="end_commit_hash", quiet=True
+            from_hash="start_commit_hash",
+            to_hash="end_commit_hash",
+            jobs=1,
+            quiet=True,
         ),
     )
-    @patch("commitlint.cli.get_commit_messages_of_hash_range")
+    @patch("commitlint.git_helpers.iter_commits_of_hash_range")
     @patch("sys.stdout.write")
     @patch("sys.stderr.write")
     def test__invalid_commit_message_with_hash_range_in_quiet(
         self,
         mock_stderr_write,
         mock_stdout_write,
-        mock_get_commit_messages,
+        mock_get_commits,
         *_,
     ):
-        mock_get_commit_messages.return_value = [
-            "Invalid commit message 1",
-            "Invalid commit message 2",
+        mock_get_commits.return_value = [
+            GitCommit("commit_hash_1", "Invalid commit message 1"),
+            GitCommit("commit_hash_2", "Invalid commit message 2"),
         ]
 
         with pytest.raises(SystemExit):
@@ -0,0 +1,118 @@
+# type: ignore
+# pylint: disable=all
+"""
+Import time budget of the CLI, which runs on every commit through the commit-msg
+hook. See `benchmarks/run.py --importtime` for the detailed numbers.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import commitlint
+
+SRC_PATH = os.path.dirname(os.path.dirname(commitlint.__file__))
+
+# modules imported on top of the bare interpreter startup
+IMPORTED_MODULES_BUDGET = 60
+# cumulative import time of the commitlint modules, generous to avoid flakiness
+IMPORT_TIME_BUDGET_US = 100_000
+
+# heavy modules that are only needed by some code paths
+DEFERRED_MODULES = (
+    "subprocess",
+    "concurrent.futures",
+    "multiprocessing",
+    "hashlib",
+    "threading",
+)
+
+
+def _importtime(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": SRC_PATH},
+    )
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), level, int(cumulative_us)))
+    return imports
+
+
+@pytest.fixture(scope="module")
+def baseline_modules():
+    return {name for name, _, _ in _importtime("pass")}
+
+
+@pytest.mark.parametrize(
+    "code, deferred_modules",
+    [
+        # --help, --version
+        (
+            "import commitlint.cli",
+            (*DEFERRED_MODULES, "commitlint.linter", "commitlint.git_helpers"),
+        ),
+        # --file and direct commit message
+        (
+            "import commitlint.cli, commitlint.linter",
+            (*DEFERRED_MODULES, "commitlint.git_helpers"),
+        ),
+        # --socket, the daemon client
+        (
+            "import commitlint.cli, commitlint.daemon_client",
+            (
+                *DEFERRED_MODULES,
+                "commitlint.linter",
+                "commitlint.git_helpers",
+                "commitlint.daemon",
+                "socketserver",
+                "tempfile",
+                "shutil",
+                "random",
+            ),
+        ),
+    ],
+)
+def test__cli__import_budget(baseline_modules, code, deferred_modules):
+    _importtime(code)  # writes the bytecode cache
+    imports = _importtime(code)
+    modules = {name for name, _, _ in imports}
+
+    assert not modules & set(deferred_modules)
+    assert len(modules - baseline_modules) <= IMPORTED_MODULES_BUDGET
+
+    import_time_us = sum(
+        cumulative_us
+        for name, level, cumulative_us in imports
+        if level == 0 and name.startswith("commitlint")
+    )
+    assert import_time_us <= IMPORT_TIME_BUDGET_US
+
+
+def test__commitlint__lazy_exports():
+    code = (
+        "import sys, commitlint; "
+        "assert 'commitlint.linter' not in sys.modules; "
+        "assert commitlint.lint_commit_message('feat: add') == (True, []); "
+        "assert 'commitlint.linter' in sys.modules"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={**os.environ, "PYTHONPATH": SRC_PATH},
+    )
+
+
+def test__commitlint__unknown_attribute():
+    with pytest.raises(AttributeError):
+        commitlint.unknown
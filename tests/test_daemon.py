@@ -0,0 +1,185 @@
+# type: ignore
+# pylint: disable=all
+import json
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from commitlint.daemon import LintServer, serve
+from commitlint.daemon_client import (
+    get_default_socket_path,
+    lint_commit_message_via_daemon,
+)
+from commitlint.exceptions import CommitlintException
+from commitlint.linter import lint_commit_message
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported"
+)
+
+
+@pytest.fixture
+def socket_path():
+    # short path, the length of Unix socket paths is limited
+    directory = tempfile.mkdtemp(prefix="cl")
+    yield os.path.join(directory, "commitlint.sock")
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def server(socket_path):
+    server = LintServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "commit_message, skip_detail, strip_comments",
+    [
+        ("feat: add new feature", False, False),
+        ("invalid commit message", False, False),
+        ("invalid commit message", True, False),
+        ("feat: add\n\n# comment\nbody", False, True),
+        ("Merge branch 'main'", False, False),
+    ],
+)
+def test__lint_commit_message_via_daemon(
+    server, socket_path, commit_message, skip_detail, strip_comments
+):
+    result = lint_commit_message_via_daemon(
+        commit_message, skip_detail, strip_comments, socket_path
+    )
+
+    assert result == lint_commit_message(commit_message, skip_detail, strip_comments)
+
+
+def test__lint_commit_message_via_daemon__without_daemon(socket_path):
+    assert lint_commit_message_via_daemon("feat: add", socket_path=socket_path) is None
+
+
+def test__lint_commit_message_via_daemon__default_socket_path(
+    server, socket_path, monkeypatch
+):
+    monkeypatch.setenv("COMMITLINT_SOCKET", socket_path)
+
+    assert lint_commit_message_via_daemon("feat: add") == (True, [])
+
+
+def test__lint_commit_message_via_daemon__socket_of_other_user(server, socket_path):
+    with patch("commitlint.daemon_client.os.getuid", return_value=os.getuid() + 1):
+        result = lint_commit_message_via_daemon("feat: add", socket_path=socket_path)
+
+    assert result is None
+
+
+def test__lint_server__multiple_requests_per_connection(server, socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile("rwb") as stream:
+            for commit_message in ("feat: add", "invalid"):
+                stream.write(
+                    json.dumps({"commit_message": commit_message}).encode() + b"\n"
+                )
+                stream.flush()
+                response = json.loads(stream.readline())
+                assert response["success"] is (commit_message == "feat: add")
+
+
+def test__lint_server__invalid_request(server, socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(b'{"message": "feat: add"}\n')
+        with client.makefile("rb") as response_file:
+            response = json.loads(response_file.readline())
+
+    assert "error" in response
+
+
+def test__lint_commit_message_via_daemon__error_response(socket_path):
+    with patch(
+        "commitlint.linter.lint_commit_message", side_effect=TypeError("failure")
+    ):
+        with LintServer(socket_path) as server:
+            thread = threading.Thread(
+                target=server.serve_forever, args=(0.01,), daemon=True
+            )
+            thread.start()
+            result = lint_commit_message_via_daemon(
+                "feat: add", socket_path=socket_path
+            )
+            server.shutdown()
+
+    # linted in-process by the caller
+    assert result is None
+
+
+def test__lint_server__removes_socket_on_close(socket_path):
+    with LintServer(socket_path):
+        assert os.path.exists(socket_path)
+
+    assert not os.path.exists(socket_path)
+
+
+def test__lint_server__replaces_stale_socket(socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()  # the socket file is left behind, nobody listens
+
+    with LintServer(socket_path):
+        pass
+
+
+def test__lint_server__already_running(server, socket_path):
+    with pytest.raises(OSError):
+        LintServer(socket_path)
+
+
+def test__serve__already_running(server, socket_path):
+    with pytest.raises(CommitlintException):
+        serve(socket_path)
+
+
+@patch("commitlint.daemon.LintServer.serve_forever", side_effect=KeyboardInterrupt)
+def test__serve__stops_on_keyboard_interrupt(_mock_serve_forever, socket_path):
+    serve(socket_path)
+
+    assert not os.path.exists(socket_path)
+
+
+def test__serve__stops_on_sigterm(socket_path):
+    def _kill(*_):
+        os.kill(os.getpid(), signal.SIGTERM)
+        time.sleep(1)  # interrupted by the signal handler
+
+    previous_handler = signal.getsignal(signal.SIGTERM)
+    with patch("commitlint.daemon.LintServer.serve_forever", side_effect=_kill):
+        serve(socket_path)
+
+    assert not os.path.exists(socket_path)
+    assert signal.getsignal(signal.SIGTERM) is previous_handler
+
+
+def test__get_default_socket_path(monkeypatch):
+    monkeypatch.delenv("COMMITLINT_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.delenv("TMPDIR", raising=False)
+    assert get_default_socket_path() == f"/tmp/commitlint-{os.getuid()}.sock"
+
+    monkeypatch.setenv("TMPDIR", "/var/tmp")
+    assert get_default_socket_path() == f"/var/tmp/commitlint-{os.getuid()}.sock"
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert get_default_socket_path() == "/run/user/1000/commitlint.sock"
+
+    monkeypatch.setenv("COMMITLINT_SOCKET", "/run/commitlint.sock")
+    assert get_default_socket_path() == "/run/commitlint.sock"
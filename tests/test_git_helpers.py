@@ -1,20 +1,29 @@
 # type: ignore
 # pylint: disable=all
+import io
 import subprocess
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from commitlint.exceptions import (
     GitCommitNotFoundException,
+    GitException,
     GitInvalidCommitRangeException,
 )
 from commitlint.git_helpers import (
+    GIT_LOG_FORMAT,
+    GitCommit,
     get_commit_message_of_hash,
     get_commit_messages_of_hash_range,
+    get_git_dir,
+    iter_commit_messages_of_hash_range,
+    iter_commits_between,
+    iter_commits_of_hash_range,
 )
+from tests.fixtures.git_repo import create_git_repo, git
 
-DELIMITER = "========commit-delimiter========"
+OLD_DELIMITER = "========commit-delimiter========"
 
 
 @pytest.fixture
@@ -51,55 +60,252 @@ def test_get_commit_message_of_hash_failure(mock_subprocess):
         get_commit_message_of_hash(hash_value)
 
 
-@patch(
-    "commitlint.git_helpers.get_commit_message_of_hash",
-    return_value="From commit message",
-)
-def test_get_commit_messages_of_hash_range_success(
-    _mock_get_commit_message_of_hash, mock_subprocess
-):
+def mock_git_log(mock_subprocess, *outputs, returncode=0):
+    """Mocks `git log` processes, one for each of the given outputs."""
+    processes = []
+    for stdout in outputs:
+        process = MagicMock()
+        process.__enter__.return_value = process
+        process.stdout = io.BufferedReader(io.BytesIO(stdout))
+        process.stderr = io.BytesIO(b"error")
+        process.wait.return_value = returncode
+        process.returncode = returncode
+        processes.append(process)
+
+    mock_subprocess.Popen.side_effect = processes
+    return processes
+
+
+def git_log_output(*commits):
+    return b"".join(
+        f"{commit_hash}\0{message}\n\0\n".encode() for commit_hash, message in commits
+    )
+
+
+def test_get_commit_messages_of_hash_range_success(mock_subprocess):
     from_hash = "abc123"
     to_hash = "def456"
-    expected_output = (
-        "Commit message 1\n========commit-delimiter========\nCommit message 2"
+    mock_git_log(
+        mock_subprocess,
+        git_log_output(("abc123", "From commit message")),
+        git_log_output(
+            ("aaa111", "Commit message 1"),
+            ("bbb222", "Commit message 2"),
+        ),
     )
-    mock_subprocess.check_output.return_value = expected_output
 
     result = get_commit_messages_of_hash_range(from_hash, to_hash)
 
     assert result == ["From commit message", "Commit message 1", "Commit message 2"]
+    assert mock_subprocess.Popen.call_args_list == [
+        call(
+            ["git", "log", f"--format={GIT_LOG_FORMAT}", f"{from_hash}^!"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ),
+        call(
+            [
+                "git",
+                "log",
+                f"--format={GIT_LOG_FORMAT}",
+                "--reverse",
+                "--topo-order",
+                f"{from_hash}..{to_hash}",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ),
+    ]
+
+
+def test_iter_commits_of_hash_range_returns_commit_hashes(mock_subprocess):
+    mock_git_log(
+        mock_subprocess,
+        git_log_output(("abc123", "From commit message")),
+        git_log_output(("aaa111", "Commit message 1\n\nbody")),
+    )
+
+    result = list(iter_commits_of_hash_range("abc123", "def456"))
+
+    assert result == [
+        GitCommit("abc123", "From commit message"),
+        GitCommit("aaa111", "Commit message 1\n\nbody"),
+    ]
+
+
+@patch("commitlint.git_helpers.GIT_LOG_READ_SIZE", 5)
+def test_iter_commits_of_hash_range_records_across_chunks(mock_subprocess):
+    mock_git_log(
+        mock_subprocess,
+        git_log_output(("abc123", "From commit message")),
+        git_log_output(
+            ("aaa111", "Commit message 1\n\nbody ✓"),
+            ("bbb222", f"Commit message 2 with {OLD_DELIMITER}"),
+        ),
+    )
+
+    result = list(iter_commits_of_hash_range("abc123", "def456"))
+
+    assert result == [
+        GitCommit("abc123", "From commit message"),
+        GitCommit("aaa111", "Commit message 1\n\nbody ✓"),
+        GitCommit("bbb222", f"Commit message 2 with {OLD_DELIMITER}"),
+    ]
+
+
+def test_iter_commit_messages_of_hash_range_is_lazy(mock_subprocess):
+    mock_git_log(
+        mock_subprocess,
+        git_log_output(("abc123", "From commit message")),
+        git_log_output(("aaa111", "Commit 1")),
+    )
+
+    commit_messages = iter_commit_messages_of_hash_range("abc123", "def456")
+    mock_subprocess.Popen.assert_not_called()
+
+    assert next(commit_messages) == "From commit message"
+    mock_subprocess.Popen.assert_called_once()
+    assert list(commit_messages) == ["Commit 1"]
+    assert mock_subprocess.Popen.call_count == 2
+
+
+def test_get_commit_messages_of_hash_range_failure(mock_subprocess):
+    mock_git_log(mock_subprocess, b"", returncode=128)
+
+    with pytest.raises(GitInvalidCommitRangeException):
+        get_commit_messages_of_hash_range("abc123", "invalid_hash")
+
+
+def test_get_commit_messages_of_hash_range_with_git_repo(tmp_path, monkeypatch):
+    commit_messages = [
+        "feat: initial commit",
+        "fix: second commit\n\nwith body",
+        "docs: third commit",
+        "chore: fourth commit",
+    ]
+    commit_hashes = create_git_repo(tmp_path, commit_messages)
+    monkeypatch.chdir(tmp_path)
+
+    result = list(iter_commits_of_hash_range(commit_hashes[1], commit_hashes[3]))
+
+    assert result == [
+        GitCommit(commit_hash, commit_message)
+        for commit_hash, commit_message in zip(commit_hashes[1:], commit_messages[1:])
+    ]
+
+
+def test_get_commit_messages_of_hash_range_with_git_repo_invalid_range(
+    tmp_path, monkeypatch
+):
+    commit_hashes = create_git_repo(tmp_path, ["feat: initial commit"])
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(GitInvalidCommitRangeException):
+        get_commit_messages_of_hash_range(commit_hashes[0], "invalid_hash")
+
+
+def test_get_commit_messages_of_hash_range_with_git_repo_initial_commit(
+    tmp_path, monkeypatch
+):
+    commit_messages = ["feat: initial commit", "fix: second commit"]
+    commit_hashes = create_git_repo(tmp_path, commit_messages)
+    monkeypatch.chdir(tmp_path)
+
+    result = get_commit_messages_of_hash_range(commit_hashes[0])
+
+    assert result == commit_messages
+
+
+def test_get_commit_messages_of_hash_range_with_git_repo_same_commit_dates(
+    tmp_path, monkeypatch
+):
+    # commits created within the same second must still be ordered
+    monkeypatch.setenv("GIT_AUTHOR_DATE", "2024-01-01T00:00:00+0000")
+    monkeypatch.setenv("GIT_COMMITTER_DATE", "2024-01-01T00:00:00+0000")
+    commit_messages = [f"feat: commit {index}" for index in range(6)]
+    commit_hashes = create_git_repo(tmp_path, commit_messages)
+    monkeypatch.chdir(tmp_path)
+
+    result = get_commit_messages_of_hash_range(commit_hashes[2], commit_hashes[4])
+
+    assert result == commit_messages[2:5]
+
+
+def test_get_commit_messages_of_hash_range_with_git_repo_side_branch(
+    tmp_path, monkeypatch
+):
+    create_git_repo(tmp_path, ["feat: a"])
+    monkeypatch.chdir(tmp_path)
+    git(tmp_path, "checkout", "--quiet", "-b", "br")
+    git(tmp_path, "commit", "--quiet", "--allow-empty", "-m", "feat: y")
+    git(tmp_path, "checkout", "--quiet", "-")
+    git(tmp_path, "commit", "--quiet", "--allow-empty", "-m", "feat: c")
+    git(tmp_path, "merge", "--quiet", "--no-ff", "-m", "feat: merge", "br")
+
+    result = get_commit_messages_of_hash_range("br")
+
+    # the commit of `br` is first, before the commit of the range unrelated to it
+    assert result == ["feat: y", "feat: c", "feat: merge"]
+
+
+def test_iter_commits_between_with_git_repo(tmp_path, monkeypatch):
+    commit_messages = [f"feat: commit {index}" for index in range(4)]
+    commit_hashes = create_git_repo(tmp_path, commit_messages)
+    monkeypatch.chdir(tmp_path)
+
+    result = list(iter_commits_between(commit_hashes[0], commit_hashes[2]))
+
+    # the base is excluded
+    assert result == [
+        GitCommit(commit_hash, commit_message)
+        for commit_hash, commit_message in zip(commit_hashes[1:3], commit_messages[1:3])
+    ]
+
+
+def test_iter_commits_between_with_git_repo_invalid_range(tmp_path, monkeypatch):
+    commit_hashes = create_git_repo(tmp_path, ["feat: initial commit"])
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(GitInvalidCommitRangeException):
+        list(iter_commits_between("0" * 40, commit_hashes[0]))
+
+
+def test_get_git_dir_with_git_repo(tmp_path, monkeypatch):
+    create_git_repo(tmp_path, ["feat: initial commit"])
+    (tmp_path / "subdir").mkdir()
+    monkeypatch.chdir(tmp_path / "subdir")
+
+    assert get_git_dir() == str(tmp_path / ".git")
+
+
+def test_get_git_dir_with_relative_path(tmp_path, monkeypatch, mock_subprocess):
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+    mock_subprocess.check_output.return_value = ".git\n"
+
+    assert get_git_dir() == str(tmp_path / ".git")
     mock_subprocess.check_output.assert_called_once_with(
-        [
-            "git",
-            "log",
-            f"--format=%B{DELIMITER}",
-            "--reverse",
-            f"{from_hash}..{to_hash}",
-        ],
-        text=True,
-        stderr=subprocess.PIPE,
+        ["git", "rev-parse", "--git-common-dir"], text=True, stderr=subprocess.PIPE
     )
 
 
-@patch(
-    "commitlint.git_helpers.get_commit_message_of_hash",
-    return_value="From commit message",
+@pytest.mark.parametrize(
+    "output", ["--git-common-dir\n", ".git\n.git\n", "", "missing-dir\n"]
 )
-def test_get_commit_messages_of_hash_range_failure(
-    _mock_get_commit_message_of_hash, mock_subprocess
+def test_get_git_dir_with_unexpected_output(
+    tmp_path, monkeypatch, mock_subprocess, output
 ):
-    from_hash = "invalid_hash"
-    to_hash = "def456"
-    mock_subprocess.check_output.side_effect = subprocess.CalledProcessError(
-        returncode=1,
-        cmd=[
-            "git",
-            "log",
-            f"--format=%B{DELIMITER}",
-            "--reverse",
-            f"{from_hash}..{to_hash}",
-        ],
-    )
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+    mock_subprocess.check_output.return_value = output
 
-    with pytest.raises(GitInvalidCommitRangeException):
-        get_commit_messages_of_hash_range(from_hash, to_hash)
+    with pytest.raises(GitException):
+        get_git_dir()
+
+
+def test_get_git_dir_outside_git_repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+
+    with pytest.raises(GitException):
+        get_git_dir()
@@ -13,11 +13,11 @@ from tests.fixtures.actions_env import set_github_env_vars
 MOCK_PAYLOAD = {"key": "value"}
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture
 def github_event():
     set_github_env_vars()
     with patch("builtins.open", mock_open(read_data=json.dumps(MOCK_PAYLOAD))):
-        return GitHubEvent()
+        yield GitHubEvent()
 
 
 def test__github_event__initialization(github_event):
@@ -66,6 +66,121 @@ def test__github_event__str(github_event):
     assert "9" in event_str
 
 
+def test__github_event__payload_is_loaded_lazily(tmp_path, monkeypatch):
+    set_github_env_vars()
+    event_path = tmp_path / "event.json"
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+
+    # the payload file is not read on initialization
+    event = GitHubEvent()
+    event_path.write_text(json.dumps(MOCK_PAYLOAD))
+
+    with patch("json.load", wraps=json.load) as mock_json_load:
+        assert event.payload == MOCK_PAYLOAD
+        assert event.payload == MOCK_PAYLOAD
+
+    mock_json_load.assert_called_once()
+
+
+def test__github_event__slots(github_event):
+    with pytest.raises(AttributeError):
+        github_event.unknown = "value"
+
+
+PUSH_PAYLOAD = {
+    "ref": "refs/heads/main",
+    "repository": {"full_name": "opensource-nepal/commitlint", "topics": ["a"]},
+    "commits": [
+        {"id": "1", "message": "feat: first", "added": ["a.py"], "author": {}},
+        {"id": "2", "message": 'fix: second ]}, "escaped"\n\nbody'},
+    ],
+    "head_commit": {"id": "2", "message": "fix: second"},
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test__github_event__iter_commit_messages_streams_payload_file(
+    tmp_path, monkeypatch, indent
+):
+    set_github_env_vars()
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps(PUSH_PAYLOAD, indent=indent))
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+
+    event = GitHubEvent()
+    with patch("json.load") as mock_json_load:
+        messages = list(event.iter_commit_messages())
+
+    assert messages == [commit["message"] for commit in PUSH_PAYLOAD["commits"]]
+    # the whole payload is not loaded
+    mock_json_load.assert_not_called()
+
+
+def test__github_event__iter_commit_messages_reads_payload_file_in_chunks(
+    tmp_path, monkeypatch
+):
+    set_github_env_vars()
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps(PUSH_PAYLOAD, indent=2))
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+
+    files = []
+
+    def _open(*args, **kwargs):
+        files.append(open(*args, **kwargs))
+        return files[-1]
+
+    with patch("github_actions.action.event.EVENT_READ_SIZE", 16):
+        with patch("github_actions.action.event.open", _open):
+            messages = GitHubEvent().iter_commit_messages()
+            assert next(messages) == "feat: first"
+
+            # only the start of the file is read
+            assert files[0].tell() < event_path.stat().st_size
+            assert list(messages) == [
+                commit["message"] for commit in PUSH_PAYLOAD["commits"][1:]
+            ]
+
+
+def test__github_event__iter_commit_messages_with_loaded_payload(tmp_path, monkeypatch):
+    set_github_env_vars()
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps(PUSH_PAYLOAD))
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+
+    event = GitHubEvent()
+    assert event.payload == PUSH_PAYLOAD
+
+    assert list(event.iter_commit_messages()) == [
+        "feat: first",
+        PUSH_PAYLOAD["commits"][1]["message"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "payload", [{}, {"commits": []}, {"ref": "refs/tags/v1", "commits": None}]
+)
+def test__github_event__iter_commit_messages_without_commits(
+    tmp_path, monkeypatch, payload
+):
+    set_github_env_vars()
+    event_path = tmp_path / "event.json"
+    event_path.write_text(json.dumps(payload))
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+
+    assert list(GitHubEvent().iter_commit_messages()) == []
+
+
+def test__github_event__iter_commit_messages_invalid_payload(tmp_path, monkeypatch):
+    set_github_env_vars()
+    event_path = tmp_path / "event.json"
+    event_path.write_text('["not", "an", "object"]')
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+
+    with pytest.raises(ValueError):
+        list(GitHubEvent().iter_commit_messages())
+
+
 def test__github_event__env_error():
     os.environ.pop("GITHUB_EVENT_NAME")
     with pytest.raises(EnvironmentError):
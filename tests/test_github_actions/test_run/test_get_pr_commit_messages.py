@@ -6,13 +6,20 @@ from unittest.mock import mock_open, patch
 
 import pytest
 
+from github_actions.action import run
 from github_actions.action.event import GitHubEvent
 from github_actions.action.run import (
     MAX_PR_COMMITS,
     PER_PAGE_COMMITS,
+    PER_QUERY_COMMITS,
     get_pr_commit_messages,
 )
+from github_actions.action.utils import GITHUB_API_MAX_RETRIES
 from tests.fixtures.actions_env import set_github_env_vars
+from tests.fixtures.git_repo import create_git_repo
+from tests.fixtures.github_api_server import FakeGitHubAPIServer
+
+COMMITS_URL = "/repos/opensource-nepal/commitlint/pulls/10/commits"
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -20,87 +27,528 @@ def setup_env():
     set_github_env_vars()
 
 
-@patch("github_actions.action.run.request_github_api")
-@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
-def test__get_pr_commit_messages__single_page(
-    mock_request_github_api,
-):
-    # mock github api request
-    mock_request_github_api.return_value = (
-        200,
-        [{"commit": {"message": "feat: commit message"}}],
-    )
+@pytest.fixture
+def server(monkeypatch):
+    with FakeGitHubAPIServer() as server:
+        monkeypatch.setenv("GITHUB_API_URL", server.url)
+        yield server
 
-    payload = {"number": 10, "pull_request": {"commits": 2}}
+
+def _get_pr_commit_messages(payload):
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         event = GitHubEvent()
-        result = get_pr_commit_messages(event)
-        assert result == ["feat: commit message"]
+        event.payload  # the payload is loaded lazily
+    return get_pr_commit_messages(event)
+
 
-    mock_request_github_api.assert_called_once_with(
-        method="GET",
-        url="/repos/opensource-nepal/commitlint/pulls/10/commits",
-        token="token",
-        params={"per_page": PER_PAGE_COMMITS, "page": 1},
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__single_page(server):
+    server.add_response(
+        "GET", COMMITS_URL, data=[{"commit": {"message": "feat: commit message"}}]
     )
 
+    payload = {"number": 10, "pull_request": {"commits": 2}}
+    result = _get_pr_commit_messages(payload)
+    assert result == ["feat: commit message"]
 
-@patch("github_actions.action.run.request_github_api")
-@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
-def test__get_pr_commit_messages__multiple_page(
-    mock_request_github_api,
-):
-    # mock github api request
-    mock_request_github_api.side_effect = [
-        (
-            200,
-            [{"commit": {"message": "feat: commit message1"}}],
-        ),
-        (
-            200,
-            [{"commit": {"message": "feat: commit message2"}}],
-        ),
+    assert len(server.requests) == 1
+    assert server.requests[0].query == {"per_page": str(PER_PAGE_COMMITS), "page": "1"}
+    assert server.requests[0].headers["authorization"] == "Bearer token"
+
+
+def _add_pages(server, counts, link=True):
+    """Adds a response for each page, with `counts[i]` commits in page i + 1."""
+    last_page = len(counts)
+    for page, count in enumerate(counts, start=1):
+        headers = {}
+        if link and page < last_page:
+            url = f"{server.url}{COMMITS_URL}?per_page={PER_PAGE_COMMITS}"
+            headers["Link"] = (
+                f'<{url}&page={page + 1}>; rel="next", '
+                f'<{url}&page={last_page}>; rel="last"'
+            )
+        server.add_response(
+            "GET",
+            COMMITS_URL,
+            data=[
+                {"commit": {"message": f"feat: page {page} commit {index}"}}
+                for index in range(count)
+            ],
+            headers=headers,
+            query={"page": page},
+        )
+
+
+def _expected_messages(counts):
+    return [
+        f"feat: page {page} commit {index}"
+        for page, count in enumerate(counts, start=1)
+        for index in range(count)
     ]
 
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__multiple_page(server):
+    counts = [PER_PAGE_COMMITS, 20]
+    _add_pages(server, counts)
+
+    payload = {"number": 10, "pull_request": {"commits": 120}}
+    result = _get_pr_commit_messages(payload)
+    # the pages are reassembled in order
+    assert result == _expected_messages(counts)
+
+    assert sorted(request.query["page"] for request in server.requests) == ["1", "2"]
+    assert all(
+        request.query["per_page"] == str(PER_PAGE_COMMITS)
+        for request in server.requests
+    )
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__exact_multiple_of_page_size(server):
+    counts = [PER_PAGE_COMMITS, PER_PAGE_COMMITS]
+    _add_pages(server, counts)
+
+    payload = {"number": 10, "pull_request": {"commits": 2 * PER_PAGE_COMMITS}}
+    result = _get_pr_commit_messages(payload)
+    assert result == _expected_messages(counts)
+
+    # no extra empty page is requested
+    assert len(server.requests) == 2
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__stops_at_short_page(server):
+    # the payload count is stale, the first page is the last one
+    _add_pages(server, [5])
+
+    payload = {"number": 10, "pull_request": {"commits": 2 * PER_PAGE_COMMITS}}
+    result = _get_pr_commit_messages(payload)
+    assert result == _expected_messages([5])
+    assert len(server.requests) == 1
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__uses_link_header_for_last_page(server):
+    # the payload count is stale, the `Link` header has the actual last page
+    counts = [PER_PAGE_COMMITS, PER_PAGE_COMMITS, 1]
+    _add_pages(server, counts)
+
+    payload = {"number": 10, "pull_request": {"commits": PER_PAGE_COMMITS + 1}}
+    result = _get_pr_commit_messages(payload)
+    assert result == _expected_messages(counts)
+    assert len(server.requests) == 3
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__without_link_header(server):
+    counts = [PER_PAGE_COMMITS, PER_PAGE_COMMITS, 1]
+    _add_pages(server, counts, link=False)
+
+    payload = {"number": 10, "pull_request": {"commits": 2 * PER_PAGE_COMMITS + 1}}
+    result = _get_pr_commit_messages(payload)
+    assert result == _expected_messages(counts)
+    assert len(server.requests) == 3
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__concurrent_pages(server):
+    counts = [PER_PAGE_COMMITS] * 2 + [1]
+    _add_pages(server, counts)
+
+    payload = {"number": 10, "pull_request": {"commits": 2 * PER_PAGE_COMMITS + 1}}
+    with patch(
+        "github_actions.action.run.ThreadPoolExecutor",
+        wraps=run.ThreadPoolExecutor,
+    ) as executor:
+        result = _get_pr_commit_messages(payload)
+
+    # the pages after the first one are fetched concurrently
+    executor.assert_called_once_with(max_workers=2)
+    assert result == _expected_messages(counts)
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+@patch("github_actions.action.utils.time.sleep")
+def test__get_pr_commit_messages__api_failure(mock_sleep, server):
+    server.add_response("GET", COMMITS_URL, status=500, data={"message": "error"})
+
     payload = {"number": 10, "pull_request": {"commits": 60}}
-    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
-        event = GitHubEvent()
-        result = get_pr_commit_messages(event)
-        assert result == ["feat: commit message1", "feat: commit message2"]
+    with pytest.raises(SystemExit):
+        _get_pr_commit_messages(payload)
+
+    # the server errors are retried before failing
+    assert len(server.requests) == 1 + GITHUB_API_MAX_RETRIES
+    assert mock_sleep.call_count == GITHUB_API_MAX_RETRIES
+
 
-    assert mock_request_github_api.call_count == 2
-    mock_request_github_api.assert_any_call(
-        method="GET",
-        url="/repos/opensource-nepal/commitlint/pulls/10/commits",
-        token="token",
-        params={"per_page": PER_PAGE_COMMITS, "page": 1},
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+@patch("github_actions.action.utils.time.sleep")
+def test__get_pr_commit_messages__retries_rate_limited_page(mock_sleep, server):
+    server.add_response(
+        "GET",
+        COMMITS_URL,
+        status=403,
+        data={"message": "You have exceeded a secondary rate limit."},
+        headers={"Retry-After": "2"},
+    )
+    server.add_response(
+        "GET", COMMITS_URL, data=[{"commit": {"message": "feat: commit message"}}]
     )
 
-    mock_request_github_api.assert_any_call(
-        method="GET",
-        url="/repos/opensource-nepal/commitlint/pulls/10/commits",
-        token="token",
-        params={"per_page": PER_PAGE_COMMITS, "page": 2},
+    payload = {"number": 10, "pull_request": {"commits": 1}}
+    assert _get_pr_commit_messages(payload) == ["feat: commit message"]
+    assert len(server.requests) == 2
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+@patch("github_actions.action.utils.time.sleep")
+def test__get_pr_commit_messages__api_failure_on_later_page(mock_sleep, server):
+    _add_pages(server, [PER_PAGE_COMMITS])
+    server.add_response(
+        "GET", COMMITS_URL, status=500, data={"message": "error"}, query={"page": 2}
     )
 
+    payload = {"number": 10, "pull_request": {"commits": PER_PAGE_COMMITS + 1}}
+    with pytest.raises(SystemExit):
+        _get_pr_commit_messages(payload)
+
+
+def _pr_payload(base_sha, head_sha, total_commits):
+    return {
+        "number": 10,
+        "pull_request": {
+            "commits": total_commits,
+            "base": {"sha": base_sha},
+            "head": {"sha": head_sha},
+        },
+    }
+
 
-@patch("github_actions.action.run.request_github_api")
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
-def test__get_pr_commit_messages__api_failure(
-    mock_request_github_api,
+def test__get_pr_commit_messages__exceed_max_commits_without_git_history(
+    tmp_path, monkeypatch
 ):
-    mock_request_github_api.return_value = (500, None)
-    payload = {"number": 10, "pull_request": {"commits": 60}}
-    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
-        with pytest.raises(SystemExit):
-            event = GitHubEvent()
-            get_pr_commit_messages(event)
+    monkeypatch.chdir(tmp_path)  # not a git repository
+    payload = _pr_payload("a" * 40, "b" * 40, MAX_PR_COMMITS + 1)
+    with pytest.raises(SystemExit):
+        _get_pr_commit_messages(payload)
 
 
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
-def test__get_pr_commit_messages__exceed_max_commits():
-    payload = {"number": 10, "pull_request": {"commits": MAX_PR_COMMITS + 1}}
-    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
-        with pytest.raises(SystemExit):
-            event = GitHubEvent()
-            get_pr_commit_messages(event)
+def test__get_pr_commit_messages__exceed_max_commits_from_git_history(
+    tmp_path, monkeypatch, server
+):
+    commit_messages = [f"feat: commit {index}" for index in range(MAX_PR_COMMITS + 2)]
+    commit_hashes = create_git_repo(tmp_path, commit_messages)
+    monkeypatch.chdir(tmp_path)
+
+    payload = _pr_payload(commit_hashes[0], commit_hashes[-1], MAX_PR_COMMITS + 1)
+    result = _get_pr_commit_messages(payload)
+
+    assert result == commit_messages[1:]
+    assert server.requests == []
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__exceed_max_commits_with_shallow_git_history(
+    tmp_path, monkeypatch
+):
+    commit_hashes = create_git_repo(tmp_path, ["feat: base", "feat: head"])
+    monkeypatch.chdir(tmp_path)
+
+    # the history has fewer commits than the PR
+    payload = _pr_payload(commit_hashes[0], commit_hashes[1], MAX_PR_COMMITS + 1)
+    with pytest.raises(SystemExit):
+        _get_pr_commit_messages(payload)
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "auto"},
+)
+def test__get_pr_commit_messages__auto_source_from_git_history(
+    tmp_path, monkeypatch, server
+):
+    commit_messages = ["feat: base", "feat: commit 1", "fix: commit 2"]
+    commit_hashes = create_git_repo(tmp_path, commit_messages)
+    monkeypatch.chdir(tmp_path)
+
+    payload = _pr_payload(commit_hashes[0], commit_hashes[-1], 2)
+    result = _get_pr_commit_messages(payload)
+
+    assert result == commit_messages[1:]
+    assert server.requests == []
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "auto"},
+)
+def test__get_pr_commit_messages__auto_source_falls_back_to_api(
+    tmp_path, monkeypatch, server
+):
+    monkeypatch.chdir(tmp_path)  # not a git repository
+    server.add_response(
+        "GET", COMMITS_URL, data=[{"commit": {"message": "feat: commit message"}}]
+    )
+
+    payload = _pr_payload("a" * 40, "b" * 40, 1)
+    result = _get_pr_commit_messages(payload)
+
+    assert result == ["feat: commit message"]
+    assert len(server.requests) == 1
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "git"},
+)
+def test__get_pr_commit_messages__git_source_without_git_history(
+    tmp_path, monkeypatch, server
+):
+    monkeypatch.chdir(tmp_path)  # not a git repository
+
+    payload = _pr_payload("a" * 40, "b" * 40, 1)
+    with pytest.raises(SystemExit):
+        _get_pr_commit_messages(payload)
+
+    assert server.requests == []
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__api_source_skips_git_history(
+    tmp_path, monkeypatch, server
+):
+    commit_hashes = create_git_repo(tmp_path, ["feat: base", "feat: from git"])
+    monkeypatch.chdir(tmp_path)
+    server.add_response(
+        "GET", COMMITS_URL, data=[{"commit": {"message": "feat: from api"}}]
+    )
+
+    payload = _pr_payload(commit_hashes[0], commit_hashes[1], 1)
+    result = _get_pr_commit_messages(payload)
+
+    assert result == ["feat: from api"]
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "invalid"},
+)
+def test__get_pr_commit_messages__invalid_source():
+    payload = _pr_payload("a" * 40, "b" * 40, 1)
+    with pytest.raises(ValueError):
+        _get_pr_commit_messages(payload)
+
+
+@patch.dict(
+    os.environ,
+    {**os.environ, "GITHUB_EVENT_NAME": "pull_request", "INPUT_SOURCE": "api"},
+)
+def test__get_pr_commit_messages__cache_dir(tmp_path, monkeypatch, server):
+    monkeypatch.setenv("INPUT_CACHE_DIR", str(tmp_path / "cache"))
+    server.add_response(
+        "GET",
+        COMMITS_URL,
+        data=[{"commit": {"message": "feat: commit message"}}],
+        headers={"ETag": '"v1"'},
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 1}}
+    assert _get_pr_commit_messages(payload) == ["feat: commit message"]
+    # re-run of the workflow
+    assert _get_pr_commit_messages(payload) == ["feat: commit message"]
+
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+
+
+@patch.dict(
+    os.environ,
+    {
+        **os.environ,
+        "GITHUB_EVENT_NAME": "pull_request",
+        "INPUT_SOURCE": "api",
+        "COMMITLINT_TOKEN_IS_DEFAULT": "true",
+    },
+)
+def test__get_pr_commit_messages__cache_dir_with_new_default_token(
+    tmp_path, monkeypatch, server
+):
+    monkeypatch.setenv("INPUT_CACHE_DIR", str(tmp_path / "cache"))
+    server.add_response(
+        "GET",
+        COMMITS_URL,
+        data=[{"commit": {"message": "feat: commit message"}}],
+        headers={"ETag": '"v1"'},
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 1}}
+    monkeypatch.setenv("INPUT_TOKEN", "run_1_token")
+    assert _get_pr_commit_messages(payload) == ["feat: commit message"]
+    # the `github.token` of the next run is a new token
+    monkeypatch.setenv("INPUT_TOKEN", "run_2_token")
+    assert _get_pr_commit_messages(payload) == ["feat: commit message"]
+
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+
+
+@patch.dict(
+    os.environ,
+    {
+        **os.environ,
+        "GITHUB_EVENT_NAME": "pull_request",
+        "INPUT_SOURCE": "api",
+        "COMMITLINT_TOKEN_IS_DEFAULT": "false",
+    },
+)
+def test__get_pr_commit_messages__cache_dir_with_custom_tokens(
+    tmp_path, monkeypatch, server
+):
+    monkeypatch.setenv("INPUT_CACHE_DIR", str(tmp_path / "cache"))
+    server.add_response(
+        "GET",
+        COMMITS_URL,
+        data=[{"commit": {"message": "feat: commit message"}}],
+        headers={"ETag": '"v1"'},
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 1}}
+    monkeypatch.setenv("INPUT_TOKEN", "custom_token")
+    assert _get_pr_commit_messages(payload) == ["feat: commit message"]
+    # another custom token may have another access
+    monkeypatch.setenv("INPUT_TOKEN", "other_custom_token")
+    assert _get_pr_commit_messages(payload) == ["feat: commit message"]
+
+    assert "if-none-match" not in server.requests[1].headers
+
+
+def _graphql_response(messages, end_cursor=None):
+    return {
+        "data": {
+            "repository": {
+                "pullRequest": {
+                    "commits": {
+                        "pageInfo": {
+                            "hasNextPage": end_cursor is not None,
+                            "endCursor": end_cursor,
+                        },
+                        "nodes": [
+                            {"commit": {"message": message}} for message in messages
+                        ],
+                    }
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def graphql_server(server, monkeypatch):
+    monkeypatch.setenv("GITHUB_GRAPHQL_URL", f"{server.url}/api/graphql")
+    monkeypatch.setenv("INPUT_SOURCE", "graphql")
+    return server
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__graphql_single_query(graphql_server):
+    graphql_server.add_response(
+        "POST", "/api/graphql", data=_graphql_response(["feat: commit message"])
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 1}}
+    result = _get_pr_commit_messages(payload)
+
+    assert result == ["feat: commit message"]
+    (request,) = graphql_server.requests
+    assert request.headers["authorization"] == "Bearer token"
+    assert request.json["variables"] == {
+        "owner": "opensource-nepal",
+        "name": "commitlint",
+        "number": 10,
+        "first": PER_QUERY_COMMITS,
+        "after": None,
+    }
+    assert "pullRequest(number: $number)" in request.json["query"]
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__graphql_cursor_pagination(graphql_server):
+    graphql_server.add_response(
+        "POST", "/api/graphql", data=_graphql_response(["feat: first"], "cursor1")
+    )
+    graphql_server.add_response(
+        "POST", "/api/graphql", data=_graphql_response(["fix: second"], "cursor2")
+    )
+    graphql_server.add_response(
+        "POST", "/api/graphql", data=_graphql_response(["docs: third"])
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 3}}
+    result = _get_pr_commit_messages(payload)
+
+    assert result == ["feat: first", "fix: second", "docs: third"]
+    assert [
+        request.json["variables"]["after"] for request in graphql_server.requests
+    ] == [
+        None,
+        "cursor1",
+        "cursor2",
+    ]
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__graphql_errors(graphql_server):
+    graphql_server.add_response(
+        "POST",
+        "/api/graphql",
+        data={"data": None, "errors": [{"message": "Could not resolve"}]},
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 1}}
+    with pytest.raises(SystemExit):
+        _get_pr_commit_messages(payload)
+
+
+@patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
+def test__get_pr_commit_messages__graphql_failure(graphql_server):
+    graphql_server.add_response(
+        "POST", "/api/graphql", status=401, data={"message": "Bad credentials"}
+    )
+
+    payload = {"number": 10, "pull_request": {"commits": 1}}
+    with pytest.raises(SystemExit):
+        _get_pr_commit_messages(payload)
@@ -23,6 +23,6 @@ def test__get_push_commit_messages__returns_push_commits():
             {"message": "fix(login): fix login message"},
         ]
     }
-    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload).encode())):
         commits = get_push_commit_messages(GitHubEvent())
         assert list(commits) == ["feat: valid message", "fix(login): fix login message"]
@@ -6,13 +6,14 @@ Integration test of `run.py` to ensure Github Action full functionality.
 
 import json
 import os
-import subprocess
 from unittest.mock import call, mock_open, patch
 
 import pytest
 
+from commitlint.linter import lint_commit_message
 from github_actions.action.run import run_action
 from tests.fixtures.actions_env import set_github_env_vars
+from tests.fixtures.github_api_server import FakeGitHubAPIServer
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -20,10 +21,17 @@ def setup_env():
     set_github_env_vars()
 
 
-@patch("subprocess.check_output", return_value="success")
+@pytest.fixture
+def server(monkeypatch):
+    with FakeGitHubAPIServer() as server:
+        monkeypatch.setenv("GITHUB_API_URL", server.url)
+        yield server
+
+
+@patch("github_actions.action.run.lint_commit_message", wraps=lint_commit_message)
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "push"})
 def test__run_action__push_event_full_integration_test_for_valid_commits(
-    mock_check_output,
+    mock_lint_commit_message,
 ):
     payload = {
         "commits": [
@@ -31,142 +39,106 @@ def test__run_action__push_event_full_integration_test_for_valid_commits(
             {"message": "fix(login): fix login message"},
         ]
     }
-    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload).encode())):
         run_action()
 
-    assert mock_check_output.call_count == 2
+    assert mock_lint_commit_message.call_count == 2
     expected_calls = [
-        call(
-            ["commitlint", "feat: valid message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-        call(
-            ["commitlint", "fix(login): fix login message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
+        call("feat: valid message"),
+        call("fix(login): fix login message"),
     ]
-    mock_check_output.assert_has_calls(expected_calls, any_order=False)
+    mock_lint_commit_message.assert_has_calls(expected_calls, any_order=False)
 
 
-@patch("subprocess.check_output", return_value="success")
+@patch("github_actions.action.run.lint_commit_message", wraps=lint_commit_message)
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "push"})
 def test__run_action__push_event_full_integration_test_for_invalid_commits(
-    mock_check_output,
+    mock_lint_commit_message,
 ):
-    # mock for commitlint command to return error
-    mock_check_output.side_effect = subprocess.CalledProcessError(
-        1, ["cmd"], "stdout", "stderr"
-    )
-
     payload = {
         "commits": [
             {"message": "feat: valid message"},
             {"message": "invalid commit message"},
         ]
     }
-    with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
+    with patch("builtins.open", mock_open(read_data=json.dumps(payload).encode())):
         with pytest.raises(SystemExit):
             run_action()
 
-    assert mock_check_output.call_count == 2
+    assert mock_lint_commit_message.call_count == 2
     expected_calls = [
-        call(
-            ["commitlint", "feat: valid message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-        call(
-            ["commitlint", "invalid commit message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
+        call("feat: valid message"),
+        call("invalid commit message"),
     ]
-    mock_check_output.assert_has_calls(expected_calls, any_order=False)
+    mock_lint_commit_message.assert_has_calls(expected_calls, any_order=False)
 
 
-@patch("github_actions.action.run.request_github_api")
-@patch("subprocess.check_output", return_value="success")
+@patch("github_actions.action.run.lint_commit_message", wraps=lint_commit_message)
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
 def test__run_action__pr_event_full_integration_test_for_valid_commits(
-    mock_check_output,
-    mock_request_github_api,
+    mock_lint_commit_message,
+    server,
 ):
-    # mock github api request
-    mock_request_github_api.return_value = (
-        200,
-        [
-            {
-                "commit": {"message": "feat: valid message"},
-            },
-            {
-                "commit": {"message": "fix(login): fix login message"},
-            },
+    server.add_response(
+        "GET",
+        "/repos/opensource-nepal/commitlint/pulls/10/commits",
+        data=[
+            {"commit": {"message": "feat: valid message"}},
+            {"commit": {"message": "fix(login): fix login message"}},
         ],
     )
 
-    payload = {"number": 10, "pull_request": {"commits": 2}}
+    # the commits are not in the local git history, so they are fetched from the API
+    payload = {
+        "number": 10,
+        "pull_request": {
+            "commits": 2,
+            "base": {"sha": "0" * 40},
+            "head": {"sha": "1" * 40},
+        },
+    }
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         run_action()
 
-    assert mock_check_output.call_count == 2
+    assert mock_lint_commit_message.call_count == 2
     expected_calls = [
-        call(
-            ["commitlint", "feat: valid message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-        call(
-            ["commitlint", "fix(login): fix login message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
+        call("feat: valid message"),
+        call("fix(login): fix login message"),
     ]
-    mock_check_output.assert_has_calls(expected_calls, any_order=False)
+    mock_lint_commit_message.assert_has_calls(expected_calls, any_order=False)
 
 
-@patch("github_actions.action.run.request_github_api")
-@patch("subprocess.check_output", return_value="success")
+@patch("github_actions.action.run.lint_commit_message", wraps=lint_commit_message)
 @patch.dict(os.environ, {**os.environ, "GITHUB_EVENT_NAME": "pull_request"})
 def test__run_action__pr_event_full_integration_test_for_invalid_commits(
-    mock_check_output,
-    mock_request_github_api,
+    mock_lint_commit_message,
+    server,
 ):
-    # mock for commitlint command to return error
-    mock_check_output.side_effect = subprocess.CalledProcessError(
-        1, ["cmd"], "stdout", "stderr"
-    )
-
-    # mock github api request
-    mock_request_github_api.return_value = (
-        200,
-        [
-            {
-                "commit": {"message": "feat: valid message"},
-            },
-            {
-                "commit": {"message": "invalid commit message"},
-            },
+    server.add_response(
+        "GET",
+        "/repos/opensource-nepal/commitlint/pulls/10/commits",
+        data=[
+            {"commit": {"message": "feat: valid message"}},
+            {"commit": {"message": "invalid commit message"}},
         ],
     )
 
-    payload = {"number": 10, "pull_request": {"commits": 2}}
+    # the commits are not in the local git history, so they are fetched from the API
+    payload = {
+        "number": 10,
+        "pull_request": {
+            "commits": 2,
+            "base": {"sha": "0" * 40},
+            "head": {"sha": "1" * 40},
+        },
+    }
     with patch("builtins.open", mock_open(read_data=json.dumps(payload))):
         with pytest.raises(SystemExit):
             run_action()
 
-    assert mock_check_output.call_count == 2
+    assert mock_lint_commit_message.call_count == 2
     expected_calls = [
-        call(
-            ["commitlint", "feat: valid message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
-        call(
-            ["commitlint", "invalid commit message", "--hide-input"],
-            text=True,
-            stderr=subprocess.PIPE,
-        ),
+        call("feat: valid message"),
+        call("invalid commit message"),
     ]
-    mock_check_output.assert_has_calls(expected_calls, any_order=False)
+    mock_lint_commit_message.assert_has_calls(expected_calls, any_order=False)
@@ -1,58 +1,54 @@
 # type: ignore
 # pylint: disable=all
 import os
-import subprocess
 from unittest.mock import patch
 
+from commitlint.config import config
+from commitlint.messages import INCORRECT_FORMAT_ERROR, VALIDATION_SUCCESSFUL
 from github_actions.action.run import run_commitlint
 
 
-@patch("subprocess.check_output", return_value="feat: valid commit message")
+@patch("sys.stdout.write")
 @patch.dict(os.environ, {**os.environ, "INPUT_VERBOSE": "False"})
-def test__run_commitlint__success(mock_check_output):
+def test__run_commitlint__success(mock_stdout_write):
     commit_message = "feat: add new feature"
 
     result = run_commitlint(commit_message)
 
     assert result == (True, None)
-    mock_check_output.assert_called_once_with(
-        ["commitlint", commit_message, "--hide-input"],
-        text=True,
-        stderr=subprocess.PIPE,
-    )
+    mock_stdout_write.assert_called_once_with(f"{VALIDATION_SUCCESSFUL}\n")
 
 
-@patch("subprocess.check_output")
+@patch("sys.stdout.write")
 @patch.dict(os.environ, {**os.environ, "INPUT_VERBOSE": "False"})
-def test__run_commitlint__failure(mock_check_output):
-    mock_check_output.side_effect = (
-        subprocess.CalledProcessError(1, "cmd", output="", stderr="Error"),
-    )
-
+def test__run_commitlint__failure(mock_stdout_write):
     commit_message = "invalid commit message"
     result = run_commitlint(commit_message)
 
-    assert result == (False, "Error")
-    mock_check_output.assert_called_once_with(
-        ["commitlint", commit_message, "--hide-input"],
-        text=True,
-        stderr=subprocess.PIPE,
+    assert result == (
+        False,
+        f"✖ Found 1 error(s).\n- {INCORRECT_FORMAT_ERROR}\n",
     )
+    mock_stdout_write.assert_not_called()
 
 
-@patch(
-    "subprocess.check_output",
-    return_value="feat: valid commit message",
-)
+@patch("github_actions.action.run.lint_commit_message", return_value=(True, []))
+@patch.dict(os.environ, {**os.environ, "INPUT_VERBOSE": "False"})
+def test__run_commitlint__strips_commit_message(mock_lint_commit_message):
+    run_commitlint("  feat: add new feature\n\n")
+
+    mock_lint_commit_message.assert_called_once_with("feat: add new feature")
+
+
+@patch("sys.stdout.write")
 @patch.dict(os.environ, {**os.environ, "INPUT_VERBOSE": "True"})
-def test__run_commitlint__verbose(mock_check_output):
+def test__run_commitlint__verbose(_mock_stdout_write):
     commit_message = "feat: add new feature"
 
-    result = run_commitlint(commit_message)
+    try:
+        result = run_commitlint(commit_message)
+        assert config.verbose is True
+    finally:
+        config.verbose = False
 
     assert result == (True, None)
-    mock_check_output.assert_called_once_with(
-        ["commitlint", commit_message, "--hide-input", "--verbose"],
-        text=True,
-        stderr=subprocess.PIPE,
-    )
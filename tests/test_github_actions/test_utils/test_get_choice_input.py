@@ -0,0 +1,26 @@
+# type: ignore
+# pylint: disable=all
+import os
+from unittest.mock import patch
+
+import pytest
+
+from github_actions.action.utils import get_choice_input
+
+CHOICES = ("auto", "git", "api")
+
+
+@patch.dict(os.environ, {"INPUT_TEST": "git"})
+def test__get_choice_input__returns_choice():
+    assert get_choice_input("test", CHOICES) == "git"
+
+
+@patch.dict(os.environ, {"INPUT_TEST": " API "})
+def test__get_choice_input__is_case_insensitive():
+    assert get_choice_input("test", CHOICES) == "api"
+
+
+@patch.dict(os.environ, {"INPUT_TEST": "random"})
+def test__get_choice_input__raises_ValueError_for_invalid_choice():
+    with pytest.raises(ValueError):
+        get_choice_input("test", CHOICES)
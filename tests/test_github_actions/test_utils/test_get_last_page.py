@@ -0,0 +1,32 @@
+# type: ignore
+# pylint: disable=all
+
+import pytest
+
+from github_actions.action.utils import get_last_page
+
+URL = "https://api.github.com/repos/owner/repo/pulls/1/commits"
+
+
+@pytest.mark.parametrize(
+    "link_header, expected",
+    [
+        (None, None),
+        ("", None),
+        (
+            f'<{URL}?per_page=100&page=2>; rel="next", '
+            f'<{URL}?per_page=100&page=3>; rel="last"',
+            3,
+        ),
+        (f'<{URL}?page=5&per_page=100>; rel="last"', 5),
+        # last page, there is no "last" link
+        (
+            f'<{URL}?per_page=100&page=1>; rel="first", '
+            f'<{URL}?per_page=100&page=2>; rel="prev"',
+            None,
+        ),
+        (f'<{URL}?per_page=100>; rel="last"', None),
+    ],
+)
+def test__get_last_page(link_header, expected):
+    assert get_last_page(link_header) == expected
@@ -0,0 +1,565 @@
+# type: ignore
+# pylint: disable=all
+import gzip
+import http.client
+import json
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from github_actions.action.utils import (
+    GITHUB_API_BACKOFF,
+    GITHUB_API_MAX_RATE_LIMIT_WAIT,
+    GITHUB_API_MAX_RETRIES,
+    GITHUB_API_TIMEOUT,
+    GitHubAPIClient,
+    GitHubAPIResponse,
+)
+from tests.fixtures.github_api_server import FakeGitHubAPIServer
+
+URL = "/repos/opensource-nepal/commitlint/pulls/1/commits"
+
+
+@pytest.fixture
+def server():
+    with FakeGitHubAPIServer() as server:
+        yield server
+
+
+class FakeClock:
+    """Clock advanced by the sleeps, recording them."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _client(server, clock, **kwargs):
+    return GitHubAPIClient(
+        "token", base_url=server.url, sleep=clock.sleep, clock=clock.time, **kwargs
+    )
+
+
+def test__github_api_client__reuses_connection(server):
+    server.add_response("GET", URL, data=[{"sha": "a"}])
+
+    with GitHubAPIClient("token", base_url=server.url) as client:
+        responses = [client.request("GET", URL, params={"page": 1}) for _ in range(3)]
+
+    assert [response.data for response in responses] == [[{"sha": "a"}]] * 3
+    assert len({request.client_port for request in server.requests}) == 1
+
+
+def test__github_api_client__returns_headers(server):
+    server.add_response("GET", URL, data=[], headers={"X-Custom": "value"})
+
+    with GitHubAPIClient("token", base_url=server.url) as client:
+        response = client.request("GET", URL)
+
+    assert isinstance(response, GitHubAPIResponse)
+    assert response.status == 200
+    assert response.headers["x-custom"] == "value"
+
+
+def test__github_api_client__decompresses_gzip(server):
+    data = [{"commit": {"message": "feat: message"}}] * 100
+    server.add_response("GET", URL, data=data, compress=True)
+
+    with GitHubAPIClient("token", base_url=server.url) as client:
+        response = client.request("GET", URL)
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.data == data
+    assert server.requests[0].headers["accept-encoding"] == "gzip"
+
+
+def test__github_api_client__empty_body(server):
+    server.add_response("GET", URL, status=204)
+
+    with GitHubAPIClient("token", base_url=server.url) as client:
+        response = client.request("GET", URL)
+
+    assert response.status == 204
+    assert response.data is None
+
+
+def test__github_api_client__base_url_path_prefix(server):
+    server.add_response("GET", f"/api/v3{URL}", data=[])
+
+    with GitHubAPIClient("token", base_url=f"{server.url}/api/v3/") as client:
+        response = client.request("GET", URL)
+
+    assert response.status == 200
+    assert server.requests[0].path == f"/api/v3{URL}"
+
+
+def test__github_api_client__base_url_from_env(server, monkeypatch):
+    monkeypatch.setenv("GITHUB_API_URL", server.url)
+    server.add_response("GET", URL, data=[])
+
+    with GitHubAPIClient("token") as client:
+        assert client.request("GET", URL).status == 200
+
+
+def test__github_api_client__default_base_url(monkeypatch):
+    monkeypatch.delenv("GITHUB_API_URL", raising=False)
+
+    with patch("http.client.HTTPSConnection") as mock_https_connection:
+        client = GitHubAPIClient("token", timeout=5)
+        client._new_connection()
+
+    mock_https_connection.assert_called_once_with("api.github.com", timeout=5)
+
+
+def test__github_api_client__timeout(server):
+    client = GitHubAPIClient("token", base_url=server.url)
+    assert client._new_connection().timeout == GITHUB_API_TIMEOUT
+
+    client = GitHubAPIClient("token", base_url=server.url, timeout=2.5)
+    assert client._new_connection().timeout == 2.5
+
+
+def test__github_api_client__close(server):
+    server.add_response("GET", URL, data=[])
+    client = GitHubAPIClient("token", base_url=server.url)
+    client.request("GET", URL)
+    (connection,) = client._idle_connections
+
+    client.close()
+
+    assert client._idle_connections == []
+    assert connection.sock is None
+
+
+def test__github_api_client__reconnects_closed_idle_connection(server):
+    server.add_response("GET", URL, data=[])
+
+    with GitHubAPIClient("token", base_url=server.url) as client:
+        client.request("GET", URL)
+        # simulating a keep-alive connection closed while idle in the pool
+        client._idle_connections[0].sock.shutdown(socket.SHUT_RDWR)
+
+        response = client.request("GET", URL)
+
+    assert response.status == 200
+    assert len(server.requests) == 2
+    assert len({request.client_port for request in server.requests}) == 2
+
+
+def test__github_api_client__new_connection_error_is_raised(server, clock):
+    with _client(server, clock) as client:
+        with patch.object(
+            http.client.HTTPConnection,
+            "getresponse",
+            side_effect=http.client.RemoteDisconnected("closed"),
+        ):
+            with pytest.raises(http.client.RemoteDisconnected):
+                client.request("GET", URL)
+
+        assert client._idle_connections == []
+
+    # retried with backoff, as for a server error
+    assert len(clock.sleeps) == GITHUB_API_MAX_RETRIES
+
+
+@pytest.mark.parametrize(
+    "error",
+    [http.client.RemoteDisconnected("closed"), ConnectionRefusedError, TimeoutError],
+)
+def test__github_api_client__retries_connection_errors(server, clock, error):
+    server.add_response("GET", URL, data=["data"])
+    getresponse = http.client.HTTPConnection.getresponse
+    connections = []
+
+    def _getresponse(connection):
+        connections.append(connection)
+        if len(connections) == 1:
+            raise error
+        return getresponse(connection)
+
+    with _client(server, clock) as client:
+        with patch.object(http.client.HTTPConnection, "getresponse", _getresponse):
+            response = client.request("GET", URL)
+
+    assert response.status == 200
+    assert response.data == ["data"]
+    assert len(clock.sleeps) == 1
+    # the failed connection is not reused
+    assert connections[0] is not connections[1]
+
+
+def test__github_api_client__does_not_retry_connection_errors_of_post(server, clock):
+    with _client(server, clock) as client:
+        with patch.object(
+            http.client.HTTPConnection, "getresponse", side_effect=TimeoutError
+        ):
+            with pytest.raises(TimeoutError):
+                client.request("POST", URL, body={"a": 1})
+
+    assert clock.sleeps == []
+
+
+def test__github_api_client__concurrent_requests(server):
+    server.add_response("GET", URL, data=[])
+
+    with GitHubAPIClient("token", base_url=server.url) as client:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            statuses = list(
+                executor.map(lambda _: client.request("GET", URL).status, range(20))
+            )
+
+    assert statuses == [200] * 20
+    assert len(server.requests) == 20
+
+
+def test__github_api_client__cache_serves_not_modified_response(server, tmp_path):
+    data = [{"commit": {"message": "feat: message"}}]
+    server.add_response(
+        "GET", URL, data=data, headers={"ETag": '"v1"', "Link": "<next>"}
+    )
+
+    for _ in range(2):
+        with GitHubAPIClient(
+            "token", base_url=server.url, cache_dir=tmp_path
+        ) as client:
+            response = client.request("GET", URL, params={"page": 1})
+
+        assert response.status == 200
+        assert response.data == data
+        assert response.headers["link"] == "<next>"
+
+    assert "if-none-match" not in server.requests[0].headers
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+
+
+def test__github_api_client__cache_updates_modified_response(server, tmp_path):
+    server.add_response("GET", URL, data=["old"], headers={"ETag": '"v1"'})
+    server.add_response("GET", URL, data=["new"], headers={"ETag": '"v2"'})
+
+    with GitHubAPIClient("token", base_url=server.url, cache_dir=tmp_path) as client:
+        assert client.request("GET", URL).data == ["old"]
+        assert client.request("GET", URL).data == ["new"]
+        assert client.request("GET", URL).data == ["new"]
+
+    assert [request.headers.get("if-none-match") for request in server.requests] == [
+        None,
+        '"v1"',
+        '"v2"',
+    ]
+
+
+def test__github_api_client__cache_is_keyed_by_scope_and_url(server, tmp_path):
+    server.add_response("GET", URL, data=[], headers={"ETag": '"v1"'})
+
+    def request(token, page, cache_scope=None):
+        with GitHubAPIClient(
+            token, base_url=server.url, cache_dir=tmp_path, cache_scope=cache_scope
+        ) as client:
+            client.request("GET", URL, params={"page": page})
+        return server.requests[-1].headers.get("if-none-match")
+
+    # a new token of the same scope, e.g. the `github.token` of another run
+    assert request("token_1", 1, "owner/repo\ndefault token") is None
+    assert request("token_2", 1, "owner/repo\ndefault token") == '"v1"'
+    assert request("token_2", 2, "owner/repo\ndefault token") is None
+    assert request("token_2", 1, "other/repo\ndefault token") is None
+
+    # without a scope, the cache is only shared by the same token
+    assert request("token_1", 1) is None
+    assert request("token_1", 1) == '"v1"'
+    assert request("token_2", 1) is None
+
+    assert len(list(tmp_path.glob("*.json"))) == 5
+    # the token is not part of the cache files
+    for cache_file in tmp_path.glob("*.json"):
+        assert "token_" not in cache_file.name + cache_file.read_text()
+
+
+def test__github_api_client__cache_stores_compressed_response(server, tmp_path):
+    data = [{"commit": {"message": "feat: message"}}] * 100
+    server.add_response("GET", URL, data=data, headers={"ETag": '"v1"'}, compress=True)
+
+    with GitHubAPIClient("token", base_url=server.url, cache_dir=tmp_path) as client:
+        client.request("GET", URL)
+        response = client.request("GET", URL)
+
+    # the decoded data is cached, without the encoding of the raw body
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+    assert response.data == data
+    assert "content-encoding" not in response.headers
+
+
+def test__github_api_client__cache_skips_responses_without_etag(server, tmp_path):
+    server.add_response("GET", URL, data=[])
+
+    with GitHubAPIClient("token", base_url=server.url, cache_dir=tmp_path) as client:
+        client.request("GET", URL)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test__github_api_client__cache_ignores_invalid_entry(server, tmp_path):
+    server.add_response("GET", URL, data=["data"], headers={"ETag": '"v1"'})
+
+    with GitHubAPIClient("token", base_url=server.url, cache_dir=tmp_path) as client:
+        client.request("GET", URL)
+        (cache_file,) = tmp_path.glob("*.json")
+        cache_file.write_text("{invalid")
+
+        response = client.request("GET", URL)
+
+    assert response.data == ["data"]
+    assert "if-none-match" not in server.requests[1].headers
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test__github_api_client__retries_server_errors(server, clock, status):
+    server.add_response("GET", URL, status=status, data={"message": "error"})
+    server.add_response("GET", URL, status=status, data={"message": "error"})
+    server.add_response("GET", URL, data=["data"])
+
+    with _client(server, clock) as client:
+        response = client.request("GET", URL)
+
+    assert response.status == 200
+    assert response.data == ["data"]
+    assert len(server.requests) == 3
+    # exponential backoff with full jitter
+    assert len(clock.sleeps) == 2
+    for attempt, delay in enumerate(clock.sleeps):
+        assert 0 <= delay <= GITHUB_API_BACKOFF * 2**attempt
+
+
+def test__github_api_client__retries_non_json_server_error(server, clock):
+    server.add_response(
+        "GET",
+        URL,
+        status=502,
+        body=b"<html><body>502 Bad Gateway</body></html>",
+        headers={"Content-Type": "text/html"},
+    )
+    server.add_response("GET", URL, data=["data"])
+
+    with _client(server, clock) as client:
+        response = client.request("GET", URL)
+
+    assert response.status == 200
+    assert response.data == ["data"]
+    assert len(server.requests) == 2
+
+
+def test__github_api_client__non_json_error_data_is_text(server, clock):
+    server.add_response("GET", URL, status=404, body=b"Not Found")
+
+    with _client(server, clock) as client:
+        response = client.request("GET", URL)
+
+    assert response.status == 404
+    assert response.data == "Not Found"
+
+
+def test__github_api_client__non_json_success_is_raised(server, clock):
+    server.add_response("GET", URL, body=b"<html></html>")
+
+    with _client(server, clock) as client:
+        with pytest.raises(ValueError):
+            client.request("GET", URL)
+
+
+def test__github_api_client__gives_up_after_max_retries(server, clock):
+    server.add_response("GET", URL, status=502, data={"message": "Bad Gateway"})
+
+    with _client(server, clock) as client:
+        response = client.request("GET", URL)
+
+    assert response.status == 502
+    assert response.data == {"message": "Bad Gateway"}
+    assert len(server.requests) == 1 + GITHUB_API_MAX_RETRIES
+
+
+def test__github_api_client__max_retries(server, clock):
+    server.add_response("GET", URL, status=502)
+
+    with _client(server, clock, max_retries=0) as client:
+        assert client.request("GET", URL).status == 502
+
+    assert len(server.requests) == 1
+    assert clock.sleeps == []
+
+
+def test__github_api_client__does_not_retry_non_idempotent_requests(server, clock):
+    server.add_response("POST", URL, status=502)
+
+    with _client(server, clock) as client:
+        assert client.request("POST", URL, body={"a": 1}).status == 502
+
+    assert len(server.requests) == 1
+
+
+@pytest.mark.parametrize("status", [400, 401, 404, 422])
+def test__github_api_client__does_not_retry_client_errors(server, clock, status):
+    server.add_response("GET", URL, status=status)
+
+    with _client(server, clock) as client:
+        assert client.request("GET", URL).status == status
+
+    assert len(server.requests) == 1
+
+
+def test__github_api_client__does_not_retry_forbidden_without_rate_limit(server, clock):
+    server.add_response(
+        "GET", URL, status=403, headers={"X-RateLimit-Remaining": "4999"}
+    )
+
+    with _client(server, clock) as client:
+        assert client.request("GET", URL).status == 403
+
+    assert len(server.requests) == 1
+
+
+@pytest.mark.parametrize("status", [403, 429])
+def test__github_api_client__waits_for_retry_after(server, clock, status):
+    server.add_response("GET", URL, status=status, headers={"Retry-After": "7"})
+    server.add_response("GET", URL, data=["data"])
+
+    with _client(server, clock) as client:
+        response = client.request("GET", URL)
+
+    assert response.data == ["data"]
+    assert clock.sleeps == [7]
+
+
+def test__github_api_client__waits_for_rate_limit_reset(server, clock):
+    server.add_response(
+        "GET",
+        URL,
+        status=403,
+        headers={
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(clock.now) + 12),
+        },
+    )
+    server.add_response("GET", URL, data=["data"])
+
+    with _client(server, clock) as client:
+        response = client.request("GET", URL)
+        # the rate limit is lifted
+        client.request("GET", URL)
+
+    assert response.data == ["data"]
+    assert clock.sleeps == [12]
+
+
+def test__github_api_client__rate_limit_blocks_other_requests(server, clock):
+    server.add_response("GET", URL, status=429, headers={"Retry-After": "5"})
+    server.add_response("GET", URL, data=["data"])
+
+    with _client(server, clock, max_retries=0) as client:
+        assert client.request("GET", URL).status == 429
+        # the next request waits for the rate limit
+        assert client.request("GET", URL).data == ["data"]
+
+    assert clock.sleeps == [5]
+
+
+def test__github_api_client__does_not_wait_for_long_rate_limit(server, clock):
+    reset = int(clock.now + GITHUB_API_MAX_RATE_LIMIT_WAIT) + 60
+    server.add_response(
+        "GET",
+        URL,
+        status=403,
+        data={"message": "API rate limit exceeded"},
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)},
+    )
+
+    with _client(server, clock) as client:
+        response = client.request("GET", URL)
+
+    assert response.status == 403
+    assert len(server.requests) == 1
+    assert clock.sleeps == []
+
+
+def _select_message(item):
+    return item["commit"]["message"]
+
+
+def _select_sha(item):
+    return item["sha"]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test__github_api_client__select(server, compress):
+    data = [
+        {"sha": str(index), "commit": {"message": f"feat: {index}", "tree": {}}}
+        for index in range(500)
+    ]
+    server.add_response("GET", URL, data=data, compress=compress)
+
+    with GitHubAPIClient("token", base_url=server.url) as client:
+        response = client.request("GET", URL, select=_select_message)
+
+    assert response.status == 200
+    assert response.data == [f"feat: {index}" for index in range(500)]
+
+
+def test__github_api_client__select_reads_the_body_after_the_array(server):
+    data = [{"sha": "a", "commit": {"message": "feat: message"}}]
+    server.add_response("GET", URL, data=data, compress=True)
+    # the first read has the whole array, the end of the gzip trailer is left
+    # for the next read
+    body_size = len(gzip.compress(json.dumps(data).encode()))
+
+    with patch("github_actions.action.utils.GITHUB_API_READ_SIZE", body_size - 4):
+        with GitHubAPIClient("token", base_url=server.url) as client:
+            for _ in range(2):
+                response = client.request("GET", URL, select=_select_message)
+                assert response.data == ["feat: message"]
+
+    # the connection was read to the end of the body and reused
+    assert len({request.client_port for request in server.requests}) == 1
+
+
+def test__github_api_client__select_is_not_applied_on_errors(server, clock):
+    server.add_response("GET", URL, status=404, data={"message": "Not Found"})
+
+    with _client(server, clock) as client:
+        response = client.request("GET", URL, select=_select_message)
+
+    assert response.status == 404
+    assert response.data == {"message": "Not Found"}
+
+
+def test__github_api_client__cache_is_keyed_by_select(server, tmp_path):
+    data = [{"sha": "a", "commit": {"message": "feat: message"}}]
+    server.add_response("GET", URL, data=data, headers={"ETag": '"v1"'})
+
+    with GitHubAPIClient("token", base_url=server.url, cache_dir=tmp_path) as client:
+        assert client.request("GET", URL, select=_select_message).data == [
+            "feat: message"
+        ]
+        assert client.request("GET", URL, select=_select_sha).data == ["a"]
+        # served from the cache
+        assert client.request("GET", URL, select=_select_message).data == [
+            "feat: message"
+        ]
+
+    assert [request.headers.get("if-none-match") for request in server.requests] == [
+        None,
+        None,
+        '"v1"',
+    ]
@@ -0,0 +1,126 @@
+# type: ignore
+# pylint: disable=all
+import json
+import random
+
+import pytest
+
+from github_actions.action.utils import iter_json_array
+
+
+def _chunked(data, size):
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+ARRAYS = [
+    [],
+    [1, 22, 333, -4.5e3],
+    ["a", "ü ñ 😀", 'quote " and \\ backslash', "]", "[", ",", "{}"],
+    [{"sha": "a", "commit": {"message": "feat: message\n\nbody", "parents": []}}],
+    [[1, [2, [3]]], {"a": {"b": None}}, True, False, None],
+    [{"commit": {"message": f"feat: commit {index}"}} for index in range(200)],
+]
+
+
+@pytest.mark.parametrize("array", ARRAYS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1_000_000])
+def test__iter_json_array__matches_json_loads(array, chunk_size):
+    data = json.dumps(array).encode("utf-8")
+
+    assert list(iter_json_array(_chunked(data, chunk_size))) == array
+
+
+def test__iter_json_array__random_chunks():
+    rng = random.Random(0)
+    array = [
+        {
+            "commit": {
+                "message": "".join(rng.choice('ab ü\n"\\{}[],') for _ in range(50))
+            }
+        }
+        for _ in range(100)
+    ]
+    data = json.dumps(array, ensure_ascii=False, indent=2).encode("utf-8")
+
+    for _ in range(20):
+        chunks, start = [], 0
+        while start < len(data):
+            end = start + rng.randint(1, 300)
+            chunks.append(data[start:end])
+            start = end
+
+        assert list(iter_json_array(chunks)) == array
+
+
+def test__iter_json_array__whitespaces():
+    data = b' \n[ 1 ,\n\t{"a" : 2} , "b"\r\n] \n'
+
+    assert list(iter_json_array(_chunked(data, 1))) == [1, {"a": 2}, "b"]
+
+
+def test__iter_json_array__is_lazy():
+    chunks = iter([b'[{"a": 1},', b'{"b": 2}', b"]"])
+    items = iter_json_array(chunks)
+
+    assert next(items) == {"a": 1}
+    # the next chunks are not read yet
+    assert next(chunks) == b'{"b": 2}'
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b'{"a": 1}', b"[1, 2", b'[{"a": 1]', b"[1, }]", b'["a]'],
+)
+def test__iter_json_array__invalid(data):
+    with pytest.raises(ValueError):
+        list(iter_json_array([data]))
+
+
+OBJECTS = [
+    {"commits": [1, "a", {"message": "feat: message"}]},
+    {
+        "ref": "refs/heads/main",
+        "before": -4.5e3,
+        "repository": {"commits": ["nested, not the key"], "topics": ["]", "}"]},
+        "commits": [{"message": f"feat: commit {index}"} for index in range(50)],
+        "head_commit": {"message": "after the array"},
+    },
+    {"commits": []},
+]
+
+
+@pytest.mark.parametrize("obj", OBJECTS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1_000_000])
+def test__iter_json_array__key(obj, chunk_size):
+    data = json.dumps(obj, indent=2).encode("utf-8")
+
+    assert (
+        list(iter_json_array(_chunked(data, chunk_size), key="commits"))
+        == (obj["commits"])
+    )
+
+
+@pytest.mark.parametrize(
+    "obj", [{}, {"ref": "main"}, {"commits": None}, {"commits": {"a": [1]}}]
+)
+def test__iter_json_array__key_without_array(obj):
+    data = json.dumps(obj).encode("utf-8")
+
+    assert list(iter_json_array(_chunked(data, 3), key="commits")) == []
+
+
+def test__iter_json_array__key_stops_after_the_array():
+    chunks = iter([b'{"commits": [1]', b', "other": ', b"invalid"])
+
+    assert list(iter_json_array(chunks, key="commits")) == [1]
+    # the rest of the object is not read
+    assert next(chunks) == b', "other": '
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"[1]", b'{"a" 1}', b"{1: [2]}", b'{"a": 1', b'{"commits": [1, 2'],
+)
+def test__iter_json_array__key_invalid(data):
+    with pytest.raises(ValueError):
+        list(iter_json_array([data], key="commits"))
@@ -1,45 +1,41 @@
 # type: ignore
 # pylint: disable=all
-import json
-from unittest.mock import Mock, patch
-
 import pytest
 
 from github_actions.action.utils import request_github_api
+from tests.fixtures.github_api_server import FakeGitHubAPIServer
 
 
 @pytest.fixture
-def mock_https_connection():
-    with patch("http.client.HTTPSConnection") as mock:
-        mock_response = Mock()
-        mock_response.read.return_value = json.dumps({"success": True}).encode("utf-8")
-        mock_response.status = 200
-        mock.return_value.getresponse.return_value = mock_response
-
-        yield mock
+def server(monkeypatch):
+    with FakeGitHubAPIServer() as server:
+        monkeypatch.setenv("GITHUB_API_URL", server.url)
+        server.add_response("GET", "/repos/opensource-nepal/commitlint", data={"ok": 1})
+        server.add_response(
+            "POST", "/repos/opensource-nepal/commitlint", data={"success": True}
+        )
+        yield server
 
 
-def test__request_github_api__get_request(mock_https_connection):
+def test__request_github_api__get_request(server):
     status, data = request_github_api(
         method="GET", url="/repos/opensource-nepal/commitlint", token="test_token"
     )
 
     assert status == 200
-    assert data == {"success": True}
+    assert data == {"ok": 1}
 
-    mock_https_connection.return_value.request.assert_called_with(
-        method="GET",
-        url="/repos/opensource-nepal/commitlint",
-        body=None,
-        headers={
-            "Authorization": "Bearer test_token",
-            "Content-Type": "application/json",
-            "User-Agent": "commitlint",
-        },
-    )
+    request = server.requests[0]
+    assert request.method == "GET"
+    assert request.path == "/repos/opensource-nepal/commitlint"
+    assert request.body == b""
+    assert request.headers["authorization"] == "Bearer test_token"
+    assert request.headers["content-type"] == "application/json"
+    assert request.headers["user-agent"] == "commitlint"
+    assert request.headers["accept-encoding"] == "gzip"
 
 
-def test__request_github_api__get_request_with_params(mock_https_connection):
+def test__request_github_api__get_request_with_params(server):
     status, data = request_github_api(
         method="GET",
         url="/repos/opensource-nepal/commitlint",
@@ -48,21 +44,13 @@ def test__request_github_api__get_request_with_params(mock_https_connection):
     )
 
     assert status == 200
-    assert data == {"success": True}
-
-    mock_https_connection.return_value.request.assert_called_with(
-        method="GET",
-        url="/repos/opensource-nepal/commitlint?key1=val1&key2=val2",
-        body=None,
-        headers={
-            "Authorization": "Bearer test_token",
-            "Content-Type": "application/json",
-            "User-Agent": "commitlint",
-        },
+    assert data == {"ok": 1}
+    assert server.requests[0].path == (
+        "/repos/opensource-nepal/commitlint?key1=val1&key2=val2"
     )
 
 
-def test__request_github_api__post_request(mock_https_connection):
+def test__request_github_api__post_request(server):
     status, data = request_github_api(
         method="POST",
         url="/repos/opensource-nepal/commitlint",
@@ -71,20 +59,11 @@ def test__request_github_api__post_request(mock_https_connection):
 
     assert status == 200
     assert data == {"success": True}
-
-    mock_https_connection.return_value.request.assert_called_with(
-        method="POST",
-        url="/repos/opensource-nepal/commitlint",
-        body=None,
-        headers={
-            "Authorization": "Bearer test_token",
-            "Content-Type": "application/json",
-            "User-Agent": "commitlint",
-        },
-    )
+    assert server.requests[0].method == "POST"
+    assert server.requests[0].body == b""
 
 
-def test_request_github_api__post_request_with_body(mock_https_connection):
+def test_request_github_api__post_request_with_body(server):
     status, data = request_github_api(
         method="POST",
         url="/repos/opensource-nepal/commitlint",
@@ -94,20 +73,10 @@ def test_request_github_api__post_request_with_body(mock_https_connection):
 
     assert status == 200
     assert data == {"success": True}
-
-    mock_https_connection.return_value.request.assert_called_with(
-        method="POST",
-        url="/repos/opensource-nepal/commitlint",
-        body=json.dumps({"data": "test_data"}),
-        headers={
-            "Authorization": "Bearer test_token",
-            "Content-Type": "application/json",
-            "User-Agent": "commitlint",
-        },
-    )
+    assert server.requests[0].json == {"data": "test_data"}
 
 
-def test_request_github_api__post_request_with_body_and_params(mock_https_connection):
+def test_request_github_api__post_request_with_body_and_params(server):
     status, data = request_github_api(
         method="POST",
         url="/repos/opensource-nepal/commitlint",
@@ -118,14 +87,16 @@ def test_request_github_api__post_request_with_body_and_params(mock_https_connec
 
     assert status == 200
     assert data == {"success": True}
+    assert server.requests[0].path == (
+        "/repos/opensource-nepal/commitlint?key1=val1&key2=val2"
+    )
+    assert server.requests[0].json == {"data": "test_data"}
 
-    mock_https_connection.return_value.request.assert_called_with(
-        method="POST",
-        url="/repos/opensource-nepal/commitlint?key1=val1&key2=val2",
-        body=json.dumps({"data": "test_data"}),
-        headers={
-            "Authorization": "Bearer test_token",
-            "Content-Type": "application/json",
-            "User-Agent": "commitlint",
-        },
+
+def test_request_github_api__error_status(server):
+    status, data = request_github_api(
+        method="GET", url="/repos/opensource-nepal/unknown", token="test_token"
     )
+
+    assert status == 404
+    assert data == {"message": "Not Found"}
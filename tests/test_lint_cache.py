@@ -0,0 +1,168 @@
+# type: ignore
+# pylint: disable=all
+import itertools
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from commitlint.exceptions import CommitlintException
+from commitlint.git_helpers import GitCommit
+from commitlint.lint_cache import (
+    LINT_CACHE_BATCH_SIZE,
+    LINT_CACHE_FILENAME,
+    LINT_CACHE_REFRESH_INTERVAL,
+    LintCache,
+    get_lint_fingerprint,
+    open_lint_cache,
+)
+from tests.fixtures.git_repo import create_git_repo
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "commitlint" / "lint-cache.sqlite3")
+
+
+def _commits(*commit_hashes):
+    return [GitCommit(commit_hash, "feat: add") for commit_hash in commit_hashes]
+
+
+def _unknown_hashes(cache, *commit_hashes):
+    return [
+        commit.commit_hash for commit in cache.iter_unknown(_commits(*commit_hashes))
+    ]
+
+
+def _cached_hashes(cache_path):
+    with sqlite3.connect(cache_path) as connection:
+        return sorted(
+            row[0]
+            for row in connection.execute("SELECT commit_hash FROM valid_commits")
+        )
+
+
+def test__lint_cache__add_valid(cache_path):
+    with LintCache(cache_path, "fingerprint") as cache:
+        assert _unknown_hashes(cache, "hash_1") == ["hash_1"]
+        cache.add_valid("hash_1")
+
+    with LintCache(cache_path, "fingerprint") as cache:
+        assert _unknown_hashes(cache, "hash_2", "hash_1", "hash_3") == [
+            "hash_2",
+            "hash_3",
+        ]
+        assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test__lint_cache__iter_unknown_in_batches(cache_path):
+    commit_hashes = [f"hash_{index}" for index in range(1200)]
+    with LintCache(cache_path, "fingerprint") as cache:
+        for commit_hash in commit_hashes[::2]:
+            cache.add_valid(commit_hash)
+
+    with LintCache(cache_path, "fingerprint") as cache:
+        assert _unknown_hashes(cache, *commit_hashes) == commit_hashes[1::2]
+
+
+def test__lint_cache__iter_unknown_is_lazy(cache_path):
+    # an endless range of commits, only consumed one batch at a time
+    commits = (GitCommit(f"hash_{index}", "feat: add") for index in itertools.count())
+
+    with LintCache(cache_path, "fingerprint") as cache:
+        unknown = cache.iter_unknown(commits)
+
+        assert next(unknown).commit_hash == "hash_0"
+        assert next(commits).commit_hash == f"hash_{LINT_CACHE_BATCH_SIZE}"
+
+
+def test__lint_cache__other_fingerprint(cache_path):
+    with LintCache(cache_path, "fingerprint") as cache:
+        cache.add_valid("hash_1")
+
+    with LintCache(cache_path, "other_fingerprint") as cache:
+        assert _unknown_hashes(cache, "hash_1") == ["hash_1"]
+
+
+def test__lint_cache__evicts_least_recently_used(cache_path):
+    day = LINT_CACHE_REFRESH_INTERVAL
+    with patch("commitlint.lint_cache.time.time", return_value=day):
+        with LintCache(cache_path, "fingerprint") as cache:
+            for index in range(3):
+                cache.add_valid(f"hash_{index}")
+
+    with patch("commitlint.lint_cache.time.time", return_value=3 * day):
+        with LintCache(cache_path, "fingerprint") as cache:
+            assert _unknown_hashes(cache, "hash_0") == []
+
+    with patch("commitlint.lint_cache.time.time", return_value=4 * day):
+        with LintCache(cache_path, "fingerprint", max_entries=3) as cache:
+            cache.add_valid("hash_3")
+
+    # hash_0 was used after hash_1 was added
+    assert _cached_hashes(cache_path) == ["hash_0", "hash_2", "hash_3"]
+
+
+def test__lint_cache__refreshes_last_use_once_per_interval(cache_path):
+    with patch("commitlint.lint_cache.time.time", return_value=1):
+        with LintCache(cache_path, "fingerprint") as cache:
+            cache.add_valid("hash_0")
+
+    with patch("commitlint.lint_cache.time.time", return_value=2):
+        with LintCache(cache_path, "fingerprint") as cache:
+            assert _unknown_hashes(cache, "hash_0") == []
+
+    with sqlite3.connect(cache_path) as connection:
+        assert connection.execute("SELECT last_used FROM valid_commits").fetchall() == [
+            (1,)
+        ]
+
+
+def test__lint_cache__invalid_database(cache_path, tmp_path):
+    (tmp_path / "commitlint").mkdir()
+    with open(cache_path, "w") as cache_file:
+        cache_file.write("not a database" * 100)
+
+    with pytest.raises(CommitlintException):
+        LintCache(cache_path, "fingerprint")
+
+
+def test__lint_cache__failed_write_keeps_lint_results(cache_path):
+    cache = LintCache(cache_path, "fingerprint")
+    cache.add_valid("hash_1")
+
+    with patch.object(cache, "_evict", side_effect=sqlite3.OperationalError("locked")):
+        cache.close()
+
+    # the transaction was rolled back
+    assert _cached_hashes(cache_path) == []
+
+
+def test__get_lint_fingerprint():
+    assert get_lint_fingerprint() == get_lint_fingerprint(skip_detail=False)
+    assert get_lint_fingerprint() != get_lint_fingerprint(skip_detail=True)
+
+
+def test__get_lint_fingerprint__changes_with_the_version():
+    fingerprint = get_lint_fingerprint()
+
+    with patch("commitlint.lint_cache.__version__", "0.0.0"):
+        assert get_lint_fingerprint() != fingerprint
+
+
+def test__open_lint_cache__with_git_repo(tmp_path, monkeypatch):
+    create_git_repo(tmp_path, ["feat: initial commit"])
+    monkeypatch.chdir(tmp_path)
+
+    cache = open_lint_cache()
+    cache.close()
+
+    assert cache.path == str(tmp_path / ".git" / LINT_CACHE_FILENAME)
+    assert cache.fingerprint == get_lint_fingerprint()
+
+
+def test__open_lint_cache__outside_git_repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+
+    assert open_lint_cache() is None
@@ -1,13 +1,32 @@
 # type: ignore
 # pylint: disable=all
 
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
+from commitlint.config import config
 from commitlint.constants import COMMIT_HEADER_MAX_LENGTH
-from commitlint.linter import lint_commit_message
-from commitlint.messages import HEADER_LENGTH_ERROR, INCORRECT_FORMAT_ERROR
+from commitlint.linter import (
+    LintMemoInfo,
+    LintResult,
+    disable_lint_memo,
+    enable_lint_memo,
+    get_lint_memo_info,
+    iter_lint_commit_messages,
+    lint_commit_message,
+    lint_commit_messages,
+)
+from commitlint.linter import _linter
+from commitlint.linter.parser import ParsedCommit
+from commitlint.messages import (
+    DESCRIPTION_FULL_STOP_END_ERROR,
+    HEADER_LENGTH_ERROR,
+    INCORRECT_FORMAT_ERROR,
+    SCOPE_EMPTY_ERROR,
+)
 
 from ..fixtures.linter import LINTER_FIXTURE_PARAMS
 
@@ -59,3 +78,200 @@ def test__lint_commit_message__skip_detail_returns_invalid_format_error_message(
     success, errors = lint_commit_message(commit_message, skip_detail=True)
     assert success is False
     assert errors == [INCORRECT_FORMAT_ERROR]
+
+
+def test__lint_commit_messages__matches_lint_commit_message():
+    commit_messages = [fixture[0] for fixture in LINTER_FIXTURE_PARAMS]
+
+    results = lint_commit_messages(commit_messages)
+
+    assert len(results) == len(commit_messages)
+    for index, (result, fixture) in enumerate(zip(results, LINTER_FIXTURE_PARAMS)):
+        commit_message, expected_success, expected_errors = fixture
+        assert result == LintResult(
+            index, commit_message, expected_success, expected_errors
+        )
+
+
+def test__lint_commit_messages__skip_detail():
+    results = lint_commit_messages(
+        ["feat: add new feature", "Test invalid commit message"], skip_detail=True
+    )
+
+    assert results == [
+        LintResult(0, "feat: add new feature", True, []),
+        LintResult(1, "Test invalid commit message", False, [INCORRECT_FORMAT_ERROR]),
+    ]
+
+
+def test__lint_commit_messages__strip_comments():
+    results = lint_commit_messages(
+        ["feat(scope): add new feature\n#this is a comment"], strip_comments=True
+    )
+
+    assert results[0].success is True
+    assert results[0].errors == []
+
+
+def test__iter_lint_commit_messages__consumes_lazily():
+    consumed = []
+
+    def commit_messages():
+        for commit_message in ("feat: first", "invalid", "fix: third"):
+            consumed.append(commit_message)
+            yield commit_message
+
+    results = iter_lint_commit_messages(commit_messages())
+    assert consumed == []
+
+    first = next(results)
+    assert first == LintResult(0, "feat: first", True, [])
+    assert consumed == ["feat: first"]
+
+    assert [result.success for result in results] == [False, True]
+    assert consumed == ["feat: first", "invalid", "fix: third"]
+
+
+@patch("commitlint.linter._linter.LINT_JOBS_CHUNK_SIZE", 3)
+def test__lint_commit_messages__jobs_keeps_input_order():
+    commit_messages = [fixture[0] for fixture in LINTER_FIXTURE_PARAMS]
+
+    results = lint_commit_messages(commit_messages, jobs=2)
+
+    assert results == lint_commit_messages(commit_messages)
+
+
+def test__lint_commit_messages__jobs_skip_detail():
+    commit_messages = ["feat: add new feature", "Test invalid commit message"]
+
+    results = lint_commit_messages(commit_messages, skip_detail=True, jobs=2)
+
+    assert results == lint_commit_messages(commit_messages, skip_detail=True)
+
+
+def test__lint_commit_messages__jobs_empty_input():
+    assert lint_commit_messages([], jobs=2) == []
+
+
+def test__lint_commit_messages__jobs_disables_verbose_in_workers(capfd):
+    config.verbose = True
+    try:
+        lint_commit_messages(["feat: add new feature", "invalid"], jobs=2)
+    finally:
+        config.verbose = False
+
+    output = capfd.readouterr().out
+    assert output == "linting commit messages using 2 jobs\n"
+
+
+def test__lint_commit_message__parses_commit_message_once():
+    with patch.object(
+        ParsedCommit, "__init__", autospec=True, side_effect=ParsedCommit.__init__
+    ) as mock_init:
+        success, errors = lint_commit_message("feat(): add new feature.")
+
+    assert success is False
+    assert errors == [SCOPE_EMPTY_ERROR, DESCRIPTION_FULL_STOP_END_ERROR]
+    mock_init.assert_called_once()
+
+
+@pytest.fixture
+def lint_memo():
+    enable_lint_memo(maxsize=2)
+    yield
+    disable_lint_memo()
+
+
+def test__lint_commit_message__memo_returns_same_results(lint_memo, fixture_data):
+    commit_message, expected_success, expected_errors = fixture_data
+
+    for _ in range(2):
+        success, errors = lint_commit_message(commit_message)
+        assert success == expected_success
+        assert errors == expected_errors
+
+    assert get_lint_memo_info()[:2] == (1, 1)
+
+
+def test__lint_commit_message__memo_hit_skips_linting(lint_memo):
+    lint_commit_message("feat: add new feature")
+
+    with patch("commitlint.linter._linter.run_validators") as mock_run_validators:
+        assert lint_commit_message("feat: add new feature") == (True, [])
+
+    mock_run_validators.assert_not_called()
+    assert get_lint_memo_info() == LintMemoInfo(hits=1, misses=1, maxsize=2, size=1)
+
+
+def test__lint_commit_message__memo_key_includes_options(lint_memo):
+    commit_message = "feat: add\n# comment"
+
+    assert lint_commit_message(commit_message)[0] is False
+    assert lint_commit_message(commit_message, strip_comments=True)[0] is True
+    assert lint_commit_message(commit_message, skip_detail=True)[0] is False
+
+    assert get_lint_memo_info()[:2] == (0, 3)
+
+
+def test__lint_commit_message__memo_returns_new_errors_list(lint_memo):
+    _, errors = lint_commit_message("invalid commit message")
+    errors.clear()
+
+    assert lint_commit_message("invalid commit message") == (
+        False,
+        [INCORRECT_FORMAT_ERROR],
+    )
+
+
+def test__lint_commit_message__memo_evicts_least_recently_used(lint_memo):
+    for commit_message in ("feat: one", "feat: two", "feat: one", "feat: three"):
+        lint_commit_message(commit_message)
+
+    lint_commit_message("feat: one")  # kept, it was used after "feat: two"
+    lint_commit_message("feat: two")  # evicted
+
+    assert get_lint_memo_info() == LintMemoInfo(hits=2, misses=4, maxsize=2, size=2)
+
+
+def test__lint_commit_message__memo_keeps_digests_only(lint_memo):
+    commit_message = "feat: add\n\n" + "long body " * 10_000
+    lint_commit_message(commit_message)
+
+    (key,) = _linter._lint_memo._results
+    assert key == (
+        hashlib.blake2b(commit_message.encode(), digest_size=16).digest(),
+        False,
+        False,
+    )
+
+
+def test__lint_commit_message__memo_shared_by_threads(lint_memo):
+    commit_messages = ["feat: one", "invalid", "feat: one", "feat: two"] * 50
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lint_commit_message, commit_messages))
+
+    assert results == [lint_commit_message(message) for message in commit_messages]
+    info = get_lint_memo_info()
+    assert info.hits + info.misses == len(commit_messages) * 2
+    assert info.size == 2
+
+
+def test__iter_lint_commit_messages__memo_duplicates(lint_memo):
+    commit_messages = ["feat: add", "invalid", "feat: add", "invalid"]
+
+    results = lint_commit_messages(commit_messages)
+
+    assert results == [
+        LintResult(0, "feat: add", True, []),
+        LintResult(1, "invalid", False, [INCORRECT_FORMAT_ERROR]),
+        LintResult(2, "feat: add", True, []),
+        LintResult(3, "invalid", False, [INCORRECT_FORMAT_ERROR]),
+    ]
+    assert get_lint_memo_info()[:2] == (2, 2)
+
+
+def test__get_lint_memo_info__disabled():
+    lint_commit_message("feat: add")
+
+    assert get_lint_memo_info() == LintMemoInfo(0, 0, 0, 0)
@@ -0,0 +1,105 @@
+# type: ignore
+# pylint: disable=all
+
+import pytest
+
+from commitlint.linter.parser import ParsedCommit
+
+
+@pytest.mark.parametrize(
+    "commit_message, expected_header",
+    [
+        ("feat: add new feature", "feat: add new feature"),
+        ("feat: add new feature\n\nbody", "feat: add new feature"),
+        ("feat: add new feature\r\n\r\nbody", "feat: add new feature\r"),
+        ("", ""),
+        ("\nbody", ""),
+    ],
+)
+def test__parsed_commit__header(commit_message, expected_header):
+    commit = ParsedCommit(commit_message)
+    assert commit.header == expected_header
+    assert commit.header_end == len(expected_header)
+
+
+def test__parsed_commit__body_and_footers_are_lazy():
+    commit = ParsedCommit("feat: add new feature\n\nbody")
+    assert commit._body is None
+    assert commit._footers is None
+
+    assert commit.body == "body"
+    assert commit.footers == []
+
+
+def test__parsed_commit__no_body():
+    commit = ParsedCommit("feat: add new feature")
+    assert commit.body == ""
+    assert commit.footers == []
+
+
+def test__parsed_commit__body_with_paragraphs():
+    commit = ParsedCommit("feat: add new feature\n\nfirst paragraph\n\nsecond one\n")
+    assert commit.body == "first paragraph\n\nsecond one"
+    assert commit.footers == []
+
+
+def test__parsed_commit__footers():
+    commit = ParsedCommit(
+        "feat: add new feature\n\n"
+        "this is body\n\n"
+        "Refs: #123\n"
+        "BREAKING CHANGE: the config file\n"
+        "  is renamed\n"
+        "Closes #456"
+    )
+    assert commit.body == "this is body"
+    assert commit.footers == [
+        ("Refs", "#123"),
+        ("BREAKING CHANGE", "the config file\n  is renamed"),
+        ("Closes", "456"),
+    ]
+
+
+def test__parsed_commit__footers_without_body():
+    commit = ParsedCommit("fix: fix bug\n\nReviewed-by: Z")
+    assert commit.body == ""
+    assert commit.footers == [("Reviewed-by", "Z")]
+
+
+def test__parsed_commit__conventional_parts():
+    commit = ParsedCommit("feat(parser)!: add new feature\n\nbody")
+
+    assert commit.commit_type == "feat"
+    assert commit.scope == "parser"
+    assert commit.breaking is True
+    assert commit.description == "add new feature"
+    assert commit.has_body is True
+
+    assert commit.span("type") == (0, 4)
+    assert commit.span("scope") == (5, 11)
+    assert commit.span("breaking") == (12, 13)
+    assert commit.span("description") == (15, 30)
+
+
+def test__parsed_commit__missing_parts():
+    commit = ParsedCommit(": add new feature")
+
+    assert commit.commit_type is None
+    assert commit.scope is None
+    assert commit.breaking is False
+    assert commit.description == "add new feature"
+    assert commit.has_body is False
+    assert commit.span("type") == (-1, -1)
+    assert commit.span("scope") == (-1, -1)
+
+
+def test__parsed_commit__breaking_change_footer():
+    commit = ParsedCommit("feat: add new feature\n\nBREAKING CHANGE: config renamed")
+
+    assert commit.breaking is True
+
+
+def test__parsed_commit__match_is_shared():
+    commit = ParsedCommit("feat: add new feature")
+
+    assert commit.match is commit.match
@@ -1,8 +1,12 @@
 # type: ignore
 # pylint: disable=all
 
+import random
+import re
+
 import pytest
 
+from commitlint.constants import IGNORE_COMMIT_PATTERNS
 from commitlint.linter.utils import is_ignored
 
 
@@ -35,3 +39,96 @@ from commitlint.linter.utils import is_ignored
 def test__is_ignored(commit_message, expected_result):
     result = is_ignored(commit_message)
     assert result == expected_result
+
+
+# fragments for generating commit messages, for the differential test against
+# the combined IGNORE_COMMIT_PATTERNS regex
+IGNORE_FRAGMENTS = (
+    "Merge",
+    "Merged",
+    "merge",
+    "Revert",
+    "revert",
+    "Automatic",
+    "Auto-merged",
+    "Bump",
+    "bump",
+    "pull request",
+    "branch",
+    "tag",
+    "remote-tracking",
+    "PR",
+    "#12:",
+    ": ",
+    "into",
+    "in",
+    "from",
+    "to",
+    "1.2.3",
+    "feat:",
+    " ",
+    "  ",
+    "\t",
+    "\n",
+    "\r\n",
+    "\n\n",
+    "x",
+)
+
+
+def _differential_commit_messages():
+    rng = random.Random(20240601)
+    commit_messages = []
+    for _ in range(5000):
+        fragments = rng.choices(IGNORE_FRAGMENTS, k=rng.randint(1, 10))
+        separators = rng.choices(("", " ", "\n"), k=len(fragments))
+        commit_messages.append(
+            "".join(f + sep for f, sep in zip(fragments, separators)).rstrip(" ")
+        )
+    return commit_messages
+
+
+@pytest.mark.parametrize(
+    "commit_message",
+    [
+        "",
+        "Merge",
+        "Merge ",
+        "Merge\tpull request",
+        "Merge pull request",
+        "Merge pull request #1\n\nbody",
+        "Merge a into b\n",
+        "Merge a into b\r\n\r\n",
+        "Merge a into b\nbody",
+        "Merge tag v1\nbody",
+        "Merge remote-tracking branch\n\n  origin/main",
+        "Merge remote-tracking branch origin/main\nbody",
+        "Merged a in b\n",
+        "Merged a in b\nbody",
+        "Merged PR 1: x",
+        "Revert\nx",
+        "Automatic merge\n",
+        "Auto-merged a into b\nbody",
+        "Bump a from b to c\n\nbody",
+        "bump a from b\nto c",
+        "Bumpy a from b to c",
+        "BUMP a from b to c",
+    ],
+)
+def test__is_ignored__edge_cases_match_combined_pattern(commit_message):
+    expected = bool(re.match(IGNORE_COMMIT_PATTERNS, commit_message))
+    assert is_ignored(commit_message) == expected
+
+
+def test__is_ignored__matches_combined_pattern():
+    ignore_commit_re = re.compile(IGNORE_COMMIT_PATTERNS)
+    commit_messages = _differential_commit_messages()
+
+    ignored_count = 0
+    for commit_message in commit_messages:
+        expected = bool(ignore_commit_re.match(commit_message))
+        assert is_ignored(commit_message) == expected, repr(commit_message)
+        ignored_count += expected
+
+    # the generated commit messages must cover both cases
+    assert 0 < ignored_count < len(commit_messages)